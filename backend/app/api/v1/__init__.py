@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import plants, auth, users
+from app.api.v1.endpoints import plants, auth, users, metrics
 
 api_router = APIRouter()
 
@@ -12,3 +12,6 @@ api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 
 # 유저 관련 API
 api_router.include_router(users.router, prefix="/users", tags=["users"])
+
+# 운영 지표 API
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
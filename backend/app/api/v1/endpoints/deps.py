@@ -4,7 +4,14 @@ from fastapi.security import OAuth2PasswordBearer
 from firebase_admin import auth
 
 from app.db.session import mongodb
-from app.repositories import PlantRepository, UserRepository
+from app.repositories import (
+    PlantRepository,
+    UserRepository,
+    ImageCacheRepository,
+    RecommendationCacheRepository,
+    ImageSearchJobRepository,
+    PlantSynonymRepository,
+)
 from app.services.plant_service import PlantService
 
 from app.services.user_service import UserService
@@ -24,7 +31,14 @@ def get_plant_service() -> PlantService:
     """PlantService 인스턴스 반환"""
     plant_repo = PlantRepository(mongodb.db)
     user_repo = UserRepository(mongodb.db)
-    return PlantService(plant_repo, user_repo)
+    return PlantService(
+        plant_repo,
+        user_repo,
+        image_cache_repo=ImageCacheRepository(mongodb.db),
+        recommendation_cache_repo=RecommendationCacheRepository(mongodb.db),
+        search_job_repo=ImageSearchJobRepository(mongodb.db),
+        synonym_repo=PlantSynonymRepository(mongodb.db),
+    )
 
 def get_user_service() -> UserService:
     """UserService 인스턴스 반환"""
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.core.config import settings
+from app.db.index_manager import index_manager
+from app.db.session import mongodb
+from app.services.gemini_service import gemini_service
+from app.services.identification_cache import image_identification_cache
+from app.services.image_search_jobs import image_search_workers
+from app.services.intent_classifier import intent_classifier
+from app.services.plant_name_index import plant_name_index
+from app.services.plant_search_index import plant_search_index
+from app.services.plant_service import plant_stage_metrics
+from app.services.recommendation_cache import recommendation_cache
+from app.services.recommendation_catalog import recommendation_catalog
+from app.services.semantic_cache import semantic_recommendation_cache
+
+router = APIRouter()
+
+
+def require_metrics_enabled() -> None:
+    """METRICS_ENABLED가 꺼져 있으면 운영 지표 API를 없는 경로처럼 404로 응답 (기본: 꺼짐)"""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+# ==========================================
+# 운영 지표 조회 API (워커 프로세스 단위 통계)
+# ==========================================
+@router.get("", dependencies=[Depends(require_metrics_enabled)])
+async def get_metrics():
+    """
+    캐시 적중률, Gemini 호출 지연/토큰, 처리 단계별 지연 등 내부 운영 지표 반환.
+    - METRICS_ENABLED일 때만 노출 (꺼져 있으면 404)
+    - 값은 현재 워커 프로세스 기준이며 재시작 시 초기화됨
+    """
+    return {
+        "imageCache": image_identification_cache.stats(),
+        "imageSearchJobs": image_search_workers.stats(),
+        "recommendationCache": recommendation_cache.stats(),
+        "semanticCache": semantic_recommendation_cache.stats(),
+        "recommendationCatalog": recommendation_catalog.stats(),
+        "recommendIntent": intent_classifier.stats(),
+        "plantNameIndex": plant_name_index.stats(),
+        "plantSearchIndex": plant_search_index.stats(),
+        "geminiSingleFlight": gemini_service.single_flight_stats(),
+        "geminiBatch": gemini_service.batch_stats(),
+        "geminiResilience": gemini_service.resilience_stats(),
+        "geminiCalls": gemini_service.call_stats(),
+        "plantStages": plant_stage_metrics.stats(),
+    }
+
+
+# ==========================================
+# 인덱스 점검 API (Repository 선언 ↔ 실제 인덱스)
+# ==========================================
+@router.get("/indexes", dependencies=[Depends(require_metrics_enabled)])
+async def get_index_report():
+    """
+    컬렉션별 인덱스 점검 결과.
+    - METRICS_ENABLED일 때만 노출 (컬렉션 / 인덱스 구성이 드러나므로 꺼져 있으면 404)
+    - missing / mismatched / undeclared: 선언과 실제 인덱스의 차이
+    - uncoveredFields: 인덱스로 커버되지 않는 조회 필드
+    """
+    return await index_manager.report(mongodb.db)
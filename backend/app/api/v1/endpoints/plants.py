@@ -1,10 +1,16 @@
+import asyncio
+import json
+from contextlib import ExitStack
 from typing import Optional, List
-from fastapi import APIRouter, Query, HTTPException, UploadFile, File, Depends, status
+from fastapi import APIRouter, Query, HTTPException, UploadFile, File, Depends, Request, status
+from fastapi.responses import StreamingResponse
 
+from app.core.config import settings
 from app.db.session import mongodb
 from app.repositories import PlantRepository, UserRepository
+from app.services.image_batch import file_images, spool, zip_images
 from app.services.plant_service import PlantService
-from app.schemas import PlantCardDto, PlantDetailDto, PlantExploreDto, PlantSearchResultDto
+from app.schemas import ImageBatchItemDto, ImageSearchJobDto, PlantCardDto, PlantDetailDto, PlantExploreDto, PlantSearchResultDto
 
 
 # [핵심] deps.py에서 만든 3가지를 가져옵니다.
@@ -146,29 +152,87 @@ async def recommend_plants(situation: str = Query(..., description="사용자 
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _sse_event(event: str, data: dict) -> str:
+    """Server-Sent Events 프레임 문자열 생성 (한글 그대로 직렬화)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _validate_image_uploads(uploads: List[UploadFile]) -> None:
+    """업로드 파일이 이미지인지, 1장당 최대 크기(IMAGE_BATCH_MAX_IMAGE_BYTES)를 넘지 않는지 읽기 전에 확인"""
+    if any(not u.content_type or not u.content_type.startswith("image/") for u in uploads):
+        raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다")
+    if any(u.size and u.size > settings.IMAGE_BATCH_MAX_IMAGE_BYTES for u in uploads):
+        raise HTTPException(
+            status_code=400, detail=f"이미지 1장은 최대 {settings.IMAGE_BATCH_MAX_IMAGE_BYTES:,} bytes까지 가능합니다"
+        )
+
+
+@router.post("/recommend/stream")
+async def recommend_plants_stream(situation: str = Query(..., description="사용자 상황 설명")):
+    """
+    상황에 맞는 단일 식물 추천 (SSE 스트리밍)
+
+    - event: plant  → 식물 카드 (PlantExploreDto, recommendation은 빈 문자열)
+    - event: essay  → 에세이 조각 {"text": "..."} (여러 번)
+    - event: done   → 스트림 종료
+    """
+    service = get_plant_service()
+
+    # 식물 선정까지는 스트림 시작 전에 수행해야 404/500을 정상 응답으로 돌려줄 수 있음
+    try:
+        plant, cached_essay = await service.select_recommended_plant(situation)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    card = PlantExploreDto.model_validate({**plant, "recommendation": ""})
+
+    async def event_stream():
+        yield _sse_event("plant", card.model_dump(mode="json", by_alias=True))
+        async for chunk in service.stream_recommendation_essay(situation, plant, cached_essay):
+            yield _sse_event("essay", {"text": chunk})
+        yield _sse_event("done", {})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ==========================================
 # 4. 이미지 기반 식물 검색 (Vision Search, 체험 차원에서 열어 둠. 추후 배포 한다면 비즈니스 모델에 따라 permit state 조절)
 # ==========================================
 @router.post("/search/image", response_model=PlantSearchResultDto)
 async def search_plant_by_image(
-    file: UploadFile = File(...),
+    file: Optional[UploadFile] = File(None),
+    files: Optional[List[UploadFile]] = File(None, description="같은 식물의 여러 사진 (꽃/잎/전체)"),
     # [추가] 검색 결과에서도 찜 여부를 알기 위해 유저 ID 주입 (선택적)
     user_id: Optional[str] = Depends(get_current_user_id_optional)
 ):
     """
     이미지로 식물 검색
     
-    - 응답: PlantSearchResultDto (전체 식물 정보 + is_newly_created + is_favorite)
+    - file: 사진 1장 / files: 같은 식물의 사진 여러 장 (최대 IMAGE_SEARCH_MAX_IMAGES장, 1장당 최대 IMAGE_BATCH_MAX_IMAGE_BYTES)
+    - 여러 장이면 사진별로 동시에 식별한 뒤 학명 기준 가중 투표로 하나의 결과를 반환
+    - 응답: PlantSearchResultDto (전체 식물 정보 + is_newly_created + is_favorite + confidence)
     """
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다")
+    uploads = ([file] if file else []) + (files or [])
+    if not uploads:
+        raise HTTPException(status_code=400, detail="이미지 파일이 필요합니다")
+    if len(uploads) > settings.IMAGE_SEARCH_MAX_IMAGES:
+        raise HTTPException(
+            status_code=400, detail=f"이미지는 최대 {settings.IMAGE_SEARCH_MAX_IMAGES}장까지 업로드할 수 있습니다"
+        )
+    _validate_image_uploads(uploads)
 
-    image_data = await file.read()
+    images = [await u.read() for u in uploads]
     service = get_plant_service()
 
     try:
         # Service에 user_id 전달
-        result = await service.search_by_image(image_data, user_id)
+        result = await service.search_by_images(images, user_id)
         return result
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -176,6 +240,149 @@ async def search_plant_by_image(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ==========================================
+# 4-1. 이미지 기반 식물 검색 (비동기 작업: 접수 즉시 응답 → 폴링 또는 SSE)
+# ==========================================
+def _job_response(job: dict) -> dict:
+    return ImageSearchJobDto.from_document(job).model_dump(mode="json", by_alias=True)
+
+
+@router.post("/search/image/jobs", status_code=status.HTTP_202_ACCEPTED)
+async def submit_image_search_job(
+    request: Request,
+    file: UploadFile = File(...),
+    # [인증] 로그인 필수 (작업마다 이미지 저장 + Gemini 호출)
+    user_id: str = Depends(get_current_user_id)
+):
+    """
+    이미지 검색 작업 접수
+
+    - 로그인 필수, 이미지 최대 IMAGE_BATCH_MAX_IMAGE_BYTES
+    - 전처리한 이미지를 저장하고 바로 jobId를 반환 (식별은 서버 워커가 수행)
+    - 진행 상황: statusUrl 폴링 또는 eventsUrl SSE 구독 (received → identified → matched / failed)
+    """
+    _validate_image_uploads([file])
+
+    image_data = await file.read()
+    service = get_plant_service()
+
+    try:
+        job = await service.submit_image_search_job(image_data, user_id)
+    except asyncio.QueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="요청이 많아 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": "5"},
+        )
+
+    status_url = str(request.url_for("get_image_search_job", job_id=job["_id"]))
+    return {
+        **_job_response(job),
+        "statusUrl": status_url,
+        "eventsUrl": f"{status_url}/events",
+    }
+
+
+@router.get("/search/image/jobs/{job_id}", response_model=ImageSearchJobDto)
+async def get_image_search_job(job_id: str):
+    """이미지 검색 작업 상태 조회 (폴링용)"""
+    service = get_plant_service()
+    job = await service.get_image_search_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="검색 작업을 찾을 수 없습니다")
+    return _job_response(job)
+
+
+@router.get("/search/image/jobs/{job_id}/events")
+async def stream_image_search_job(job_id: str):
+    """
+    이미지 검색 작업 진행 상황 (SSE 스트리밍)
+
+    - event: stage  → 단계가 바뀔 때마다 작업 상태 (ImageSearchJobDto)
+    - event: done   → 스트림 종료 (종료 단계 도달 또는 대기 시간 초과)
+    """
+    service = get_plant_service()
+    if not await service.get_image_search_job(job_id):
+        raise HTTPException(status_code=404, detail="검색 작업을 찾을 수 없습니다")
+
+    async def event_stream():
+        async for job in service.watch_image_search_job(job_id):
+            yield _sse_event("stage", _job_response(job))
+        yield _sse_event("done", {})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# ==========================================
+# 4-2. 이미지 일괄 식별 (NDJSON 스트리밍: 처리가 끝난 이미지부터 한 줄씩)
+# ==========================================
+@router.post("/search/image/batch")
+async def identify_images_batch(
+    request: Request,
+    files: Optional[List[UploadFile]] = File(None, description="이미지 파일 여러 개"),
+    archive: Optional[UploadFile] = File(None, description="이미지가 든 zip 파일"),
+    # [인증] 로그인 필수 (이미지마다 Gemini 호출)
+    current_user_id: str = Depends(get_current_user_id),
+):
+    """
+    여러 이미지 일괄 식별 (큐레이터 / 제휴 정원의 보유 식물 확인용)
+
+    - 로그인 필수
+    - files(여러 개)와 archive(zip)를 함께 보낼 수 있음 (합계 최대 IMAGE_BATCH_MAX_IMAGES장,
+      업로드 합계 최대 IMAGE_BATCH_MAX_TOTAL_BYTES)
+    - 이미지마다 전처리 → 식별 → DB 매칭을 동시 처리 수(IMAGE_BATCH_CONCURRENCY) 안에서 수행
+    - 응답: application/x-ndjson, 처리가 끝난 순서대로 ImageBatchItemDto 한 줄씩 (index로 입력 순서 확인)
+    """
+    uploads = files or []
+    _validate_image_uploads(uploads)
+    total_bytes = max(
+        int(request.headers.get("content-length") or 0),
+        sum(u.size or 0 for u in [*uploads, archive] if u),
+    )
+    if total_bytes > settings.IMAGE_BATCH_MAX_TOTAL_BYTES:
+        raise HTTPException(
+            status_code=413, detail=f"업로드 합계는 최대 {settings.IMAGE_BATCH_MAX_TOTAL_BYTES:,} bytes까지 가능합니다"
+        )
+
+    # 업로드 파일은 응답 스트리밍 전에 닫히므로 임시 파일로 옮겨 두고, 이미지는 처리할 차례에 읽는다
+    spooled = ExitStack()
+    try:
+        images = file_images([
+            (u.filename or f"image-{i}", await spool(u.file, spooled)) for i, u in enumerate(uploads)
+        ])
+        if archive:
+            try:
+                images += zip_images(await spool(archive.file, spooled), settings.IMAGE_BATCH_MAX_IMAGE_BYTES)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+        if not images:
+            raise HTTPException(status_code=400, detail="식별할 이미지가 없습니다")
+        if len(images) > settings.IMAGE_BATCH_MAX_IMAGES:
+            raise HTTPException(
+                status_code=400, detail=f"이미지는 최대 {settings.IMAGE_BATCH_MAX_IMAGES}장까지 처리할 수 있습니다"
+            )
+    except BaseException:
+        spooled.close()
+        raise
+
+    service = get_plant_service()
+
+    async def ndjson_stream():
+        with spooled:
+            async for item in service.identify_image_batch(images):
+                yield ImageBatchItemDto.model_validate(item).model_dump_json(by_alias=True, exclude_none=True) + "\n"
+
+    return StreamingResponse(
+        ndjson_stream(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 # ==========================================
 # 5. 식물 상세페이지 조회 API
 # ==========================================
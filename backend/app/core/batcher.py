@@ -0,0 +1,88 @@
+"""
+마이크로 배칭 유틸리티.
+
+짧은 시간 창(window) 안에 들어온 개별 요청을 모아 한 번의 일괄 호출로 처리하고,
+결과를 각 호출자에게 순서대로 돌려준다. 호출당 고정 오버헤드(프롬프트, 왕복 지연)가 큰
+외부 API의 처리량을 높이기 위해 사용한다.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+
+class MicroBatcher:
+    """
+    시간 창 / 최대 크기 기반 마이크로 배처.
+
+    - 첫 요청이 들어오면 window_seconds 타이머 시작, 그 사이 요청을 모음
+    - max_size에 도달하면 타이머를 기다리지 않고 즉시 전송
+    - handler(items) 는 items와 같은 길이의 결과 리스트를 반환해야 함
+    - handler 예외는 해당 배치의 모든 호출자에게 전파
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        window_seconds: float,
+        max_size: int,
+    ):
+        self.handler = handler
+        self.window_seconds = window_seconds
+        self.max_size = max(1, max_size)
+
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, item: Any) -> Any:
+        """요청 1건 등록 후 배치 결과 대기."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"배치 결과 개수 불일치: {len(results)} != {len(batch)}")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        """배치 통계."""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avgBatchSize": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "pending": len(self._pending),
+        }
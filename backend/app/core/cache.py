@@ -0,0 +1,80 @@
+"""
+프로세스 내 캐시 유틸리티.
+
+LRU 축출 + TTL 만료를 함께 적용하는 단순 인메모리 캐시를 제공한다.
+외부 의존성이 없으며, 여러 서비스(이미지 식별, 추천 등)에서 1차 캐시로 사용한다.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterator, Optional, Tuple
+
+
+class TTLCache:
+    """
+    LRU + TTL 인메모리 캐시.
+
+    - 조회 시 만료된 항목은 즉시 제거하고 miss로 처리
+    - 최대 개수 초과 시 가장 오래 사용되지 않은 항목부터 제거
+    - hits / misses 카운터 제공 (stats)
+
+    asyncio 단일 스레드에서 사용하는 것을 전제로 하며 락을 쓰지 않는다.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """값 조회 (없거나 만료되면 None)."""
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """값 저장 (기존 키는 갱신 후 최신으로 이동)."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """만료되지 않은 (key, value) 순회 (LRU 순서/카운터에 영향 없음)."""
+        now = time.monotonic()
+        for key, (expires_at, value) in list(self._data.items()):
+            if expires_at > now:
+                yield key, value
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """캐시 적중 통계."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / total, 4) if total else 0.0,
+        }
@@ -5,7 +5,7 @@ Pydantic Settings를 사용하여 .env 파일에서 환경 변수를 로드한
 모든 설정값은 이 모듈의 settings 인스턴스를 통해 접근한다.
 """
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -22,7 +22,7 @@ class Settings(BaseSettings):
 
     # === External Services (Keys) ===
     GEMINI_API_KEY: str                             # Google Gemini API 키
-    
+
     # [추가] 이미지 검색 API 키 (값이 없으면 빈 문자열)
     UNSPLASH_ACCESS_KEY: str = ""
     PIXABAY_API_KEY: str = ""
@@ -38,6 +38,121 @@ class Settings(BaseSettings):
     GOOGLE_SEARCH_API_KEY: str = ""             # Google Custom Search API 키
     GOOGLE_SEARCH_ENGINE_ID: str = ""           # Custom Search Engine ID (cx)
 
+    # === Gemini 호출 제어 ===
+    GEMINI_MAX_CONCURRENCY: int = 8                 # 워커당 동시에 진행 가능한 Gemini 호출 수
+    GEMINI_TIMEOUT_SECONDS: float = 30.0            # 호출 1건당 최대 대기 시간 (대기열 시간 포함)
+    GEMINI_HTTP_MAX_CONNECTIONS: int = 20           # Gemini HTTP 커넥션 풀 최대 크기
+    GEMINI_HTTP_MAX_KEEPALIVE: int = 10             # 유지(keep-alive)할 유휴 커넥션 수
+    GEMINI_HTTP_KEEPALIVE_EXPIRY: float = 60.0      # 유휴 커넥션 유지 시간 (초)
+    GEMINI_IDENTIFY_MODE: str = "fused"             # 이미지 식별 방식: fused(1회 호출) | two_step(판정+식별 2회)
+    GEMINI_IDENTIFY_TOP_K: int = 3                  # 이미지 식별 후보 수 (DB에 없는 1위 대신 차순위 후보로 매칭)
+    GEMINI_BATCH_ENABLED: bool = False              # 상황→식물 선정 요청 마이크로 배칭 (피크 트래픽용, opt-in)
+    GEMINI_BATCH_WINDOW_MS: int = 30                # 배치 수집 시간 창 (ms)
+    GEMINI_BATCH_MAX_SIZE: int = 8                  # 배치 최대 크기 (도달 시 즉시 전송)
+
+    # === Gemini 장애 대응 (서킷 브레이커 / 헤지 요청 / 대체 모델) ===
+    GEMINI_BREAKER_WINDOW: int = 20                 # 실패율/지연 판정에 쓰는 최근 호출 수
+    GEMINI_BREAKER_MIN_CALLS: int = 10              # 판정 시작 최소 호출 수
+    GEMINI_BREAKER_FAILURE_RATE: float = 0.5        # 실패율이 이 값 이상이면 차단(open)
+    GEMINI_BREAKER_SLOW_RATE: float = 0.8           # 느린 호출 비율이 이 값 이상이면 차단(open)
+    GEMINI_BREAKER_OPEN_SECONDS: float = 30.0       # 차단 유지 시간 (이후 시험 호출 1건 허용)
+    GEMINI_HEDGE_QUANTILE: float = 0.95             # 헤지 요청 발사 기준 지연 분위수
+    GEMINI_HEDGE_MIN_DELAY_MS: int = 500            # 헤지 요청 최소 대기 시간 (ms)
+    # 호출 종류별 설정: IDENTIFY(이미지 식별) / RECOMMEND(상황→식물 선정) / ESSAY(추천 에세이) / GROUNDED(검색 그라운딩)
+    GEMINI_HEDGE_IDENTIFY: bool = True              # 헤지 요청 사용 여부
+    GEMINI_HEDGE_RECOMMEND: bool = True
+    GEMINI_HEDGE_ESSAY: bool = False                # 긴 생성은 중복 비용이 커서 기본 비활성
+    GEMINI_HEDGE_GROUNDED: bool = False
+    GEMINI_SLOW_CALL_SECONDS_IDENTIFY: float = 8.0  # 이 시간 이상 걸린 호출은 "느린 호출"로 집계
+    GEMINI_SLOW_CALL_SECONDS_RECOMMEND: float = 8.0
+    GEMINI_SLOW_CALL_SECONDS_ESSAY: float = 20.0
+    GEMINI_SLOW_CALL_SECONDS_GROUNDED: float = 25.0
+    GEMINI_FALLBACK_MODEL_IDENTIFY: str = "gemini-2.0-flash-lite"   # 주 모델 장애 시 대체 모델 (빈 값이면 미사용)
+    GEMINI_FALLBACK_MODEL_RECOMMEND: str = "gemini-2.0-flash-lite"
+    GEMINI_FALLBACK_MODEL_ESSAY: str = "gemini-2.0-flash"
+    GEMINI_FALLBACK_MODEL_GROUNDED: str = "gemini-2.0-flash"
+    GEMINI_FALLBACK_MIN_SECONDS: float = 2.0        # 제한 시간이 이만큼도 남지 않았으면 대체 모델 재시도 생략
+
+    # === Gemini 모델 라우팅 (호출 종류별 선호 모델 / 지연 예산 / 출력 길이) ===
+    GEMINI_MODEL_IDENTIFY: str = "gemini-2.5-flash-lite"    # 호출 종류별 선호 모델
+    GEMINI_MODEL_RECOMMEND: str = "gemini-2.5-flash-lite"
+    GEMINI_MODEL_ESSAY: str = "gemini-3-flash-preview"
+    GEMINI_MODEL_GROUNDED: str = "gemini-2.5-flash"
+    GEMINI_LIGHT_MODEL: str = "gemini-2.5-flash-lite"       # 선호 모델이 지연 예산을 넘길 때 먼저 쓸 경량 모델
+    GEMINI_SLO_SECONDS_IDENTIFY: float = 4.0        # 선호 모델 최근 p95 지연 예산 (0이면 라우팅 안 함)
+    GEMINI_SLO_SECONDS_RECOMMEND: float = 4.0
+    GEMINI_SLO_SECONDS_ESSAY: float = 10.0
+    GEMINI_SLO_SECONDS_GROUNDED: float = 20.0
+    GEMINI_ROUTER_PROBE_RATE: float = 0.05          # 경량 모델로 내려간 동안 선호 모델로 보내는 비율 (p95 회복 측정)
+    GEMINI_MAX_OUTPUT_TOKENS_IDENTIFY: int = 512    # 최대 출력 토큰 (사고 토큰 포함, 0이면 제한 없음)
+    GEMINI_MAX_OUTPUT_TOKENS_RECOMMEND: int = 1024  # 마이크로 배치 응답(여러 상황) 포함
+    GEMINI_MAX_OUTPUT_TOKENS_ESSAY: int = 2048      # 400자 에세이 + 사고 토큰 여유
+    GEMINI_MAX_OUTPUT_TOKENS_GROUNDED: int = 4096
+
+    # === Gemini 녹화/재생 백엔드 (오프라인 부하 테스트) ===
+    GEMINI_BACKEND: str = "live"                    # live | record(실제 호출 + 카세트 기록) | replay(카세트 재생)
+    GEMINI_CASSETTE_PATH: str = "cassettes/gemini.jsonl"  # 카세트 파일 경로 (JSONL)
+    GEMINI_REPLAY_LATENCY_SCALE: float = 1.0        # 재생 지연 배율 (0이면 지연 없이 응답)
+    GEMINI_REPLAY_STRICT: bool = False              # 요청 지문 불일치 시 실패 (False면 같은 호출 형태의 응답 재사용)
+    GEMINI_REPLAY_SEED: Optional[int] = None        # 지연 샘플링 난수 시드 (재현 가능한 벤치마크용)
+
+    # === 이미지 전처리 (Vision 호출 전 정규화) ===
+    IMAGE_MAX_EDGE: int = 1024                      # 긴 변 기준 최대 픽셀 (초과 시 축소)
+    IMAGE_OUTPUT_FORMAT: str = "JPEG"               # 재인코딩 포맷: JPEG | WEBP
+    IMAGE_OUTPUT_QUALITY: int = 85                  # 재인코딩 품질 (1~100)
+    IMAGE_PREPROCESS_WORKERS: int = 2               # PIL 작업 전용 스레드 수
+    IMAGE_SEARCH_MAX_IMAGES: int = 5                # 한 번의 검색에 올릴 수 있는 사진 수 (사진별 동시 식별 후 투표)
+
+    # === 이미지 식별 캐시 (메모리 LRU → MongoDB) ===
+    IMAGE_CACHE_ENABLED: bool = True
+    IMAGE_CACHE_MAX_ENTRIES: int = 2048             # 메모리 캐시 최대 항목 수
+    IMAGE_CACHE_TTL_SECONDS: int = 604800           # 캐시 유효 기간 (기본 7일)
+    IMAGE_CACHE_MAX_DISTANCE: int = 6               # 유사 이미지로 볼 dHash 해밍 거리 (0~7)
+
+    # === 이미지 검색 비동기 작업 (업로드 즉시 응답 → 폴링/SSE) ===
+    IMAGE_JOB_WORKERS: int = 4                      # 식별 작업 워커 수 (프로세스당)
+    IMAGE_JOB_QUEUE_SIZE: int = 100                 # 대기열 최대 길이 (초과 시 503)
+    IMAGE_JOB_TTL_SECONDS: int = 3600               # 작업 문서 보관 기간
+    IMAGE_JOB_LEASE_SECONDS: int = 300              # 선점 후 이 시간 동안 진행이 없으면 다른 워커가 다시 가져감
+    IMAGE_JOB_POLL_SECONDS: float = 1.0             # SSE 상태 재확인 주기 (다른 프로세스 작업 대비)
+    IMAGE_JOB_STREAM_TIMEOUT_SECONDS: float = 120.0 # SSE 연결 최대 유지 시간
+
+    # === 이미지 일괄 식별 (NDJSON 스트리밍) ===
+    IMAGE_BATCH_CONCURRENCY: int = 4                # 동시에 처리하는 이미지 수 (전처리 → 식별 → DB 매칭)
+    IMAGE_BATCH_MAX_IMAGES: int = 200               # 요청 1건당 최대 이미지 수 (multipart + zip 합계)
+    IMAGE_BATCH_MAX_IMAGE_BYTES: int = 20971520     # 이미지 1장 최대 크기 (20MB, zip은 해제 크기 기준, 이미지 검색 / 작업 접수에도 적용)
+    IMAGE_BATCH_MAX_TOTAL_BYTES: int = 268435456    # 요청 1건 업로드 합계 최대 크기 (256MB, zip은 압축 크기 기준)
+
+    # === 추천 결과 캐시 (상황 텍스트 → 식물 + 에세이) ===
+    RECOMMEND_CACHE_ENABLED: bool = True
+    RECOMMEND_CACHE_MAX_ENTRIES: int = 1024         # 메모리 캐시 최대 항목 수
+    RECOMMEND_CACHE_TTL_SECONDS: int = 86400        # 캐시 유효 기간 (기본 1일)
+    RECOMMEND_SEMANTIC_CACHE_ENABLED: bool = True   # 표현이 다른 유사 상황도 재사용 (문자 n-gram 벡터)
+    RECOMMEND_SEMANTIC_MAX_ENTRIES: int = 512       # 의미 캐시 최대 항목 수
+    RECOMMEND_SEMANTIC_DIM: int = 2048              # 해싱 벡터 폭
+    RECOMMEND_SEMANTIC_THRESHOLD: float = 0.5       # 재사용 후보 최소 코사인 유사도 (후보는 어절 대응 / 부정 검사를 다시 거침)
+
+    # === 추천 모드 (카탈로그 제약) ===
+    RECOMMEND_MODE: str = "open"                    # open(자유 추천 후 DB 매칭) | catalog(카탈로그 안에서 _id 선택)
+    RECOMMEND_CATALOG_LIMIT: int = 500              # 카탈로그 요약에 포함할 최대 식물 수 (인기도 순)
+    RECOMMEND_CATALOG_REFRESH_SECONDS: int = 300    # 카탈로그 변경 확인 주기 (초)
+    GEMINI_CONTEXT_CACHE_ENABLED: bool = True       # 카탈로그 요약을 Gemini 컨텍스트 캐시로 전송 (실패 시 프롬프트에 직접 포함)
+    GEMINI_CONTEXT_CACHE_TTL_SECONDS: int = 3600    # Gemini 컨텍스트 캐시 유지 시간
+
+    # === 식물 이름 인덱스 (식별/추천 결과 → 카탈로그 매칭, 프로세스 내) ===
+    PLANT_NAME_INDEX_ENABLED: bool = True           # 비활성화 시 매번 DB 후보 조회
+    PLANT_NAME_INDEX_REFRESH_SECONDS: int = 300     # 카탈로그 변경 확인 주기 (초)
+    PLANT_NAME_FUZZY_MAX_DISTANCE: int = 2          # 한글명 근사 일치 최대 자모 편집 거리 (0이면 사용 안 함)
+
+    # === 식물 키워드 검색 인덱스 (목록 API keyword, 프로세스 내 n-gram 역색인) ===
+    PLANT_SEARCH_INDEX_ENABLED: bool = True         # 비활성화 시 DB 정규식 검색 (입력은 이스케이프)
+    PLANT_SEARCH_INDEX_REFRESH_SECONDS: int = 300   # 카탈로그 변경 확인 주기 (초)
+
+    # === 추천 의도 분류 (로컬 빠른 경로) ===
+    RECOMMEND_INTENT_ENABLED: bool = False          # 켜면 확신할 때 꽃말 그룹 인기 1위를 Gemini 선정 없이 추천
+    RECOMMEND_INTENT_MIN_SCORE: float = 1.0         # 1위 그룹 최소 점수 (키워드 1개 완전 일치 = 최대 1.0)
+    RECOMMEND_INTENT_CONFIDENCE: float = 0.75       # 1위 그룹 점수 비중 하한 (0~1)
+
     # === Firebase ===
     FIREBASE_CREDENTIALS_PATH: str = "app/core/firebase-key.json"  # Firebase 서비스 계정 키 파일 경로
     FIREBASE_STORAGE_BUCKET: str = "floripedia-c0bf0.firebasestorage.app"    # Firebase Storage 버킷
@@ -45,6 +160,7 @@ class Settings(BaseSettings):
     # === Application ===
     PROJECT_NAME: str = "Floripedia API"
     API_V1_STR: str = "/api/v1"
+    METRICS_ENABLED: bool = False                   # 운영 지표 API(/metrics, /metrics/indexes) 노출 여부 (꺼져 있으면 404)
 
     # === Security ===
     BACKEND_CORS_ORIGINS: List[str] = [
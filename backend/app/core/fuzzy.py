@@ -0,0 +1,104 @@
+"""
+편집 거리 기반 근사 문자열 검색.
+
+- levenshtein: 비트 병렬(Myers / Hyyrö) 편집 거리
+- DeletionIndex: 삭제 이웃(deletion neighbourhood) 색인
+
+거리 k 이내인 두 문자열은 각자 최대 k글자를 지워 같은 문자열을 만들 수 있다.
+키마다 k글자 이하를 지운 변형을 미리 사전에 넣어 두면, 질의어의 변형들로 사전을 조회한 뒤
+나온 후보만 실제 거리를 계산하면 된다 (조회 비용이 카탈로그 크기와 무관).
+"""
+from typing import Dict, Generic, List, Set, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+def _pattern_masks(pattern: str) -> Dict[str, int]:
+    """문자 → pattern 안에서 그 문자가 나오는 위치 비트마스크."""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _distance(masks: Dict[str, int], length: int, text: str) -> int:
+    """
+    편집 거리 (Myers / Hyyrö 비트 병렬 알고리즘).
+
+    DP 표의 한 열을 정수 비트로 표현해 text 글자당 상수 번의 정수 연산으로 갱신한다.
+    """
+    if not length:
+        return len(text)
+    mask = (1 << length) - 1
+    last = 1 << (length - 1)
+    vp, vn, score = mask, 0, length
+    for char in text:
+        x = masks.get(char, 0) | vn
+        d0 = (((x & vp) + vp) ^ vp) | x
+        hn = vp & d0
+        hp = vn | (~(d0 | vp) & mask)
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        x = ((hp << 1) | 1) & mask
+        vn = x & d0
+        vp = ((hn << 1) & mask) | (~(x | d0) & mask)
+    return score
+
+
+def levenshtein(a: str, b: str) -> int:
+    """편집 거리 (삽입 / 삭제 / 치환 각 1)."""
+    return _distance(_pattern_masks(a), len(a), b)
+
+
+def deletions(text: str, max_deletes: int) -> Set[str]:
+    """text에서 0 ~ max_deletes글자를 지운 모든 문자열."""
+    variants = {text}
+    frontier = {text}
+    for _ in range(max_deletes):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        variants |= frontier
+    return variants
+
+
+class DeletionIndex(Generic[V]):
+    """
+    키(문자열) → 값 근사 검색 색인.
+
+    - 같은 키를 다시 넣으면 처음 값을 유지 (먼저 넣은 쪽이 우선)
+    - 한 번 만든 뒤 읽기 전용으로 공유하는 용도 (삭제 미지원)
+    """
+
+    def __init__(self, max_distance: int):
+        self.max_distance = max(0, max_distance)
+        self._keys: Dict[str, Tuple[int, V]] = {}
+        self._variants: Dict[str, List[str]] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str, value: V) -> None:
+        if key in self._keys:
+            return
+        self._keys[key] = (len(self._keys), value)
+        for variant in deletions(key, self.max_distance):
+            self._variants.setdefault(variant, []).append(key)
+
+    def search(self, query: str, max_distance: int) -> List[Tuple[int, str, V]]:
+        """max_distance 이내 키 전체 → (거리, 키, 값), 거리 순 (같은 거리는 추가 순서)."""
+        max_distance = min(max_distance, self.max_distance)
+        candidates = set()
+        for variant in deletions(query, max_distance):
+            candidates.update(self._variants.get(variant, ()))
+
+        masks, length = _pattern_masks(query), len(query)
+        found = []
+        for key in candidates:
+            distance = _distance(masks, length, key)
+            if distance <= max_distance:
+                seq, value = self._keys[key]
+                found.append((distance, seq, key, value))
+        found.sort(key=lambda item: item[:2])
+        return [(distance, key, value) for distance, _, key, value in found]
@@ -0,0 +1,129 @@
+"""
+운영 지표 수집 유틸리티 (프로세스 내 집계, /metrics JSON으로 노출).
+
+- LatencyHistogram: 고정 버킷 지연 히스토그램 (버킷 누적 개수 + 버킷 내 보간 분위수)
+- CallStats: 호출 1종류의 지연 / 결과별 횟수 / 토큰 사용량
+- CallMetrics: 이름(메서드, 모델, 처리 단계 등)별 CallStats 모음
+
+asyncio 단일 스레드에서 사용하는 것을 전제로 하며 락을 쓰지 않는다.
+"""
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Mapping, Optional
+
+# 초 단위 버킷 상한 (마지막 버킷 이후는 +Inf)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0)
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 히스토그램 (표본을 보관하지 않아 메모리 사용량이 일정)."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self._counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """분위수 추정 (해당 버킷 안에서 선형 보간, 마지막 버킷의 상한은 관측 최댓값)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self._counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * max(0.0, rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.max
+
+    def stats(self) -> dict:
+        cumulative, buckets = 0, {}
+        for bound, bucket_count in zip((*self.buckets, "+Inf"), self._counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        quantiles = {f"p{int(q * 100)}": self.quantile(q) for q in (0.5, 0.95, 0.99)}
+        return {
+            "count": self.count,
+            "meanSeconds": round(self.total / self.count, 4) if self.count else None,
+            **{k: round(v, 4) if v is not None else None for k, v in quantiles.items()},
+            "maxSeconds": round(self.max, 4),
+            "buckets": buckets,
+        }
+
+
+class CallStats:
+    """호출 1종류의 지연 + 결과별 횟수 + 토큰 사용량."""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.first_chunk: Optional[LatencyHistogram] = None     # 스트리밍 호출만 사용
+        self.outcomes: Counter = Counter()
+        self.tokens: Counter = Counter()
+
+    def record(self, outcome: str, elapsed: Optional[float] = None, usage: Optional[Mapping[str, int]] = None) -> None:
+        """결과 1건 기록 (elapsed가 None이면 지연은 집계하지 않음, 예: 취소된 호출)."""
+        self.outcomes[outcome] += 1
+        if elapsed is not None:
+            self.latency.observe(elapsed)
+        if usage:
+            self.tokens.update(usage)
+
+    def observe_first_chunk(self, elapsed: float) -> None:
+        if self.first_chunk is None:
+            self.first_chunk = LatencyHistogram()
+        self.first_chunk.observe(elapsed)
+
+    def stats(self) -> dict:
+        calls = sum(self.outcomes.values())
+        result = {
+            "calls": calls,
+            "outcomes": dict(self.outcomes),
+            "latency": self.latency.stats(),
+            "tokens": dict(self.tokens),
+        }
+        if self.first_chunk is not None:
+            result["firstChunk"] = self.first_chunk.stats()
+        return result
+
+
+class CallMetrics:
+    """이름별 CallStats 모음 (처음 기록할 때 생성)."""
+
+    def __init__(self):
+        self._calls: Dict[str, CallStats] = {}
+
+    def get(self, name: str) -> CallStats:
+        if name not in self._calls:
+            self._calls[name] = CallStats()
+        return self._calls[name]
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """블록 실행 시간 기록 (정상 종료는 ok, 예외는 예외 클래스 이름을 결과로 기록)."""
+        start = time.monotonic()
+        outcome = "ok"
+        try:
+            yield
+        except BaseException as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            self.get(name).record(outcome, time.monotonic() - start)
+
+    def clear(self) -> None:
+        self._calls.clear()
+
+    def stats(self) -> dict:
+        return {name: calls.stats() for name, calls in sorted(self._calls.items())}
@@ -0,0 +1,165 @@
+"""
+외부 API 장애 대응 유틸리티.
+
+- CircuitBreaker: 최근 호출의 실패율/지연 비율이 임계값을 넘으면 일정 시간 호출을 차단 (빠른 실패)
+- hedged: 첫 시도가 지연(p95 기준)되면 두 번째 시도를 띄워 먼저 성공한 결과 사용 (꼬리 지연 완화)
+
+Gemini 장애(brownout) 시 모든 요청이 제한 시간까지 매달렸다가 실패하는 것을 막기 위해 사용한다.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출을 시도하지 않음."""
+
+
+class CircuitBreaker:
+    """
+    슬라이딩 윈도우 기반 서킷 브레이커.
+
+    - closed: 정상. 최근 window건 중 실패율 또는 느린 호출 비율이 임계값 이상이면 open
+    - open: open_seconds 동안 호출 차단 (allow() == False)
+    - half_open: 시험 호출 1건만 허용. 성공 시 closed, 실패 시 다시 open
+
+    성공 호출의 지연 시간도 함께 기록해 p95 등 분위수를 제공한다 (헤지 지연 계산용).
+    asyncio 단일 스레드에서 사용하는 것을 전제로 하며 락을 쓰지 않는다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        min_calls: int = 10,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 10.0,
+        slow_rate: float = 0.8,
+        open_seconds: float = 30.0,
+    ):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_rate = slow_rate
+        self.open_seconds = open_seconds
+
+        self._outcomes: deque = deque(maxlen=window)    # (성공 여부, 느린 호출 여부)
+        self._latencies: deque = deque(maxlen=window)   # 성공 호출 지연 (초)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half_open에서는 시험 호출 1건만 허용)."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self, elapsed: float) -> None:
+        self._latencies.append(elapsed)
+        if self._state == self.HALF_OPEN:
+            self._close()
+            return
+        self._record(True, elapsed >= self.slow_call_seconds)
+
+    def record_failure(self) -> None:
+        if self._state == self.HALF_OPEN:
+            self._trip()
+            return
+        self._record(False, False)
+
+    def record_cancelled(self) -> None:
+        """결과 없이 취소된 호출 (헤지 패자 등): 통계에 넣지 않고 시험 호출 슬롯만 반환."""
+        if self._state == self.HALF_OPEN:
+            self._probe_in_flight = False
+
+    def _record(self, success: bool, slow: bool) -> None:
+        self._outcomes.append((success, slow))
+        if self._state != self.CLOSED or len(self._outcomes) < self.min_calls:
+            return
+
+        total = len(self._outcomes)
+        failures = sum(1 for ok, _ in self._outcomes if not ok)
+        slow_calls = sum(1 for _, is_slow in self._outcomes if is_slow)
+        if failures / total >= self.failure_rate or slow_calls / total >= self.slow_rate:
+            self._trip()
+
+    def _trip(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self._outcomes.clear()
+        self.trips += 1
+
+    def _close(self) -> None:
+        self._state = self.CLOSED
+        self._probe_in_flight = False
+        self._outcomes.clear()
+
+    def latency_quantile(self, q: float) -> Optional[float]:
+        """성공 호출 지연의 분위수 (표본이 min_calls 미만이면 None)."""
+        if len(self._latencies) < self.min_calls:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def stats(self) -> dict:
+        p95 = self.latency_quantile(0.95)
+        return {
+            "state": self.state,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "p95Seconds": round(p95, 3) if p95 is not None else None,
+        }
+
+
+async def hedged(call: Callable[[], Awaitable[Any]], delay: Optional[float]) -> Any:
+    """
+    헤지 요청: call()을 시작하고 delay초 안에 끝나지 않으면 call()을 한 번 더 시작한다.
+
+    먼저 성공한 결과를 반환하고 나머지 시도는 취소한다. 두 시도 모두 실패하면 마지막 예외를 전파.
+    delay가 None이면 헤지 없이 단일 호출.
+    """
+    if delay is None:
+        return await call()
+
+    tasks = [asyncio.ensure_future(call())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            tasks.append(asyncio.ensure_future(call()))
+
+        pending = set(tasks)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,46 @@
+"""
+요청 병합(single-flight) 유틸리티.
+
+같은 키로 동시에 들어온 비동기 호출은 첫 호출(leader)의 결과를 함께 기다린다.
+외부 API(Gemini 등) 중복 호출을 줄이기 위해 사용한다.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    키 단위 in-flight 호출 병합기.
+
+    - leader 호출은 Task로 실행되며, leader 요청이 취소되어도 follower를 위해 끝까지 진행
+    - 호출이 끝나면 키를 즉시 해제하므로 결과를 캐싱하지 않음 (캐시는 별도 계층 책임)
+    - 결과 객체는 모든 호출자가 공유하므로, 변경 가능한 값은 호출측에서 복사해서 사용
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _, k=key: self._in_flight.pop(k, None))
+
+        # shield: 한 호출자가 취소되어도 공유 Task는 취소하지 않음
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        """병합 통계."""
+        total = self.leaders + self.coalesced
+        return {
+            "inFlight": len(self._in_flight),
+            "upstreamCalls": self.leaders,
+            "coalesced": self.coalesced,
+            "coalescedRate": round(self.coalesced / total, 4) if total else 0.0,
+        }
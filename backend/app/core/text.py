@@ -0,0 +1,106 @@
+"""
+텍스트 정규화 유틸리티.
+
+캐시 키, 요청 병합(single-flight) 키 등 "같은 입력"을 판정해야 하는 곳에서 공통으로 사용한다.
+"""
+import re
+import unicodedata
+
+_WHITESPACE = re.compile(r"\s+")
+_EDGE_PUNCTUATION = re.compile(r"^[\s.,!?~…·\-]+|[\s.,!?~…·\-]+$")
+
+
+def normalize_situation(text: str) -> str:
+    """
+    상황 텍스트 정규화.
+
+    "친구와  화해하고 싶어요!!" / "친구와 화해하고 싶어요." → "친구와 화해하고 싶어요"
+    """
+    normalized = unicodedata.normalize("NFKC", text or "").lower()
+    normalized = _WHITESPACE.sub(" ", normalized)
+    return _EDGE_PUNCTUATION.sub("", normalized)
+
+
+_NON_WORD = re.compile(r"[\W_]+")
+_PARENTHESES = re.compile(r"\([^)]*\)")
+_EPITHET = re.compile(r"[^\W\d_][^\W\d_\-]*", re.UNICODE)
+
+# 종 이하 계급 표기 통일 (그 외 토큰은 저자명으로 보고 버린다)
+_INFRASPECIFIC_RANKS = {
+    "var.": "var.", "var": "var.",
+    "subsp.": "subsp.", "subsp": "subsp.", "ssp.": "subsp.", "ssp": "subsp.",
+    "f.": "f.", "forma": "f.",
+}
+
+
+def normalize_name(text: str) -> str:
+    """
+    이름 비교용 키 (한글명 / 영문명 / 검색 키워드).
+
+    "Forget-me-not" / "forget me not" → "forgetmenot", "장 미" → "장미"
+    """
+    return _NON_WORD.sub("", unicodedata.normalize("NFKC", text or "").lower())
+
+
+def normalize_scientific_name(text: str) -> str:
+    """
+    학명 비교용 키: 속 + 종소명 (+ 종 이하 계급), 소문자, 저자명 제거.
+
+    "Rosa canina L." → "rosa canina"
+    "Lavandula angustifolia Mill. subsp. angustifolia" → "lavandula angustifolia subsp. angustifolia"
+    "Rosa ×damascena" → "rosa x damascena", "Rosa" → "rosa"
+    """
+    text = _PARENTHESES.sub(" ", unicodedata.normalize("NFKC", text or "")).replace("×", " x ")
+    words = text.split()
+    if not words:
+        return ""
+
+    key = [words[0].lower()]
+    i = 1
+    if i < len(words) and words[i].lower() == "x":     # 잡종 표기
+        key.append("x")
+        i += 1
+    if i >= len(words) or not _EPITHET.fullmatch(words[i]):
+        return " ".join(key)
+    key.append(words[i].lower())
+    i += 1
+
+    while i < len(words):
+        rank = _INFRASPECIFIC_RANKS.get(words[i].lower())
+        if rank and i + 1 < len(words) and _EPITHET.fullmatch(words[i + 1]):
+            key += [rank, words[i + 1].lower()]
+            i += 2
+        else:
+            i += 1
+    return " ".join(key)
+
+
+def species_key(scientific_key: str) -> str:
+    """정규화된 학명 → 종 수준 키 (종 이하 계급 제거)."""
+    words = scientific_key.split()
+    size = 3 if len(words) > 1 and words[1] == "x" else 2
+    return " ".join(words[:size])
+
+
+# 한글 음절 → 자모 (초성 19 × 중성 21 × 종성 28)
+_HANGUL_BASE, _HANGUL_LAST = 0xAC00, 0xD7A3
+
+
+def decompose_hangul(text: str) -> str:
+    """
+    한글 음절을 초성/중성/종성 자모로 분해 (그 외 문자는 그대로).
+
+    편집 거리를 자모 단위로 재기 위해 사용한다: "장미" ↔ "장마"는 음절 1개가 아니라 자모 1개 차이.
+    """
+    jamo = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            index = code - _HANGUL_BASE
+            jamo.append(chr(0x1100 + index // 588))
+            jamo.append(chr(0x1161 + index % 588 // 28))
+            if index % 28:
+                jamo.append(chr(0x11A7 + index % 28))
+        else:
+            jamo.append(char)
+    return "".join(jamo)
@@ -0,0 +1,90 @@
+"""
+백그라운드 작업 풀 유틸리티.
+
+크기가 제한된 asyncio 큐 + 고정 개수의 워커 태스크로 작업을 처리한다.
+요청 처리와 분리해 오래 걸리는 작업(이미지 식별 등)을 실행하고, 큐가 가득 차면 즉시 거절한다.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+
+class WorkerPool:
+    """
+    bounded 큐 기반 asyncio 워커 풀.
+
+    - submit()은 대기하지 않으며, 큐가 가득 차면 asyncio.QueueFull을 그대로 전파
+    - 워커는 첫 submit 또는 start() 시점의 이벤트 루프에서 생성 (lifespan에서 start 권장)
+    - 작업 예외는 로그만 남기고 워커는 계속 동작 (작업 상태 기록은 작업 함수 책임)
+    """
+
+    def __init__(self, name: str, workers: int, queue_size: int):
+        self.name = name
+        self.workers = max(1, workers)
+        self.queue_size = queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def start(self) -> None:
+        """워커 태스크 생성 (이미 현재 루프에서 실행 중이면 무시)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"{self.name}-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """워커 종료 (남은 작업은 버림)."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._loop = None
+
+    def submit(self, job: Job) -> None:
+        """작업 등록 (대기 없음)."""
+        self.start()
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise
+        self.submitted += 1
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await job()
+                self.completed += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"[WorkerPool:{self.name}] 작업 실패: {e}")
+            finally:
+                self._queue.task_done()
+
+    def stats(self) -> dict:
+        return {
+            "workers": len(self._tasks),
+            "queued": self._queue.qsize() if self._queue else 0,
+            "queueSize": self.queue_size,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
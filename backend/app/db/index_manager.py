@@ -0,0 +1,132 @@
+"""
+MongoDB 인덱스 관리 (Repository 선언 ↔ 실제 인덱스 대조).
+
+- reconcile: 선언했지만 없는 인덱스를 만든다 (서버 시작 시 백그라운드 작업)
+- report: 누락 / 정의 불일치 / 선언되지 않은 인덱스와, 인덱스로 커버되지 않는 조회 필드
+
+정의가 다른 인덱스는 삭제 후 재생성이 필요하므로 자동으로 고치지 않고 보고만 한다.
+"""
+import asyncio
+import logging
+from typing import Dict, List, Optional, Sequence
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.db.indexes import IndexSpec
+from app.repositories import INDEXED_REPOSITORIES
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] %(levelname)s [%(name)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    logger.addHandler(handler)
+
+
+class IndexManager:
+    """Repository 클래스들의 INDEXES / QUERIED_FIELDS 선언을 기준으로 인덱스를 맞추고 점검."""
+
+    def __init__(self, repositories: Sequence[type]):
+        self.repositories = list(repositories)
+        self.last_reconcile: Optional[dict] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def reconcile(self, db: AsyncIOMotorDatabase) -> dict:
+        """
+        누락된 인덱스 생성.
+
+        Returns:
+            {"created": [컬렉션.인덱스], "failed": {컬렉션.인덱스: 오류}}
+            (기존 데이터가 고유 조건을 어기는 경우 등은 failed에 남기고 나머지는 계속 진행)
+        """
+        created: List[str] = []
+        failed: Dict[str, str] = {}
+        for repo in self.repositories:
+            collection = db[repo.COLLECTION]
+            existing = await collection.index_information()
+            for spec in repo.INDEXES:
+                if spec.name in existing:
+                    continue
+                label = f"{repo.COLLECTION}.{spec.name}"
+                try:
+                    await collection.create_indexes([spec.model()])
+                    created.append(label)
+                except Exception as e:
+                    failed[label] = str(e)
+                    logger.error(f"[IndexManager] 인덱스 생성 실패 ({label}): {e}")
+
+        self.last_reconcile = {"created": created, "failed": failed}
+        if created:
+            logger.info(f"[IndexManager] 인덱스 생성: {', '.join(created)}")
+        return self.last_reconcile
+
+    async def report(self, db: AsyncIOMotorDatabase) -> dict:
+        """
+        컬렉션별 인덱스 점검 결과.
+
+        - missing: 선언했지만 없는 인덱스
+        - mismatched: 이름은 같지만 키 / 옵션이 다른 인덱스 (선언값, 실제값)
+        - undeclared: 선언에 없는 인덱스 (_id 제외)
+        - uncoveredFields: 어떤 인덱스의 첫 번째 키도 아닌 조회 필드 (해당 조건만으로는 전체 스캔)
+        """
+        collections = {}
+        for repo in self.repositories:
+            existing = await db[repo.COLLECTION].index_information()
+            declared = {spec.name: spec for spec in repo.INDEXES}
+            actual = {name: IndexSpec.describe_existing(info) for name, info in existing.items()}
+
+            mismatched = [
+                {"name": name, "declared": spec.describe(), "actual": actual[name]}
+                for name, spec in declared.items()
+                if name in actual and spec.describe() != actual[name]
+            ]
+            leading_fields = {"_id"} | {info["key"][0][0] for info in actual.values() if info["key"]}
+            collections[repo.COLLECTION] = {
+                "missing": [name for name in declared if name not in actual],
+                "mismatched": mismatched,
+                "undeclared": [name for name in actual if name != "_id_" and name not in declared],
+                "uncoveredFields": [f for f in repo.QUERIED_FIELDS if f not in leading_fields],
+            }
+
+        return {
+            "ok": not any(c["missing"] or c["mismatched"] for c in collections.values()),
+            "collections": collections,
+            "lastReconcile": self.last_reconcile,
+        }
+
+    def start(self, db: AsyncIOMotorDatabase) -> None:
+        """인덱스 생성을 백그라운드로 시작 (서버는 생성 완료를 기다리지 않고 요청을 받음)."""
+        self._task = asyncio.create_task(self._reconcile_in_background(db))
+
+    async def _reconcile_in_background(self, db: AsyncIOMotorDatabase) -> None:
+        try:
+            await self.reconcile(db)
+            self._log_drift(await self.report(db))
+        except Exception as e:
+            logger.error(f"[IndexManager] 인덱스 점검 실패: {e}")
+
+    @staticmethod
+    def _log_drift(report: dict) -> None:
+        """선언과 다른 인덱스를 시작 로그에 남김 (/metrics/indexes를 끈 운영 환경에서도 확인 가능)."""
+        for name, drift in report["collections"].items():
+            problems = {key: value for key, value in drift.items() if value}
+            if problems:
+                logger.warning(f"[IndexManager] 인덱스 점검 ({name}): {problems}")
+
+    async def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+# 싱글톤 인스턴스
+index_manager = IndexManager(INDEXED_REPOSITORIES)
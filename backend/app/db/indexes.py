@@ -0,0 +1,55 @@
+"""
+MongoDB 인덱스 선언.
+
+각 Repository가 클래스 속성으로 자기 컬렉션의 인덱스와 조회 필드를 선언한다.
+- COLLECTION: 컬렉션 이름
+- INDEXES: 있어야 하는 인덱스 (IndexSpec)
+- QUERIED_FIELDS: 조회 조건 / 정렬에 쓰는 필드 (인덱스 커버리지 보고용)
+
+생성 / 점검은 app/db/index_manager.py가 담당한다.
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from pymongo import IndexModel
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """인덱스 1개 선언 (이름으로 실제 인덱스와 대조)."""
+    name: str
+    keys: Tuple[Tuple[str, int], ...]
+    unique: bool = False
+    sparse: bool = False
+    expire_after_seconds: Optional[int] = None      # TTL 인덱스 (0이면 필드의 시각에 만료)
+
+    def model(self) -> IndexModel:
+        options = {"name": self.name}
+        if self.unique:
+            options["unique"] = True
+        if self.sparse:
+            options["sparse"] = True
+        if self.expire_after_seconds is not None:
+            options["expireAfterSeconds"] = self.expire_after_seconds
+        return IndexModel(list(self.keys), **options)
+
+    def describe(self) -> dict:
+        """index_information() 항목과 같은 형태로 비교하기 위한 값."""
+        return {
+            "key": [list(k) for k in self.keys],
+            "unique": self.unique,
+            "sparse": self.sparse,
+            "expireAfterSeconds": self.expire_after_seconds,
+        }
+
+    @staticmethod
+    def describe_existing(info: dict) -> dict:
+        return {
+            "key": [
+                [field, direction if isinstance(direction, str) else int(direction)]
+                for field, direction in list(info.get("key", []))
+            ],
+            "unique": bool(info.get("unique", False)),
+            "sparse": bool(info.get("sparse", False)),
+            "expireAfterSeconds": info.get("expireAfterSeconds"),
+        }
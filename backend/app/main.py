@@ -14,8 +14,14 @@ import firebase_admin
 from firebase_admin import credentials
 
 from app.api.v1 import api_router
+from app.api.v1.endpoints.deps import get_plant_service
 from app.core.config import settings
+from app.db.index_manager import index_manager
 from app.db.session import mongodb
+from app.services.image_search_jobs import image_search_workers
+from app.services.image_service import image_preprocessor
+from app.services.plant_name_index import plant_name_index
+from app.services.plant_search_index import plant_search_index
 
 
 # ==========================================
@@ -35,17 +41,30 @@ if not firebase_admin._apps:
 async def lifespan(app: FastAPI):
     """
     애플리케이션 생명주기 관리.
-    - startup: MongoDB 연결 수립
-    - shutdown: MongoDB 연결 해제
+    - startup: MongoDB 연결 수립, 누락된 컬렉션 인덱스 생성(백그라운드), 식물 이름 / 검색 인덱스 적재,
+      이미지 검색 워커 시작 (미처리 작업 재등록)
+    - shutdown: 인덱스 생성 작업 / 워커 종료, MongoDB 연결 해제, 이미지 전처리 스레드 정리
     """
     await mongodb.connect()
     print("✅ MongoDB Connected")  # 로그 추가 (확인용)
+
+    index_manager.start(mongodb.db)
+    plant_service = get_plant_service()
+    await plant_name_index.load(plant_service.plant_repo)
+    await plant_search_index.load(plant_service.plant_repo)
+
+    image_search_workers.start()
+    await plant_service.resume_image_search_jobs()
     
     yield
     
+    await index_manager.stop()
+    await image_search_workers.stop()
     await mongodb.close()
     print("⛔ MongoDB Closed")    # 로그 추가 (확인용)
 
+    image_preprocessor.shutdown()
+
 
 # ==========================================
 # 3. FastAPI 앱 인스턴스 생성
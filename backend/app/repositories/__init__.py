@@ -1,4 +1,26 @@
 from app.repositories.plant_repository import PlantRepository
 from app.repositories.user_repository import UserRepository
+from app.repositories.image_cache_repository import ImageCacheRepository
+from app.repositories.recommendation_cache_repository import RecommendationCacheRepository
+from app.repositories.image_search_job_repository import ImageSearchJobRepository
+from app.repositories.plant_synonym_repository import PlantSynonymRepository
 
-__all__ = ["PlantRepository", "UserRepository"]
+# 인덱스를 선언한 Repository (app/db/index_manager.py가 생성 / 점검)
+INDEXED_REPOSITORIES = [
+    PlantRepository,
+    UserRepository,
+    ImageCacheRepository,
+    RecommendationCacheRepository,
+    ImageSearchJobRepository,
+    PlantSynonymRepository,
+]
+
+__all__ = [
+    "PlantRepository",
+    "UserRepository",
+    "ImageCacheRepository",
+    "RecommendationCacheRepository",
+    "ImageSearchJobRepository",
+    "PlantSynonymRepository",
+    "INDEXED_REPOSITORIES",
+]
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.db.indexes import IndexSpec
+
+
+class ImageCacheRepository:
+    """
+    이미지 식별 결과 영구 캐시 (2차 캐시) 데이터 접근 계층.
+
+    [문서 구조]
+    - _id: 정규화 이미지 SHA-256
+    - dhash: 64bit 차분 해시 (16자리 hex)
+    - dhashBands: 해시를 8비트씩 나눈 밴드 토큰 (예: "3:a1")
+    - identified: Gemini 식별 결과 (name, englishName, scientificName, ...)
+    - variant: 식별 설정 (예: "fused:top3", 설정이 다르면 조회하지 않음)
+    - createdAt / expiresAt
+    """
+
+    # 해밍 거리 d 이하인 두 해시는 8개 밴드 중 최소 (8 - d)개가 일치한다(비둘기집 원리).
+    # 따라서 d <= 7 이면 "밴드 하나라도 일치"로 후보를 빠짐없이 좁힐 수 있다.
+    BAND_COUNT = 8
+
+    COLLECTION = "image_identification_cache"
+    INDEXES = [
+        IndexSpec("dhashBands", (("dhashBands", 1),)),
+        # 만료 시각이 지난 문서는 MongoDB가 삭제 (조회는 만료 조건을 따로 걸어 삭제 지연과 무관)
+        IndexSpec("expiresAt_ttl", (("expiresAt", 1),), expire_after_seconds=0),
+    ]
+    QUERIED_FIELDS = ("dhashBands", "expiresAt")
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.collection = db[self.COLLECTION]
+
+    @classmethod
+    def dhash_bands(cls, dhash: int) -> List[str]:
+        """64bit 해시 → 밴드 토큰 리스트."""
+        return [f"{i}:{(dhash >> (8 * i)) & 0xFF:02x}" for i in range(cls.BAND_COUNT)]
+
+    async def get_by_hash(self, sha256: str, variant: str) -> Optional[dict]:
+        """SHA-256 정확 일치 조회 (같은 식별 설정, 만료 항목 제외)"""
+        return await self.collection.find_one({
+            "_id": sha256,
+            "variant": variant,
+            "expiresAt": {"$gt": datetime.now(timezone.utc)},
+        })
+
+    async def find_by_dhash_bands(self, dhash: int, variant: str, min_bands: int = 1) -> List[dict]:
+        """
+        밴드가 min_bands개 이상 겹치는 후보 조회 (해밍 거리는 호출측에서 계산).
+
+        개수 제한으로 자르면 밴드 하나만 우연히 겹친 후보가 자리를 채워 진짜 유사 이미지를 놓칠 수 있으므로,
+        겹친 밴드 수를 서버에서 세어 거리 조건상 불가능한 후보만 걸러내고 전부 돌려준다.
+        """
+        bands = self.dhash_bands(dhash)
+        cursor = self.collection.aggregate([
+            {"$match": {
+                "dhashBands": {"$in": bands},
+                "variant": variant,
+                "expiresAt": {"$gt": datetime.now(timezone.utc)},
+            }},
+            {"$project": {
+                "dhash": 1,
+                "identified": 1,
+                "matchedBands": {"$size": {"$filter": {
+                    "input": "$dhashBands", "as": "band", "cond": {"$in": ["$$band", bands]},
+                }}},
+            }},
+            {"$match": {"matchedBands": {"$gte": min_bands}}},
+            {"$sort": {"matchedBands": -1}},
+        ])
+        return await cursor.to_list(length=None)
+
+    async def upsert(
+        self, sha256: str, dhash: Optional[int], identified: dict, ttl_seconds: int, variant: str
+    ) -> None:
+        """식별 결과 저장 (같은 해시는 덮어씀)"""
+        now = datetime.now(timezone.utc)
+        doc = {
+            "identified": identified,
+            "variant": variant,
+            "createdAt": now,
+            "expiresAt": now + timedelta(seconds=ttl_seconds),
+        }
+        if dhash is not None:
+            doc["dhash"] = f"{dhash:016x}"
+            doc["dhashBands"] = self.dhash_bands(dhash)
+
+        await self.collection.update_one({"_id": sha256}, {"$set": doc}, upsert=True)
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from app.db.indexes import IndexSpec
+
+
+class ImageSearchJobRepository:
+    """
+    이미지 검색 비동기 작업 데이터 접근 계층.
+
+    [문서 구조]
+    - _id: 작업 ID (uuid4 hex)
+    - stage: received → identified → matched (실패 시 failed)
+    - image: 전처리된 이미지 (PreparedImage.to_document(), 작업 종료 시 제거)
+    - claimed: 워커가 가져갔는지 여부 (여러 프로세스의 중복 처리 방지)
+      선점 후 updatedAt이 임대 시간(lease)보다 오래 갱신되지 않으면 죽은 워커의 작업으로 보고 다시 선점할 수 있다
+    - userId: 요청 사용자 (찜 여부 계산용, 비로그인은 None)
+    - identified: 식별 결과 (name, englishName, scientificName, ...)
+    - result: 검색 결과 (PlantSearchResultDto 형태)
+    - error: 실패 사유
+    - createdAt / updatedAt / expiresAt
+    """
+
+    STAGE_RECEIVED = "received"
+    STAGE_IDENTIFIED = "identified"
+    STAGE_MATCHED = "matched"
+    STAGE_FAILED = "failed"
+    TERMINAL_STAGES = (STAGE_MATCHED, STAGE_FAILED)
+    ACTIVE_STAGES = (STAGE_RECEIVED, STAGE_IDENTIFIED)
+
+    COLLECTION = "image_search_jobs"
+    INDEXES = [
+        # 재시작 후 미처리 작업 재등록 (find_resumable_ids)
+        IndexSpec("stage_claimed_createdAt", (("stage", 1), ("claimed", 1), ("createdAt", 1))),
+        IndexSpec("expiresAt_ttl", (("expiresAt", 1),), expire_after_seconds=0),
+    ]
+    QUERIED_FIELDS = ("stage",)
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.collection = db[self.COLLECTION]
+
+    async def create(self, job_id: str, image: dict, user_id: Optional[str], ttl_seconds: int) -> dict:
+        """작업 생성 (stage=received). 반환값에는 이미지가 포함되지 않음."""
+        now = datetime.now(timezone.utc)
+        doc = {
+            "_id": job_id,
+            "stage": self.STAGE_RECEIVED,
+            "image": image,
+            "claimed": False,
+            "userId": user_id,
+            "identified": None,
+            "result": None,
+            "error": None,
+            "createdAt": now,
+            "updatedAt": now,
+            "expiresAt": now + timedelta(seconds=ttl_seconds),
+        }
+        await self.collection.insert_one(doc)
+        return {k: v for k, v in doc.items() if k != "image"}
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        """작업 조회 (이미지 제외, 만료 항목 제외)"""
+        return await self.collection.find_one(
+            {"_id": job_id, "expiresAt": {"$gt": datetime.now(timezone.utc)}},
+            {"image": 0},
+        )
+
+    def _claimable(self, lease_seconds: float) -> dict:
+        """아직 선점되지 않았거나 선점 임대가 끝난 진행 중 작업 조건"""
+        now = datetime.now(timezone.utc)
+        return {
+            "stage": {"$in": list(self.ACTIVE_STAGES)},
+            "expiresAt": {"$gt": now},
+            "$or": [
+                {"claimed": False},
+                {"updatedAt": {"$lt": now - timedelta(seconds=lease_seconds)}},
+            ],
+        }
+
+    async def claim(self, job_id: str, lease_seconds: float) -> Optional[dict]:
+        """선점 가능한 작업을 원자적으로 선점 (이미지 포함 반환)"""
+        return await self.collection.find_one_and_update(
+            {"_id": job_id, **self._claimable(lease_seconds)},
+            {"$set": {"claimed": True, "updatedAt": datetime.now(timezone.utc)}},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def release(self, job_id: str) -> None:
+        """선점 해제 (처리 도중 취소된 작업을 다른 워커 / 재시작 후 재등록이 가져갈 수 있게)"""
+        await self.collection.update_one(
+            {"_id": job_id, "stage": {"$in": list(self.ACTIVE_STAGES)}},
+            {"$set": {"claimed": False, "updatedAt": datetime.now(timezone.utc)}},
+        )
+
+    async def find_resumable_ids(self, lease_seconds: float, limit: int = 100) -> List[str]:
+        """선점되지 않았거나 임대가 끝난 작업 ID (재시작 후 재등록용, 오래된 순)"""
+        cursor = self.collection.find(
+            self._claimable(lease_seconds), {"_id": 1}
+        ).sort("createdAt", 1).limit(limit)
+        return [doc["_id"] for doc in await cursor.to_list(length=limit)]
+
+    async def update_stage(self, job_id: str, stage: str, **fields) -> None:
+        """단계 전환 (종료 단계면 보관 중인 이미지 삭제)"""
+        update = {"$set": {"stage": stage, "updatedAt": datetime.now(timezone.utc), **fields}}
+        if stage in self.TERMINAL_STAGES:
+            update["$unset"] = {"image": ""}
+        await self.collection.update_one({"_id": job_id}, update)
@@ -1,14 +1,39 @@
+import re
 from typing import Optional, List
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from app.db.indexes import IndexSpec
 from app.models import PlantModel
 
 
 class PlantRepository:
     """식물 데이터 접근 계층"""
 
+    COLLECTION = "plants"
+    INDEXES = [
+        IndexSpec("name", (("name", 1),)),
+        # 학명은 같은 종의 품종이 여러 문서일 수 있어 고유 조건을 두지 않음
+        IndexSpec("scientificName", (("scientificName", 1),)),
+        IndexSpec("season", (("season", 1),)),
+        IndexSpec("bloomingMonths", (("bloomingMonths", 1),)),
+        IndexSpec("categoryGroup", (("horticulture.categoryGroup", 1),)),
+        IndexSpec("colorGroup", (("colorInfo.colorGroup", 1),)),
+        IndexSpec("scentGroup", (("scentInfo.scentGroup", 1),)),
+        IndexSpec("flowerGroup_popularity", (("flowerInfo.flowerGroup", 1), ("popularity_score", -1))),
+        IndexSpec("storyGenre", (("stories.genre", 1),)),
+        IndexSpec("searchKeywords", (("searchKeywords", 1),)),
+        IndexSpec("popularity", (("popularity_score", -1),)),
+    ]
+    # get_list 필터 / 정렬, 식별 결과 매칭, 추천 후보 조회에 쓰는 필드
+    QUERIED_FIELDS = (
+        "name", "scientificName", "season", "bloomingMonths",
+        "horticulture.categoryGroup", "colorInfo.colorGroup", "scentInfo.scentGroup",
+        "flowerInfo.flowerGroup", "flowerInfo.language", "stories.genre", "searchKeywords",
+        "popularity_score",
+    )
+
     def __init__(self, db: AsyncIOMotorDatabase):
-        self.collection = db["plants"]
+        self.collection = db[self.COLLECTION]
 
     async def get_by_id(self, plant_id: str) -> Optional[dict]:
         """ID로 식물 상세 조회"""
@@ -51,7 +76,33 @@ class PlantRepository:
             "scientificName": {"$regex": f"^{genus}", "$options": "i"}
         })
 
+    async def find_by_candidates(
+        self, scientific_names: List[str], names: List[str], limit: int = 100, genus_limit: int = 100
+    ) -> List[dict]:
+        """
+        식별 후보 여러 개를 일괄 조회.
+        학명 / 이름 정확 일치를 먼저 조회하고, 하나도 없을 때만 학명 속(genus) 일치를 조회합니다.
+        (같은 쿼리로 묶으면 식물이 많은 속이 limit을 채워 정확 일치를 밀어낼 수 있음)
+        어느 후보와 맞는지(순위)는 호출측에서 판단합니다.
+        """
+        conditions = []
+        if scientific_names:
+            conditions.append({"scientificName": {"$in": scientific_names}})
+        if names:
+            conditions.append({"name": {"$in": names}})
+        if not conditions:
+            return []
+        plants = await self.collection.find({"$or": conditions}).limit(limit).to_list(length=limit)
+        if plants:
+            return plants
 
+        # 속 이름은 대문자로 시작하므로 대소문자 구분 + 고정 접두사 정규식 (scientificName 인덱스 범위 조회)
+        genera = sorted({s.split()[0].capitalize() for s in scientific_names if s.split()})
+        if not genera:
+            return []
+        return await self.collection.find({
+            "$or": [{"scientificName": {"$regex": f"^{re.escape(g)} "}} for g in genera]
+        }).limit(genus_limit).to_list(length=genus_limit)
 
     async def create(self, plant_data: dict) -> dict:
         """새 식물 데이터 저장"""
@@ -97,13 +148,48 @@ class PlantRepository:
         """
         식물 목록 조회 (일반 목록 & 꽃갈피 목록 통합)
         """
+        # [핵심] 꽃갈피 필터링: plant_ids가 빈 리스트([])라면 찜한게 없다는 뜻이므로 결과도 0개여야 함
+        if plant_ids is not None and not plant_ids:
+            return []
+        query = self._list_query(
+            plant_ids, season, blooming_month, category_group, color_group,
+            scent_group, flower_group, story_genre, keyword,
+        )
+
+        projection = {
+            "_id": 1,
+            "name": 1,
+            "flowerInfo": 1,
+            "imageUrl": 1,
+            "season": 1,
+            "horticulture.preContent": 1,
+        }
+
+        cursor = (
+            self.collection.find(query, projection)
+            .sort(sort_by, sort_order)
+            .skip(skip)
+            .limit(limit)
+        )
+        return await cursor.to_list(length=limit)
+
+    @staticmethod
+    def _list_query(
+        plant_ids: Optional[List[str]] = None,
+        season: Optional[str] = None,
+        blooming_month: Optional[int] = None,
+        category_group: Optional[str] = None,
+        color_group: Optional[str] = None,
+        scent_group: Optional[str] = None,
+        flower_group: Optional[str] = None,
+        story_genre: Optional[str] = None,
+        keyword: Optional[str] = None,
+    ) -> dict:
+        """목록 필터 조건 → MongoDB 조회 조건 (get_list / get_ids 공용)"""
         query = {}
 
-        # [핵심] 꽃갈피 필터링: 전달받은 ID 리스트가 있으면 그 안에서만 찾음
+        # 전달받은 ID 리스트가 있으면 그 안에서만 찾음
         if plant_ids is not None:
-            # plant_ids가 빈 리스트([])라면 찜한게 없다는 뜻이므로 결과도 0개여야 함
-            if not plant_ids:
-                return []
             query["_id"] = {"$in": plant_ids}
 
         # --- 단일 필터 조건  ---
@@ -121,31 +207,65 @@ class PlantRepository:
             query["flowerInfo.flowerGroup"] = flower_group
         if story_genre:
             query["stories.genre"] = story_genre
-            
-        # 키워드 검색
+
+        # 키워드 검색 (검색 인덱스를 쓰지 않는 경우의 대체 경로, 입력은 문자 그대로 비교)
         if keyword:
+            pattern = re.escape(keyword)
             query["$or"] = [
-                {"name": {"$regex": keyword, "$options": "i"}},
-                {"flowerInfo.language": {"$regex": keyword, "$options": "i"}},
-                {"searchKeywords": {"$regex": keyword, "$options": "i"}},
+                {"name": {"$regex": pattern, "$options": "i"}},
+                {"flowerInfo.language": {"$regex": pattern, "$options": "i"}},
+                {"searchKeywords": {"$regex": pattern, "$options": "i"}},
             ]
+        return query
 
-        projection = {
-            "_id": 1,
-            "name": 1,
-            "flowerInfo": 1,
-            "imageUrl": 1,
-            "season": 1,
-            "horticulture.preContent": 1,
-        }
+    async def get_ids(
+        self,
+        plant_ids: List[str],
+        season: Optional[str] = None,
+        blooming_month: Optional[int] = None,
+        category_group: Optional[str] = None,
+        color_group: Optional[str] = None,
+        scent_group: Optional[str] = None,
+        flower_group: Optional[str] = None,
+        story_genre: Optional[str] = None,
+        sort_by: str = "name",
+        sort_order: int = 1,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """
+        plant_ids 중 필터 조건에 맞는 _id만 정렬 순서대로 반환 (키워드 검색 결과 필터용, 문서 본문은 읽지 않음).
+        limit이 있으면 정렬 순서 앞에서 limit개까지만 조회.
+        """
+        if not plant_ids:
+            return []
+        query = self._list_query(
+            plant_ids, season, blooming_month, category_group, color_group,
+            scent_group, flower_group, story_genre,
+        )
+        cursor = self.collection.find(query, {"_id": 1}).sort(sort_by, sort_order)
+        if limit:
+            cursor = cursor.limit(limit)
+        return [str(doc["_id"]) for doc in await cursor.to_list(length=limit or len(plant_ids))]
 
-        cursor = (
-            self.collection.find(query, projection)
-            .sort(sort_by, sort_order)
-            .skip(skip)
-            .limit(limit)
+    async def count_ids(
+        self,
+        plant_ids: List[str],
+        season: Optional[str] = None,
+        blooming_month: Optional[int] = None,
+        category_group: Optional[str] = None,
+        color_group: Optional[str] = None,
+        scent_group: Optional[str] = None,
+        flower_group: Optional[str] = None,
+        story_genre: Optional[str] = None,
+    ) -> int:
+        """plant_ids 중 필터 조건에 맞는 식물 수 (get_ids와 같은 조건, 키워드 검색 결과 개수용)."""
+        if not plant_ids:
+            return 0
+        query = self._list_query(
+            plant_ids, season, blooming_month, category_group, color_group,
+            scent_group, flower_group, story_genre,
         )
-        return await cursor.to_list(length=limit)
+        return await self.collection.count_documents(query)
 
     async def count(
         self,
@@ -199,4 +319,30 @@ class PlantRepository:
         ).limit(limit)
         return await cursor.to_list(length=limit)
 
+    async def get_for_intent_index(self) -> List[dict]:
+        """추천 의도 분류기 키워드 사전용 (꽃말 + 검색 키워드만)"""
+        projection = {"_id": 1, "flowerInfo": 1, "searchKeywords": 1}
+        return await self.collection.find({}, projection).to_list(length=None)
+
+    async def get_for_name_index(self) -> List[dict]:
+        """이름 인덱스용 (이름 / 학명 / 영문명 / 속 / 검색 키워드 / 인기도만)"""
+        projection = {
+            "_id": 1, "name": 1, "englishName": 1, "scientificName": 1,
+            "taxonomy.genus": 1, "searchKeywords": 1, "popularity_score": 1,
+        }
+        return await self.collection.find({}, projection).to_list(length=None)
+
+    async def get_for_search_index(self) -> List[dict]:
+        """키워드 검색 인덱스용 (한글명 / 검색 키워드 / 꽃말만)"""
+        projection = {"_id": 1, "name": 1, "searchKeywords": 1, "flowerInfo.language": 1}
+        return await self.collection.find({}, projection).to_list(length=None)
+
+    async def get_top_by_flower_group(self, flower_group: str) -> Optional[dict]:
+        """꽃말 그룹 내 인기도 1위 식물"""
+        cursor = self.collection.find(
+            {"flowerInfo.flowerGroup": flower_group}
+        ).sort("popularity_score", -1).limit(1)
+        plants = await cursor.to_list(length=1)
+        return plants[0] if plants else None
+
 
@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from app.db.indexes import IndexSpec
+
+
+class PlantSynonymRepository:
+    """
+    학명 이명(synonym) / 별칭 → 카탈로그 식물 데이터 접근 계층.
+
+    [문서 구조]
+    - alias: 정규화된 학명 키 (normalize_scientific_name, 고유 인덱스)
+    - name: 원래 표기 (예: "Dendranthema grandiflorum (Ramat.) Kitam.")
+    - plantId: 카탈로그 식물 _id
+    - acceptedName: 카탈로그의 정명(accepted name)
+    - kind: accepted | synonym
+    - source: 적재한 파일 이름
+    - updatedAt
+    """
+
+    COLLECTION = "plant_synonyms"
+    INDEXES = [
+        IndexSpec("alias_unique", (("alias", 1),), unique=True),       # 조회 + 별칭 중복 방지
+        IndexSpec("plantId", (("plantId", 1),)),
+    ]
+    QUERIED_FIELDS = ("alias",)
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.collection = db[self.COLLECTION]
+
+    async def find_by_aliases(self, aliases: List[str]) -> Dict[str, str]:
+        """별칭 여러 개를 한 번의 인덱스 조회로 확인 → {alias: plantId}"""
+        if not aliases:
+            return {}
+        cursor = self.collection.find({"alias": {"$in": aliases}}, {"_id": 0, "alias": 1, "plantId": 1})
+        return {doc["alias"]: doc["plantId"] for doc in await cursor.to_list(length=len(aliases))}
+
+    async def bulk_upsert(self, entries: List[dict]) -> dict:
+        """
+        별칭 일괄 저장 (같은 별칭은 덮어씀, 순서 무관 bulk write).
+
+        Returns:
+            {"inserted": 새 별칭 수, "updated": 기존 별칭을 덮어쓴 수}
+        """
+        if not entries:
+            return {"inserted": 0, "updated": 0}
+        now = datetime.now(timezone.utc)
+        result = await self.collection.bulk_write(
+            [
+                UpdateOne({"alias": entry["alias"]}, {"$set": {**entry, "updatedAt": now}}, upsert=True)
+                for entry in entries
+            ],
+            ordered=False,
+        )
+        # 같은 내용으로 덮어써 modified_count가 0이어도 기존 별칭과 일치했으면 updated로 센다
+        return {"inserted": result.upserted_count, "updated": result.matched_count}
+
+    async def count(self) -> int:
+        return await self.collection.count_documents({})
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.db.indexes import IndexSpec
+
+
+class RecommendationCacheRepository:
+    """
+    상황 기반 추천 결과 영구 캐시 (2차 캐시) 데이터 접근 계층.
+
+    [문서 구조]
+    - _id: 정규화된 상황 텍스트의 SHA-256
+    - situation: 정규화된 상황 텍스트
+    - plantId: 추천된 식물 _id
+    - essay: 생성된 추천 에세이
+    - createdAt / expiresAt
+    """
+
+    COLLECTION = "recommendation_cache"
+    INDEXES = [
+        IndexSpec("expiresAt_ttl", (("expiresAt", 1),), expire_after_seconds=0),
+    ]
+    QUERIED_FIELDS = ()
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.collection = db[self.COLLECTION]
+
+    async def get(self, key: str) -> Optional[dict]:
+        """키로 조회 (만료 항목 제외)"""
+        return await self.collection.find_one({
+            "_id": key,
+            "expiresAt": {"$gt": datetime.now(timezone.utc)},
+        })
+
+    async def upsert(self, key: str, situation: str, plant_id: str, essay: str, ttl_seconds: int) -> None:
+        """추천 결과 저장 (같은 키는 덮어씀)"""
+        now = datetime.now(timezone.utc)
+        await self.collection.update_one(
+            {"_id": key},
+            {"$set": {
+                "situation": situation,
+                "plantId": plant_id,
+                "essay": essay,
+                "createdAt": now,
+                "expiresAt": now + timedelta(seconds=ttl_seconds),
+            }},
+            upsert=True,
+        )
@@ -2,10 +2,18 @@ from typing import Optional, List
 from datetime import datetime, timezone
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from app.db.indexes import IndexSpec
+
 
 class UserRepository:
+    COLLECTION = "users"
+    INDEXES = [
+        IndexSpec("email", (("email", 1),)),
+    ]
+    QUERIED_FIELDS = ("email",)
+
     def __init__(self, db: AsyncIOMotorDatabase):
-        self.collection = db["users"]
+        self.collection = db[self.COLLECTION]
 
     async def get_by_id(self, user_id: str) -> Optional[dict]:
         """
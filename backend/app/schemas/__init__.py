@@ -30,6 +30,16 @@ from app.schemas.plant import (
     PlantExploreDto,
     PlantSearchResultDto,
 )
+from app.schemas.gemini import (
+    PlantName,
+    PlantCandidate,
+    PlantIdentification,
+    PlantImageCheck,
+    FusedPlantIdentification,
+    IndexedPlantName,
+    CatalogChoice,
+)
+from app.schemas.job import ImageBatchItemDto, ImageSearchJobDto
 from app.schemas.user import (
     UserBase,
     UserLoginRequest,
@@ -54,6 +64,17 @@ __all__ = [
     "PlantDetailDto",
     "PlantExploreDto",
     "PlantSearchResultDto",
+    # Gemini structured output schemas
+    "PlantName",
+    "PlantCandidate",
+    "PlantIdentification",
+    "PlantImageCheck",
+    "FusedPlantIdentification",
+    "IndexedPlantName",
+    "CatalogChoice",
+    # Job schemas
+    "ImageBatchItemDto",
+    "ImageSearchJobDto",
     # User schemas
     "UserBase",
     "UserLoginRequest",
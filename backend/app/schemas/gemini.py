@@ -0,0 +1,62 @@
+"""
+Gemini 구조화 출력(response_schema) 스키마.
+
+각 모델은 SDK의 response_schema로 그대로 전달되고, 응답 JSON도 같은 모델로 한 번에 검증한다.
+JSON 키는 camelCase 별칭을 사용한다 (식별 캐시에 저장된 기존 문서와 같은 형태).
+선택 필드는 Gemini 스키마에서 nullable로 표현되도록 None 기본값만 사용한다.
+"""
+from typing import List, Literal, Optional
+
+from pydantic import Field
+
+from app.schemas import CamelCaseModel
+
+
+class PlantName(CamelCaseModel):
+    """식물 이름/학명 (상황 기반 추천 결과)"""
+    name: str = Field(..., description="Korean common name")
+    english_name: Optional[str] = Field(None, description="English common name")
+    scientific_name: Optional[str] = Field(
+        None, description='FULL binomial name (genus + species), e.g. "Rosa canina", NOT just "Rosa"'
+    )
+
+
+class PlantCandidate(PlantName):
+    """이미지 식별 후보 1건"""
+    confidence: float = Field(..., description="0.0 ~ 1.0")
+
+
+class PlantIdentification(PlantName):
+    """
+    이미지 식별 결과 (PlantService / 식별 캐시에서 사용하는 형태)
+
+    이름 필드는 가장 가능성 높은 후보, candidates는 신뢰도 순 상위 후보 전체 (1위 포함).
+    """
+    confidence: Optional[float] = Field(None, description="0.0 ~ 1.0")
+    candidates: Optional[List[PlantCandidate]] = Field(
+        None, description="top candidates including the best one, most likely first"
+    )
+
+
+class PlantImageCheck(CamelCaseModel):
+    """식물 여부 판정 (two_step 1단계)"""
+    is_plant: bool
+    confidence: Literal["high", "medium", "low"]
+
+
+class FusedPlantIdentification(CamelCaseModel):
+    """단일 호출(fused) 식별 응답: 식물이 아니면 후보가 비어 있음"""
+    is_plant: bool
+    candidates: List[PlantCandidate] = Field(
+        default_factory=list, description="candidate identifications, most likely first (empty if not a plant)"
+    )
+
+
+class IndexedPlantName(PlantName):
+    """배치 추천 응답 항목 (index = 입력 상황 번호)"""
+    index: int
+
+
+class CatalogChoice(CamelCaseModel):
+    """카탈로그 제약 추천 응답"""
+    plant_id: str = Field(..., description="id from the catalog")
@@ -0,0 +1,39 @@
+"""
+비동기 작업 / 일괄 처리 응답 스키마.
+"""
+from datetime import datetime
+from typing import Literal, Optional
+
+from pydantic import Field
+
+from app.schemas import CamelCaseModel
+from app.schemas.gemini import PlantIdentification
+from app.schemas.plant import PlantSearchResultDto
+
+
+class ImageSearchJobDto(CamelCaseModel):
+    """이미지 검색 작업 상태 (POST 접수 응답 / 폴링 / SSE 이벤트 공통)"""
+    job_id: str
+    stage: Literal["received", "identified", "matched", "failed"]
+    identified: Optional[PlantIdentification] = Field(None, description="identified 단계 이후 식별 결과")
+    result: Optional[PlantSearchResultDto] = Field(None, description="matched 단계의 검색 결과")
+    error: Optional[str] = Field(None, description="failed 단계의 실패 사유")
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_document(cls, doc: dict) -> "ImageSearchJobDto":
+        """ImageSearchJobRepository 문서 → DTO (_id → jobId)."""
+        return cls.model_validate({**doc, "jobId": doc["_id"]})
+
+
+class ImageBatchItemDto(CamelCaseModel):
+    """일괄 식별 결과 1건 (NDJSON 한 줄, 처리가 끝난 순서대로 전송)"""
+    index: int = Field(..., description="입력 순서 (0부터)")
+    filename: str
+    status: Literal["matched", "unidentified", "not_found", "error"]
+    identified: Optional[PlantIdentification] = Field(None, description="식별 결과 (unidentified / error 제외)")
+    plant_id: Optional[str] = Field(None, description="matched: 카탈로그 식물 _id")
+    plant_name: Optional[str] = None
+    scientific_name: Optional[str] = None
+    error: Optional[str] = None
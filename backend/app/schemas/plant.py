@@ -273,6 +273,8 @@ class PlantExploreDto(CamelCaseModel):
 class PlantSearchResultDto(Plant): 
     is_newly_created: bool = Field(..., description="DB에 새로 생성된 식물인지 여부")
     is_favorite: bool = Field(False, description="찜 여부")
+    confidence: Optional[float] = Field(None, description="식별 신뢰도 (여러 장이면 학명별 투표 합산값)")
+    image_votes: Optional[int] = Field(None, description="여러 장 검색 시 최종 학명에 투표한 사진 수")
     model_config = ConfigDict(
         populate_by_name=True,
         use_enum_values=True,
@@ -3,6 +3,7 @@ from app.services.user_service import UserService
 from app.services.plant_service import PlantService
 from app.services.gemini_service import GeminiService
 from app.services.firebase_service import FirebaseStorageService, firebase_storage
+from app.services.image_service import ImagePreprocessor, PreparedImage, image_preprocessor
 
 __all__ = [
     "AuthService",
@@ -12,4 +13,7 @@ __all__ = [
     "GeminiService",
     "FirebaseStorageService",
     "firebase_storage",
+    "ImagePreprocessor",
+    "PreparedImage",
+    "image_preprocessor",
 ]
@@ -0,0 +1,385 @@
+"""
+Gemini 녹화/재생 백엔드 (오프라인 부하 테스트용)
+- record: 실제 클라이언트 호출을 그대로 전달하면서 요청 지문 / 응답 / 지연을 카세트(JSONL)에 기록
+- replay: 네트워크 없이 카세트에서 응답하고, 지연은 녹화된 분포에서 샘플링해 재현
+- GeminiService는 genai.Client와 같은 모양(client.aio.models / client.aio.caches)으로 사용하므로
+  호출 코드는 백엔드 종류를 알 필요가 없다
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import time
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from google.genai import types
+
+from app.core.config import settings
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] %(levelname)s [%(name)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    logger.addHandler(handler)
+
+KIND_GENERATE = "generate"
+KIND_STREAM = "stream"
+
+
+class ReplayMissError(Exception):
+    """카세트에 재생할 응답이 없음."""
+
+
+class ReplayedError(Exception):
+    """녹화 당시 실패했던 호출을 재생."""
+
+
+def _sha256(value: Any) -> str:
+    if isinstance(value, bytes):
+        return hashlib.sha256(value).hexdigest()
+    return hashlib.sha256(json.dumps(value, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _part_fingerprint(part: Any) -> Any:
+    """요청 Part → 지문용 값 (이미지 바이트는 SHA-256으로 축약)."""
+    if isinstance(part, str):
+        return part
+    if isinstance(part, types.Part):
+        if part.inline_data is not None:
+            return {"blob": part.inline_data.mime_type, "sha256": _sha256(part.inline_data.data or b"")}
+        if part.text is not None:
+            return part.text
+    return repr(part)
+
+
+def _config_fingerprint(model: str, config: Optional[types.GenerateContentConfig]) -> str:
+    """호출 형태(모델 + 생성 설정) 지문. 캐시 이름처럼 실행마다 바뀌는 값은 제외."""
+    if config is None:
+        return _sha256({"model": model})
+    dumped = config.model_dump(exclude_none=True, exclude={"response_schema", "cached_content", "http_options"})
+    schema = config.response_schema
+    return _sha256({
+        "model": model,
+        "config": dumped,
+        "schema": getattr(schema, "__name__", None) or (repr(schema) if schema is not None else None),
+    })
+
+
+class Cassette:
+    """
+    녹화 파일 (한 줄에 호출 1건, JSONL).
+
+    [항목 구조]
+    - shape: 호출 형태 지문 (모델 + 생성 설정)
+    - key: 요청 지문 (shape + 프롬프트/이미지 + 컨텍스트 캐시 내용)
+    - model / kind: generate | stream
+    - latencyMs: 전체 지연 (stream은 첫 조각까지의 지연)
+    - text / chunks: 응답 텍스트 (stream은 조각 리스트)
+    - gapsMs: stream 조각 사이 간격
+    - usage: 토큰 사용량 (usage_metadata)
+    - error: 실패한 호출의 예외 요약
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._by_key: Dict[str, dict] = {}
+        self._by_shape: Dict[str, List[dict]] = defaultdict(list)
+        self._latencies: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+        self._model_latencies: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+        self._gaps: Dict[str, List[float]] = defaultdict(list)
+        self._write_lock = asyncio.Lock()
+        self.size = 0
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        cassette = cls(path)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        cassette._index(json.loads(line))
+        return cassette
+
+    async def append(self, entry: dict) -> None:
+        """
+        항목 기록 (파일 끝에 추가).
+
+        재생용 색인은 바로 반영하고, 파일 쓰기는 이벤트 루프를 막지 않도록 스레드에서 수행.
+        동시에 기록해도 줄이 섞이지 않도록 쓰기는 한 번에 하나씩.
+        """
+        self._index(entry)
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        async with self._write_lock:
+            await asyncio.to_thread(self._write, line)
+
+    def _write(self, line: str) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    def _index(self, entry: dict) -> None:
+        # 같은 요청이 여러 번 녹화되면 마지막 응답을 재생하고, 지연 표본은 모두 사용
+        self._by_key[entry["key"]] = entry
+        self._by_shape[entry["shape"]].append(entry)
+        self._latencies[(entry["shape"], entry["kind"])].append(entry["latencyMs"])
+        self._model_latencies[(entry["model"], entry["kind"])].append(entry["latencyMs"])
+        self._gaps[entry["model"]].extend(entry.get("gapsMs") or [])
+        self.size += 1
+
+    def find(self, shape: str, key: str, strict: bool, rng: random.Random) -> dict:
+        """요청 지문 일치 항목 (없으면 strict가 아닐 때 같은 호출 형태의 항목 중 하나)."""
+        entry = self._by_key.get(key)
+        if entry is not None:
+            return entry
+        candidates = [e for e in self._by_shape.get(shape, ()) if not e.get("error")]
+        if strict or not candidates:
+            raise ReplayMissError(f"카세트에 녹화된 응답 없음 (key={key[:12]}, shape={shape[:12]})")
+        return rng.choice(candidates)
+
+    def sample_latency(self, entry: dict, rng: random.Random) -> float:
+        """같은 호출 형태(없으면 같은 모델)의 녹화 지연 중 하나 (초)."""
+        samples = self._latencies.get((entry["shape"], entry["kind"])) or self._model_latencies[(entry["model"], entry["kind"])]
+        return rng.choice(samples) / 1000
+
+    def sample_gap(self, model: str, rng: random.Random) -> float:
+        gaps = self._gaps.get(model)
+        return rng.choice(gaps) / 1000 if gaps else 0.0
+
+    def stats(self) -> dict:
+        return {"path": self.path, "entries": self.size, "requests": len(self._by_key), "shapes": len(self._by_shape)}
+
+
+class _ContextCacheNames:
+    """컨텍스트 캐시 이름 → 내용 지문 (실행마다 달라지는 캐시 이름 대신 내용으로 요청을 식별)."""
+
+    def __init__(self):
+        self._names: Dict[str, str] = {}
+
+    @staticmethod
+    def fingerprint(config: Optional[types.CreateCachedContentConfig]) -> str:
+        contents = (config.contents if config else None) or []
+        if not isinstance(contents, list):
+            contents = [contents]
+        return _sha256([_part_fingerprint(c) for c in contents])
+
+    def remember(self, name: str, config: Optional[types.CreateCachedContentConfig]) -> None:
+        self._names[name] = self.fingerprint(config)
+
+    def request_key(self, shape: str, contents: Any, config: Optional[types.GenerateContentConfig]) -> str:
+        parts = contents if isinstance(contents, list) else [contents]
+        cached = config.cached_content if config else None
+        return _sha256({
+            "shape": shape,
+            "parts": [_part_fingerprint(p) for p in parts],
+            "context": self._names.get(cached, cached),
+        })
+
+
+def _response(text: Optional[str], usage: Optional[dict]) -> types.GenerateContentResponse:
+    """녹화 텍스트 → SDK 응답 객체 (response.text / usage_metadata 사용 가능)."""
+    return types.GenerateContentResponse(
+        candidates=[types.Candidate(content=types.Content(role="model", parts=[types.Part(text=text or "")]))],
+        usage_metadata=types.GenerateContentResponseUsageMetadata(**usage) if usage else None,
+    )
+
+
+def _usage(response: Any) -> Optional[dict]:
+    usage = getattr(response, "usage_metadata", None)
+    if isinstance(usage, types.GenerateContentResponseUsageMetadata):
+        return usage.model_dump(mode="json", exclude_none=True)
+    return None
+
+
+# =========================================================
+# 녹화 (실제 API 호출 + 기록)
+# =========================================================
+class _RecordingModels:
+    def __init__(self, inner, cassette: Cassette, names: _ContextCacheNames):
+        self._inner = inner
+        self._cassette = cassette
+        self._names = names
+
+    def _entry(self, model: str, contents: Any, config: Any, kind: str) -> dict:
+        shape = _config_fingerprint(model, config)
+        return {"shape": shape, "key": self._names.request_key(shape, contents, config), "model": model, "kind": kind}
+
+    async def generate_content(self, *, model: str, contents: Any, config: Any = None):
+        entry = self._entry(model, contents, config, KIND_GENERATE)
+        start = time.monotonic()
+        try:
+            response = await self._inner.generate_content(model=model, contents=contents, config=config)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            entry.update(latencyMs=round((time.monotonic() - start) * 1000, 1), error=f"{type(e).__name__}: {e}")
+            await self._cassette.append(entry)
+            raise
+
+        entry.update(latencyMs=round((time.monotonic() - start) * 1000, 1), text=response.text, usage=_usage(response))
+        await self._cassette.append(entry)
+        return response
+
+    async def generate_content_stream(self, *, model: str, contents: Any, config: Any = None):
+        entry = self._entry(model, contents, config, KIND_STREAM)
+        start = time.monotonic()
+        stream = await self._inner.generate_content_stream(model=model, contents=contents, config=config)
+
+        async def recorded() -> AsyncIterator:
+            chunks, offsets, usage = [], [], None
+            async for chunk in stream:
+                offsets.append(time.monotonic() - start)
+                chunks.append(chunk.text or "")
+                usage = _usage(chunk) or usage
+                yield chunk
+            # 끝까지 받은 스트림만 기록 (중간 취소는 지연 분포를 왜곡)
+            if offsets:
+                entry.update(
+                    latencyMs=round(offsets[0] * 1000, 1),
+                    gapsMs=[round((b - a) * 1000, 1) for a, b in zip(offsets, offsets[1:])],
+                    chunks=chunks,
+                    usage=usage,
+                )
+                await self._cassette.append(entry)
+
+        return recorded()
+
+
+class _RecordingCaches:
+    def __init__(self, inner, names: _ContextCacheNames):
+        self._inner = inner
+        self._names = names
+
+    async def create(self, *, model: str, config: Any = None):
+        cached = await self._inner.create(model=model, config=config)
+        self._names.remember(cached.name, config)
+        return cached
+
+    async def delete(self, *, name: str, **kwargs):
+        return await self._inner.delete(name=name, **kwargs)
+
+
+# =========================================================
+# 재생 (네트워크 없음)
+# =========================================================
+class _ReplayModels:
+    def __init__(self, cassette: Cassette, names: _ContextCacheNames, rng: random.Random, latency_scale: float, strict: bool):
+        self._cassette = cassette
+        self._names = names
+        self._rng = rng
+        self._scale = latency_scale
+        self._strict = strict
+
+    def _find(self, model: str, contents: Any, config: Any) -> dict:
+        shape = _config_fingerprint(model, config)
+        return self._cassette.find(shape, self._names.request_key(shape, contents, config), self._strict, self._rng)
+
+    async def _sleep(self, seconds: float) -> None:
+        if seconds > 0 and self._scale > 0:
+            await asyncio.sleep(seconds * self._scale)
+
+    async def generate_content(self, *, model: str, contents: Any, config: Any = None):
+        entry = self._find(model, contents, config)
+        await self._sleep(self._cassette.sample_latency(entry, self._rng))
+        if entry.get("error"):
+            raise ReplayedError(entry["error"])
+        if entry["kind"] == KIND_STREAM:
+            return _response("".join(entry.get("chunks") or []), entry.get("usage"))
+        return _response(entry.get("text"), entry.get("usage"))
+
+    async def generate_content_stream(self, *, model: str, contents: Any, config: Any = None):
+        entry = self._find(model, contents, config)
+        chunks = entry.get("chunks") or [entry.get("text") or ""]
+
+        async def replayed() -> AsyncIterator:
+            await self._sleep(self._cassette.sample_latency(entry, self._rng))
+            for i, chunk in enumerate(chunks):
+                if i:
+                    await self._sleep(self._cassette.sample_gap(entry["model"], self._rng))
+                yield _response(chunk, entry.get("usage") if i == len(chunks) - 1 else None)
+
+        return replayed()
+
+
+class _ReplayCaches:
+    def __init__(self, names: _ContextCacheNames):
+        self._names = names
+
+    async def create(self, *, model: str, config: Any = None):
+        name = f"cachedContents/replay-{self._names.fingerprint(config)[:16]}"
+        self._names.remember(name, config)
+        return types.CachedContent(name=name, model=model)
+
+    async def delete(self, *, name: str, **kwargs):
+        return None
+
+
+class _Aio:
+    def __init__(self, models, caches):
+        self.models = models
+        self.caches = caches
+
+
+class RecordingClient:
+    """실제 클라이언트 호출을 카세트에 기록하는 genai.Client 대체품."""
+
+    def __init__(self, client, cassette: Cassette):
+        names = _ContextCacheNames()
+        self.cassette = cassette
+        self.aio = _Aio(_RecordingModels(client.aio.models, cassette, names), _RecordingCaches(client.aio.caches, names))
+
+
+class ReplayClient:
+    """카세트에서 응답하는 genai.Client 대체품 (지연은 녹화 분포에서 샘플링)."""
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency_scale: float = 1.0,
+        strict: bool = False,
+        seed: Optional[int] = None,
+    ):
+        names = _ContextCacheNames()
+        self.cassette = cassette
+        self.aio = _Aio(
+            _ReplayModels(cassette, names, random.Random(seed), latency_scale, strict),
+            _ReplayCaches(names),
+        )
+
+
+def open_gemini_backend(client, mode: Optional[str] = None, path: Optional[str] = None):
+    """
+    설정(GEMINI_BACKEND)에 맞는 클라이언트 반환.
+
+    live는 전달받은 클라이언트를 그대로, record/replay는 카세트를 연 대체 클라이언트를 돌려준다.
+    """
+    mode = mode or settings.GEMINI_BACKEND
+    path = path or settings.GEMINI_CASSETTE_PATH
+    if mode == "live":
+        return client
+
+    cassette = Cassette.load(path)
+    if mode == "record":
+        logger.info(f"[GeminiBackend] 녹화 모드: {path} (기존 {cassette.size}건)")
+        return RecordingClient(client, cassette)
+    if mode == "replay":
+        if not cassette.size:
+            raise RuntimeError(f"재생할 카세트가 비어 있습니다: {path}")
+        logger.info(f"[GeminiBackend] 재생 모드: {path} ({cassette.size}건, 지연 배율 {settings.GEMINI_REPLAY_LATENCY_SCALE})")
+        return ReplayClient(
+            cassette,
+            latency_scale=settings.GEMINI_REPLAY_LATENCY_SCALE,
+            strict=settings.GEMINI_REPLAY_STRICT,
+            seed=settings.GEMINI_REPLAY_SEED,
+        )
+    raise ValueError(f"알 수 없는 GEMINI_BACKEND: {mode}")
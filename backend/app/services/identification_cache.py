@@ -0,0 +1,175 @@
+"""
+이미지 식별 결과 캐시 (2단계)
+- 1차: 프로세스 내 LRU + TTL (SHA-256 정확 일치 / dHash 유사 일치)
+- 2차: MongoDB 영구 캐시 (image_identification_cache 컬렉션)
+- 적중 시 Gemini 호출 없이 바로 DB 매칭 단계로 진행
+- 항목은 식별 설정(GEMINI_IDENTIFY_MODE / GEMINI_IDENTIFY_TOP_K)별로 구분한다
+  (설정이 바뀌면 이전 설정으로 만든 결과는 재사용하지 않음)
+"""
+import logging
+from typing import Optional
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.repositories.image_cache_repository import ImageCacheRepository
+from app.schemas.gemini import PlantIdentification
+from app.services.image_service import PreparedImage
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] %(levelname)s [%(name)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    logger.addHandler(handler)
+
+
+class ImageIdentificationCache:
+    """정규화 이미지 해시 기반 식별 결과 캐시"""
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        max_distance: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.enabled = settings.IMAGE_CACHE_ENABLED if enabled is None else enabled
+        self.ttl_seconds = ttl_seconds or settings.IMAGE_CACHE_TTL_SECONDS
+        # 식별 설정:sha256 → (dhash, 식별 설정, identified)
+        self._memory = TTLCache(maxsize or settings.IMAGE_CACHE_MAX_ENTRIES, self.ttl_seconds)
+        # 밴드 후보 조회가 보장되는 범위(0~7)로 제한
+        distance = settings.IMAGE_CACHE_MAX_DISTANCE if max_distance is None else max_distance
+        self.max_distance = max(0, min(distance, ImageCacheRepository.BAND_COUNT - 1))
+
+        self.exact_hits = 0
+        self.perceptual_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def variant() -> str:
+        """현재 식별 설정 (캐시 키 / 저장 문서에 포함)."""
+        return f"{settings.GEMINI_IDENTIFY_MODE}:top{settings.GEMINI_IDENTIFY_TOP_K}"
+
+    async def get(
+        self, prepared: PreparedImage, repo: Optional[ImageCacheRepository] = None
+    ) -> Optional[PlantIdentification]:
+        """
+        캐시 조회: 메모리 정확 → 메모리 유사 → MongoDB 정확 → MongoDB 유사.
+
+        Mongo 오류는 캐시 miss로 취급한다 (검색 자체는 계속 진행).
+        """
+        if not self.enabled or not prepared.processed:
+            return None
+        variant = self.variant()
+        key = f"{variant}:{prepared.sha256}"
+
+        # 1. 메모리: SHA-256 정확 일치
+        entry = self._memory.get(key)
+        if entry:
+            self.exact_hits += 1
+            return entry[2].model_copy()
+
+        # 2. 메모리: dHash 유사 일치
+        if prepared.dhash is not None:
+            identified = self._nearest_in_memory(prepared.dhash, variant)
+            if identified:
+                self._memory.set(key, (prepared.dhash, variant, identified))
+                self.perceptual_hits += 1
+                return identified.model_copy()
+
+        # 3. MongoDB 영구 캐시
+        if repo is not None:
+            identified = await self._get_persistent(prepared, variant, repo)
+            if identified:
+                self._memory.set(key, (prepared.dhash, variant, identified))
+                self.persistent_hits += 1
+                return identified.model_copy()
+
+        self.misses += 1
+        return None
+
+    async def set(
+        self,
+        prepared: PreparedImage,
+        identified: PlantIdentification,
+        repo: Optional[ImageCacheRepository] = None,
+    ) -> None:
+        """식별 결과 저장 (메모리 + MongoDB)."""
+        if not self.enabled or not prepared.processed:
+            return
+
+        variant = self.variant()
+        self._memory.set(f"{variant}:{prepared.sha256}", (prepared.dhash, variant, identified.model_copy()))
+        if repo is not None:
+            try:
+                await repo.upsert(
+                    prepared.sha256,
+                    prepared.dhash,
+                    identified.model_dump(by_alias=True, exclude_none=True),
+                    self.ttl_seconds,
+                    variant=variant,
+                )
+            except Exception as e:
+                logger.warning(f"[ImageIdentificationCache] 영구 캐시 저장 실패: {e}")
+
+    def _nearest_in_memory(self, dhash: int, variant: str) -> Optional[PlantIdentification]:
+        """메모리 캐시에서 같은 식별 설정 중 해밍 거리가 가장 가까운 항목 (허용치 이내)."""
+        best, best_distance = None, self.max_distance + 1
+        for _, (cached_hash, cached_variant, identified) in self._memory.items():
+            if cached_hash is None or cached_variant != variant:
+                continue
+            distance = (cached_hash ^ dhash).bit_count()
+            if distance < best_distance:
+                best, best_distance = identified, distance
+        return best
+
+    async def _get_persistent(
+        self, prepared: PreparedImage, variant: str, repo: ImageCacheRepository
+    ) -> Optional[PlantIdentification]:
+        """영구 캐시 조회 (저장된 문서는 camelCase dict → PlantIdentification으로 검증)."""
+        try:
+            doc = await repo.get_by_hash(prepared.sha256, variant)
+            if doc:
+                return PlantIdentification.model_validate(doc["identified"])
+
+            if prepared.dhash is None:
+                return None
+
+            best, best_distance = None, self.max_distance + 1
+            min_bands = ImageCacheRepository.BAND_COUNT - self.max_distance
+            for candidate in await repo.find_by_dhash_bands(prepared.dhash, variant, min_bands=min_bands):
+                distance = (int(candidate["dhash"], 16) ^ prepared.dhash).bit_count()
+                if distance < best_distance:
+                    best, best_distance = candidate["identified"], distance
+            return PlantIdentification.model_validate(best) if best else None
+        except Exception as e:
+            logger.warning(f"[ImageIdentificationCache] 영구 캐시 조회 실패: {e}")
+            return None
+
+    def clear(self) -> None:
+        """메모리 캐시 및 카운터 초기화."""
+        self._memory.clear()
+        self.exact_hits = self.perceptual_hits = self.persistent_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """캐시 적중 통계."""
+        hits = self.exact_hits + self.perceptual_hits + self.persistent_hits
+        total = hits + self.misses
+        return {
+            "size": len(self._memory),
+            "exactHits": self.exact_hits,
+            "perceptualHits": self.perceptual_hits,
+            "persistentHits": self.persistent_hits,
+            "misses": self.misses,
+            "hitRate": round(hits / total, 4) if total else 0.0,
+        }
+
+
+# 싱글톤 인스턴스 (메모리 캐시는 워커 프로세스 단위로 공유)
+image_identification_cache = ImageIdentificationCache()
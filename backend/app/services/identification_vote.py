@@ -0,0 +1,76 @@
+"""
+여러 장 사진 식별 결과 합치기 (학명 기준 가중 투표)
+
+같은 식물을 꽃 / 잎 / 전체 모습으로 나눠 찍은 사진들의 식별 결과를 하나로 합친다.
+- 표: 사진마다 후보별 신뢰도 (한 사진은 같은 학명에 1표만)
+- 합산 신뢰도: 학명별 신뢰도 합 / 전체 사진 수 (식별에 실패한 사진은 0표로 계산)
+"""
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.text import normalize_scientific_name, species_key
+from app.schemas.gemini import PlantCandidate, PlantIdentification
+
+
+def _vote_key(candidate: PlantCandidate) -> str:
+    """종 수준 학명 키 (저자명 / 종 이하 계급 무시, 학명이 없으면 이름으로 대체)."""
+    scientific_name = species_key(normalize_scientific_name(candidate.scientific_name or ""))
+    return scientific_name or f"name:{candidate.name}"
+
+
+def _candidates_of(identified: PlantIdentification) -> List[PlantCandidate]:
+    """후보 목록 (후보 없이 저장된 이전 캐시 항목은 대표 이름 1개, 신뢰도 미기재 시 1.0)."""
+    if identified.candidates:
+        return identified.candidates
+    return [PlantCandidate(
+        name=identified.name,
+        english_name=identified.english_name,
+        scientific_name=identified.scientific_name,
+        confidence=identified.confidence if identified.confidence is not None else 1.0,
+    )]
+
+
+def vote_identifications(
+    identifications: List[PlantIdentification], total_images: int
+) -> Tuple[Optional[PlantIdentification], int]:
+    """
+    사진별 식별 결과를 학명 기준 가중 투표로 합친다.
+
+    Returns:
+        (합산 식별 결과 또는 None, 1위 학명에 표를 준 사진 수)
+        합산 결과의 candidates는 합산 신뢰도 순 상위 GEMINI_IDENTIFY_TOP_K개.
+    """
+    scores: Dict[str, float] = defaultdict(float)
+    voters: Counter = Counter()
+    representative: Dict[str, PlantCandidate] = {}
+
+    for identified in identifications:
+        seen = set()
+        for candidate in _candidates_of(identified):
+            key = _vote_key(candidate)
+            if key in seen:
+                continue
+            seen.add(key)
+            scores[key] += candidate.confidence
+            voters[key] += 1
+            # 대표 이름은 가장 확신한 사진의 표기를 사용
+            if key not in representative or candidate.confidence > representative[key].confidence:
+                representative[key] = candidate
+
+    if not scores:
+        return None, 0
+
+    ranked = sorted(scores, key=lambda k: (scores[k], voters[k]), reverse=True)
+    merged = [
+        representative[k].model_copy(update={"confidence": round(scores[k] / max(total_images, 1), 4)})
+        for k in ranked[:max(1, settings.GEMINI_IDENTIFY_TOP_K)]
+    ]
+    best = merged[0]
+    return PlantIdentification(
+        name=best.name,
+        english_name=best.english_name,
+        scientific_name=best.scientific_name,
+        confidence=best.confidence,
+        candidates=merged,
+    ), voters[ranked[0]]
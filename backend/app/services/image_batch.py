@@ -0,0 +1,87 @@
+"""
+이미지 일괄 식별 입력 (multipart 여러 파일 / zip 압축 파일)
+- 입력 1건은 파일 이름 + 바이트를 읽는 load()로 표현한다.
+- 업로드 파일은 요청이 끝나도 남는 임시 파일(디스크)로 옮겨 두고, 파이프라인이 처리할 차례가 된 뒤에
+  워커 스레드에서 읽는다 / zip 항목도 같은 시점에 압축을 푼다
+  (동시에 메모리에 올라가는 이미지는 동시 처리 수만큼).
+"""
+import asyncio
+import os
+import shutil
+import tempfile
+import zipfile
+from contextlib import ExitStack
+from dataclasses import dataclass
+from functools import partial
+from typing import Awaitable, BinaryIO, Callable, List, Tuple
+
+# zip 안에서 이미지로 취급할 확장자
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".heic", ".heif"})
+
+
+@dataclass(frozen=True)
+class BatchImage:
+    """일괄 식별 입력 1건."""
+    filename: str
+    load: Callable[[], Awaitable[bytes]]
+
+
+def _read_all(file: BinaryIO) -> bytes:
+    file.seek(0)
+    return file.read()
+
+
+def file_images(files: List[Tuple[str, BinaryIO]]) -> List[BatchImage]:
+    """임시 파일에 보관한 업로드 파일들 → 입력 목록 (읽기는 load() 호출 시 워커 스레드에서)."""
+    return [BatchImage(filename, partial(asyncio.to_thread, _read_all, file)) for filename, file in files]
+
+
+async def spool(source: BinaryIO, stack: ExitStack) -> BinaryIO:
+    """
+    업로드 파일 핸들 → 요청 처리가 끝나도 남는 임시 파일 (stack을 닫을 때 삭제).
+
+    업로드 파일은 스트리밍 응답 본문이 시작되기 전에 닫히므로, 메모리로 읽지 않고 디스크끼리 복사해 둔다.
+    """
+    target = stack.enter_context(tempfile.TemporaryFile())
+
+    def copy() -> None:
+        source.seek(0)
+        shutil.copyfileobj(source, target)
+        target.seek(0)
+
+    await asyncio.to_thread(copy)
+    return target
+
+
+def _is_image_entry(info: zipfile.ZipInfo) -> bool:
+    """디렉터리 / 숨김 파일 / macOS 메타데이터(__MACOSX)는 제외."""
+    if info.is_dir():
+        return False
+    parts = info.filename.split("/")
+    if parts[0] == "__MACOSX" or any(p.startswith(".") for p in parts):
+        return False
+    return os.path.splitext(parts[-1])[1].lower() in IMAGE_EXTENSIONS
+
+
+def zip_images(file: BinaryIO, max_image_bytes: int) -> List[BatchImage]:
+    """
+    zip 파일 → 이미지 항목 입력 목록 (압축 해제는 load() 호출 시, 파일은 그때까지 열려 있어야 함).
+
+    Raises:
+        ValueError: zip이 아니거나, 해제 크기가 max_image_bytes를 넘는 항목이 있는 경우
+    """
+    try:
+        archive = zipfile.ZipFile(file)
+    except zipfile.BadZipFile:
+        raise ValueError("zip 파일을 열 수 없습니다.")
+
+    entries = [info for info in archive.infolist() if _is_image_entry(info)]
+    oversized = [info.filename for info in entries if info.file_size > max_image_bytes]
+    if oversized:
+        raise ValueError(f"이미지 1장은 최대 {max_image_bytes:,} bytes까지 가능합니다: {', '.join(oversized[:5])}")
+
+    # ZipFile은 항목 읽기마다 공유 파일 핸들을 잠그므로 여러 스레드에서 읽어도 안전하다
+    return [
+        BatchImage(info.filename, partial(asyncio.to_thread, archive.read, info))
+        for info in entries
+    ]
@@ -0,0 +1,43 @@
+"""
+이미지 검색 비동기 작업 실행 환경
+- image_search_workers: 식별 작업을 처리하는 bounded 워커 풀 (프로세스당 1개)
+- job_events: 단계 전환을 SSE 구독자에게 즉시 알리는 프로세스 내 알림
+  (다른 프로세스가 처리 중인 작업은 구독측이 IMAGE_JOB_POLL_SECONDS 간격으로 DB를 다시 읽는다)
+"""
+import asyncio
+from typing import Dict, Set
+
+from app.core.config import settings
+from app.core.worker_pool import WorkerPool
+
+
+class JobEvents:
+    """작업 ID별 단계 전환 알림 (asyncio 단일 스레드 전제)."""
+
+    def __init__(self):
+        self._waiters: Dict[str, Set[asyncio.Event]] = {}
+
+    def subscribe(self, job_id: str) -> asyncio.Event:
+        """다음 notify()에서 set될 이벤트 (상태를 읽기 전에 먼저 구독해야 알림을 놓치지 않음)."""
+        event = asyncio.Event()
+        self._waiters.setdefault(job_id, set()).add(event)
+        return event
+
+    def unsubscribe(self, job_id: str, event: asyncio.Event) -> None:
+        waiters = self._waiters.get(job_id)
+        if waiters is not None:
+            waiters.discard(event)
+            if not waiters:
+                del self._waiters[job_id]
+
+    def notify(self, job_id: str) -> None:
+        for event in self._waiters.pop(job_id, ()):
+            event.set()
+
+    def clear(self) -> None:
+        self._waiters.clear()
+
+
+# 싱글톤 인스턴스
+image_search_workers = WorkerPool("image-search", settings.IMAGE_JOB_WORKERS, settings.IMAGE_JOB_QUEUE_SIZE)
+job_events = JobEvents()
@@ -0,0 +1,194 @@
+"""
+이미지 전처리 서비스 (Vision 호출 전 정규화)
+- 업로드 이미지를 1회만 디코딩하고 EXIF 회전 적용
+- 메타데이터 제거 + 긴 변 기준 축소 + JPEG/WebP 재인코딩
+- CPU를 많이 쓰는 PIL 작업은 전용 스레드 풀에서 수행 (이벤트 루프 보호)
+- 캐시 키용 SHA-256 / 지각 해시(dHash)도 같은 워커에서 계산
+"""
+import asyncio
+import hashlib
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] %(levelname)s [%(name)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    logger.addHandler(handler)
+
+
+@dataclass(frozen=True)
+class PreparedImage:
+    """
+    Vision 호출에 그대로 넘길 수 있는 정규화된 이미지.
+
+    processed=False 이면 디코딩에 실패해 원본 바이트를 그대로 담은 상태
+    (예: PIL이 읽지 못하는 HEIC). 이 경우 width/height는 0이고 해시 값은 비어 있다.
+    """
+    data: bytes
+    mime_type: str
+    width: int
+    height: int
+    original_size: int
+    processed: bool = True
+    sha256: str = ""                    # 정규화된 바이트의 SHA-256 (hex)
+    dhash: Optional[int] = None         # 64bit 차분 해시 (유사 이미지 판별용)
+
+    def to_document(self) -> dict:
+        """MongoDB 저장용 dict (비동기 검색 작업에 보관)."""
+        return {
+            "data": self.data,
+            "mimeType": self.mime_type,
+            "width": self.width,
+            "height": self.height,
+            "originalSize": self.original_size,
+            "processed": self.processed,
+            "sha256": self.sha256,
+            "dhash": f"{self.dhash:016x}" if self.dhash is not None else None,
+        }
+
+    @classmethod
+    def from_document(cls, doc: dict) -> "PreparedImage":
+        """to_document() 결과 → PreparedImage."""
+        return cls(
+            data=bytes(doc["data"]),
+            mime_type=doc["mimeType"],
+            width=doc.get("width", 0),
+            height=doc.get("height", 0),
+            original_size=doc.get("originalSize", 0),
+            processed=doc.get("processed", True),
+            sha256=doc.get("sha256", ""),
+            dhash=int(doc["dhash"], 16) if doc.get("dhash") else None,
+        )
+
+
+class ImagePreprocessor:
+    """업로드 이미지를 Vision 입력용으로 정규화하는 전처리기"""
+
+    def __init__(
+        self,
+        max_edge: Optional[int] = None,
+        output_format: Optional[str] = None,
+        quality: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
+        self.max_edge = max_edge or settings.IMAGE_MAX_EDGE
+        self.output_format = (output_format or settings.IMAGE_OUTPUT_FORMAT).upper()
+        self.quality = quality or settings.IMAGE_OUTPUT_QUALITY
+        self.workers = workers or settings.IMAGE_PREPROCESS_WORKERS
+        # 첫 사용 시 생성, shutdown() 뒤에는 다시 만든다 (lifespan 재시작 대비)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="image-preprocess",
+            )
+        return self._executor
+
+    async def prepare(self, image_data: bytes) -> PreparedImage:
+        """
+        이미지 정규화 (스레드 풀에서 실행).
+
+        디코딩 실패 시 예외 대신 원본을 담은 PreparedImage(processed=False)를 반환한다.
+        스레드 풀 제출 실패(RuntimeError 등)는 원본 전달로 숨기지 않고 그대로 올린다.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_executor(), self._prepare_sync, image_data)
+        try:
+            prepared = await future
+        except Exception as e:
+            logger.warning(f"[ImagePreprocessor] 디코딩 실패, 원본 전달: {e}")
+            return PreparedImage(
+                data=image_data,
+                mime_type="image/jpeg",
+                width=0,
+                height=0,
+                original_size=len(image_data),
+                processed=False,
+            )
+
+        logger.debug(
+            f"[ImagePreprocessor] {len(image_data):,} → {len(prepared.data):,} bytes "
+            f"({prepared.width}x{prepared.height}, {prepared.mime_type})"
+        )
+        return prepared
+
+    def _prepare_sync(self, image_data: bytes) -> PreparedImage:
+        """디코딩 → EXIF 회전 → 축소 → 재인코딩 (동기, 워커 스레드 전용)."""
+        image = Image.open(io.BytesIO(image_data))
+
+        # JPEG는 디코딩 단계에서 1/2~1/8 스케일로 바로 읽어 픽셀 처리량을 줄인다
+        image.draft("RGB", (self.max_edge, self.max_edge))
+
+        # EXIF Orientation 적용 (이후 저장 시 EXIF는 포함하지 않으므로 메타데이터 제거)
+        image = ImageOps.exif_transpose(image)
+        image = self._to_rgb(image)
+        image.thumbnail((self.max_edge, self.max_edge), Image.Resampling.LANCZOS)
+
+        buffer = io.BytesIO()
+        image.save(buffer, format=self.output_format, quality=self.quality, optimize=True)
+        data = buffer.getvalue()
+
+        return PreparedImage(
+            data=data,
+            mime_type=f"image/{self.output_format.lower()}",
+            width=image.width,
+            height=image.height,
+            original_size=len(image_data),
+            sha256=hashlib.sha256(data).hexdigest(),
+            dhash=self.dhash(image),
+        )
+
+    @staticmethod
+    def dhash(image: Image.Image, hash_size: int = 8) -> int:
+        """
+        차분 해시(dHash) 계산.
+
+        (hash_size+1) x hash_size 흑백으로 줄인 뒤 가로로 인접한 픽셀의 밝기 대소를 비트로 기록한다.
+        같은 장면을 다시 찍은 사진은 해밍 거리가 작게 나온다.
+        """
+        small = image.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.BILINEAR)
+        pixels = small.tobytes()
+        value = 0
+        for row in range(hash_size):
+            offset = row * (hash_size + 1)
+            for col in range(hash_size):
+                value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+        return value
+
+    @staticmethod
+    def _to_rgb(image: Image.Image) -> Image.Image:
+        """투명도(알파) 채널은 흰 배경으로 합성해 RGB로 변환."""
+        if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+            rgba = image.convert("RGBA")
+            background = Image.new("RGB", rgba.size, (255, 255, 255))
+            background.paste(rgba, mask=rgba.getchannel("A"))
+            return background
+        if image.mode != "RGB":
+            return image.convert("RGB")
+        return image
+
+    def shutdown(self) -> None:
+        """워커 스레드 정리 (애플리케이션 종료 시). 이후 prepare()는 새 스레드 풀을 만든다."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+# 싱글톤 인스턴스
+image_preprocessor = ImagePreprocessor()
@@ -0,0 +1,219 @@
+"""
+추천 의도 분류기 (로컬 규칙 기반 빠른 경로)
+- 상황 텍스트를 꽃말 그룹(flowerInfo.flowerGroup) 중 하나로 분류
+- 키워드 사전 = 그룹별 기본 키워드 + 카탈로그의 꽃말(flowerInfo.language) / searchKeywords
+- 어절 단위 키워드 일치(조사 제거, 어미 허용) + 문자 bigram 겹침으로 점수를 매기고,
+  확신할 때만 결과를 반환 → 해당 그룹 인기 1위 식물을 Gemini 선정 호출 없이 추천
+"""
+import asyncio
+import logging
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+from app.core.config import settings
+from app.core.text import normalize_situation
+from app.repositories import PlantRepository
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] %(levelname)s [%(name)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    logger.addHandler(handler)
+
+# 카탈로그 키워드 분리 기준 (꽃말은 "영원한 사랑, 고백" 형태)
+_KEYWORD_SEPARATOR = re.compile(r"[,/·\s]+")
+
+# 상황 텍스트 어절 분리 기준
+_WORD_SEPARATOR = re.compile(r"[\W_]+")
+
+# 어절 끝에서 떼어 낼 조사 (긴 것부터 비교)
+_PARTICLES = (
+    "에게서", "에게", "한테", "께서", "에서", "으로", "이랑", "처럼", "까지", "부터", "보다",
+    "은", "는", "이", "가", "을", "를", "에", "와", "과", "의", "도", "로", "랑", "만", "께", "요",
+)
+
+# 키워드(어간) 바로 뒤에 와도 같은 단어로 보는 활용 어미 / 접사의 첫 부분
+# ("헤어진" / "고백하고" 는 일치, "헤어스타일" 은 다른 단어)
+_ENDING = re.compile(r"스러|스럽|스런|[하해했한할합히되된될돼됐어아여워웠었았진지져졌운울고는던게기면며서네죠요]")
+
+# 그룹별 기본 키워드 (활용형이 달라도 잡히도록 어간 위주)
+SEED_KEYWORDS: Dict[str, List[str]] = {
+    "사랑/고백": ["사랑", "고백", "연인", "여자친구", "남자친구", "애인", "짝사랑", "프러포즈", "프로포즈", "청혼", "설레", "기념일"],
+    "위로/슬픔": ["위로", "슬픔", "슬퍼", "우울", "힘들", "지쳐", "지친", "아프", "병문안", "장례", "조문", "외로"],
+    "감사/존경": ["감사", "고마", "고맙", "존경", "스승", "선생님", "은사", "부모님", "어버이", "은혜"],
+    "이별/그리움": ["이별", "헤어", "그리움", "그리워", "보고싶", "작별", "떠나", "추억", "송별"],
+    "행복/즐거움": ["행복", "기쁨", "기뻐", "즐거", "축하", "생일", "합격", "졸업", "입학", "개업", "집들이"],
+}
+
+# 부분 일치로 인정할 최소 bigram 겹침 비율 (3글자 이상 키워드에만 적용)
+_MIN_NGRAM_COVERAGE = 0.67
+
+
+def _bigrams(text: str) -> Set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+@dataclass(frozen=True)
+class IntentMatch:
+    """분류 결과."""
+    group: str
+    score: float                        # 1위 그룹 점수
+    confidence: float                   # 1위 점수 / 전체 그룹 점수 합 (0~1)
+
+
+class IntentClassifier:
+    """
+    꽃말 그룹 분류기 (프로세스 내 전용).
+
+    - 키워드가 여러 그룹에 걸쳐 있으면 가중치를 1/그룹 수로 낮춤 (변별력 없는 단어 억제)
+    - 3글자 이상 키워드는 bigram 겹침 비율만큼 부분 점수 (예: 꽃말 "변치않는사랑" ↔ "사랑이 변치 않는")
+    - 카탈로그에 식물이 있는 그룹만 후보로 사용하며 refresh_seconds 간격으로 사전을 다시 만든다
+    """
+
+    def __init__(
+        self,
+        min_score: Optional[float] = None,
+        confidence: Optional[float] = None,
+        refresh_seconds: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.enabled = settings.RECOMMEND_INTENT_ENABLED if enabled is None else enabled
+        self.min_score = settings.RECOMMEND_INTENT_MIN_SCORE if min_score is None else min_score
+        self.confidence = settings.RECOMMEND_INTENT_CONFIDENCE if confidence is None else confidence
+        self.refresh_seconds = settings.RECOMMEND_CATALOG_REFRESH_SECONDS if refresh_seconds is None else refresh_seconds
+
+        self._keywords: Dict[str, Dict[str, float]] = {}    # 그룹 → {키워드(공백 제거): 가중치}
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+        self.attempts = 0
+        self.hits = 0
+        self.group_hits: Counter = Counter()
+
+    async def classify(self, situation: str, plant_repo: PlantRepository) -> Optional[IntentMatch]:
+        """확신할 수 있는 그룹이 있으면 IntentMatch, 아니면 None (Gemini 경로 사용)."""
+        if not self.enabled:
+            return None
+
+        await self._ensure_lexicon(plant_repo)
+        self.attempts += 1
+
+        match = self.score(situation)
+        if match is None or match.score < self.min_score or match.confidence < self.confidence:
+            logger.debug(f"[IntentClassifier] 확신 부족: {match}")
+            return None
+
+        self.hits += 1
+        self.group_hits[match.group] += 1
+        return match
+
+    def score(self, situation: str) -> Optional[IntentMatch]:
+        """그룹별 점수 계산 (임계값 미적용)."""
+        normalized = normalize_situation(situation)
+        words = self._words(normalized)
+        grams = _bigrams(normalized.replace(" ", ""))
+
+        scores = {}
+        for group, keywords in self._keywords.items():
+            total = sum(weight * self._coverage(keyword, words, grams) for keyword, weight in keywords.items())
+            if total > 0:
+                scores[group] = total
+
+        if not scores:
+            return None
+
+        group, best = max(scores.items(), key=lambda item: item[1])
+        return IntentMatch(group=group, score=round(best, 3), confidence=round(best / sum(scores.values()), 3))
+
+    @staticmethod
+    def _words(normalized: str) -> Set[str]:
+        """어절 + 조사를 뗀 어절."""
+        words = set()
+        for word in _WORD_SEPARATOR.split(normalized):
+            if not word:
+                continue
+            words.add(word)
+            for particle in _PARTICLES:
+                if len(word) > len(particle) and word.endswith(particle):
+                    words.add(word[:-len(particle)])
+                    break
+        return words
+
+    @staticmethod
+    def _matches(keyword: str, word: str) -> bool:
+        """어절이 키워드 자체이거나 키워드(어간) + 활용 어미인지 (어절 중간 / 합성어 안은 불일치)."""
+        if word == keyword:
+            return True
+        return word.startswith(keyword) and _ENDING.match(word, len(keyword)) is not None
+
+    @classmethod
+    def _coverage(cls, keyword: str, words: Set[str], grams: Set[str]) -> float:
+        if any(cls._matches(keyword, word) for word in words):
+            return 1.0
+        if len(keyword) < 3:
+            return 0.0
+        keyword_grams = _bigrams(keyword)
+        coverage = len(keyword_grams & grams) / len(keyword_grams)
+        return coverage if coverage >= _MIN_NGRAM_COVERAGE else 0.0
+
+    async def _ensure_lexicon(self, plant_repo: PlantRepository) -> None:
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.refresh_seconds:
+            return
+        async with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.refresh_seconds:
+                return
+            plants = await plant_repo.get_for_intent_index()
+            self._keywords = self.build_lexicon(plants)
+            self._loaded_at = time.monotonic()
+            logger.info(f"[IntentClassifier] 키워드 사전 갱신: {', '.join(f'{g}({len(k)})' for g, k in self._keywords.items())}")
+
+    @staticmethod
+    def build_lexicon(plants: List[dict]) -> Dict[str, Dict[str, float]]:
+        """카탈로그 → 그룹별 키워드 가중치 (식물이 있는 그룹만)."""
+        raw: Dict[str, Set[str]] = {}
+        for plant in plants:
+            group = (plant.get("flowerInfo") or {}).get("flowerGroup")
+            if group not in SEED_KEYWORDS:
+                continue
+            keywords = raw.setdefault(group, set(SEED_KEYWORDS[group]))
+            phrases = [(plant.get("flowerInfo") or {}).get("language") or "", *(plant.get("searchKeywords") or [])]
+            for phrase in phrases:
+                keywords.update(w for w in _KEYWORD_SEPARATOR.split(phrase.lower()) if len(w) >= 2)
+
+        document_frequency = Counter(k for keywords in raw.values() for k in keywords)
+        return {
+            group: {k: 1.0 / document_frequency[k] for k in keywords}
+            for group, keywords in raw.items()
+        }
+
+    def clear(self) -> None:
+        """사전 및 카운터 초기화."""
+        self._keywords = {}
+        self._loaded_at = None
+        self.attempts = self.hits = 0
+        self.group_hits.clear()
+
+    def stats(self) -> dict:
+        """빠른 경로 적중 통계 (임계값 조정용)."""
+        return {
+            "enabled": self.enabled,
+            "minScore": self.min_score,
+            "confidence": self.confidence,
+            "attempts": self.attempts,
+            "hits": self.hits,
+            "hitRate": round(self.hits / self.attempts, 4) if self.attempts else 0.0,
+            "groups": dict(self.group_hits),
+        }
+
+
+# 싱글톤 인스턴스
+intent_classifier = IntentClassifier()
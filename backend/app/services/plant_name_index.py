@@ -0,0 +1,276 @@
+"""
+식물 이름 인덱스 (식별/추천 결과 → 카탈로그 _id, 프로세스 내)
+- 학명(저자명 / var. / subsp. 정규화) / 종 수준 학명 / 한글명 / 영문명 / 검색 키워드 / 속(genus) 키
+- 한글명 근사 일치: 자모 단위 편집 거리 색인 (띄어쓰기 / "꽃"·"나무" 접미사 / 음절 1개 차이)
+- Gemini가 돌려준 후보를 DB 왕복 없이 _id로 바꾼 뒤 get_by_id 1회만 조회한다
+- refresh_seconds 간격으로 다시 읽고, 내용 지문이 바뀐 경우에만 새 인덱스로 교체한다
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.fuzzy import DeletionIndex
+from app.core.text import decompose_hangul, normalize_name, normalize_scientific_name, species_key
+from app.repositories import PlantRepository
+from app.schemas.gemini import PlantName
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] %(levelname)s [%(name)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    logger.addHandler(handler)
+
+# 정확 일치 필드 (후보 하나에 대해 이 순서로 조회)
+EXACT_FIELDS = ("scientificName", "species", "name", "englishName", "keyword")
+
+# 근사 일치 전에 떼어 보는 한글명 접미사 ("장미꽃" ↔ "장미", "동백" ↔ "동백나무")
+NAME_SUFFIXES = ("나무", "꽃", "풀")
+
+
+@dataclass(frozen=True)
+class NameMatch:
+    """인덱스 조회 결과."""
+    plant_id: str
+    matched_by: str                     # EXACT_FIELDS 중 하나, "fuzzyName" 또는 "genus"
+    rank: int                           # 일치한 후보의 순위 (1부터)
+
+
+@dataclass
+class NameIndexSnapshot:
+    """정규화 키 → _id 사전 모음 (한 번 만들면 수정하지 않음)."""
+    keys: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    fuzzy: DeletionIndex = field(default_factory=lambda: DeletionIndex(0))     # 한글명 자모 키 → _id
+    genera: Dict[str, str] = field(default_factory=dict)                        # _id → 속 키 (근사 일치 검증용)
+    fingerprint: str = ""
+    size: int = 0
+
+
+class PlantNameIndex:
+    """
+    카탈로그 이름 인덱스 (프로세스 내 전용).
+
+    - 같은 키가 여러 식물에 걸리면: 이름/학명은 인기도 높은 식물, 검색 키워드는 변별력이 없으므로 제외
+    - 속 키는 그 속에서 인기도가 가장 높은 식물
+    - 근사 일치는 같은 거리면 인기도 높은 식물, 후보 학명의 속과 다른 식물이면 버림
+    """
+
+    def __init__(self, refresh_seconds: Optional[float] = None, enabled: Optional[bool] = None):
+        self.enabled = settings.PLANT_NAME_INDEX_ENABLED if enabled is None else enabled
+        self.refresh_seconds = settings.PLANT_NAME_INDEX_REFRESH_SECONDS if refresh_seconds is None else refresh_seconds
+        self._snapshot: Optional[NameIndexSnapshot] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self.reloads = 0
+        self.changes = 0
+        self.lookups = 0
+        self.hits: Counter = Counter()
+
+    async def resolve(self, candidates: Sequence[PlantName], plant_repo: PlantRepository) -> Optional[NameMatch]:
+        """
+        후보 목록(신뢰도 순) → 가장 신뢰도 높은 카탈로그 일치.
+
+        모든 후보의 정확 일치(학명 → 종 → 한글명 → 영문명 → 키워드)를 먼저 보고,
+        없으면 한글명 근사 일치, 그다음 속 일치.
+        """
+        snapshot = await self._ensure(plant_repo)
+        self.lookups += 1
+        match = self.lookup(snapshot, candidates)
+        self.hits[match.matched_by if match else "miss"] += 1
+        return match
+
+    @staticmethod
+    def lookup(snapshot: NameIndexSnapshot, candidates: Sequence[PlantName]) -> Optional[NameMatch]:
+        keyed = [_candidate_keys(c) for c in candidates]
+        for rank, keys in enumerate(keyed, 1):
+            for name in EXACT_FIELDS:
+                for key in keys[name]:
+                    plant_id = snapshot.keys[name].get(key)
+                    if plant_id:
+                        return NameMatch(plant_id, name, rank)
+
+        for rank, keys in enumerate(keyed, 1):
+            plant_id = _nearest_name(snapshot, keys)
+            if plant_id:
+                return NameMatch(plant_id, "fuzzyName", rank)
+
+        for rank, keys in enumerate(keyed, 1):
+            for key in keys["genus"]:
+                plant_id = snapshot.keys["genus"].get(key)
+                if plant_id:
+                    return NameMatch(plant_id, "genus", rank)
+        return None
+
+    def is_fresh(self) -> bool:
+        """refresh_seconds 안에 적재(또는 내용 확인)한 인덱스가 있는지 (무효화되면 False)."""
+        return self._snapshot is not None and time.monotonic() - self._loaded_at < self.refresh_seconds
+
+    async def _ensure(self, plant_repo: PlantRepository) -> NameIndexSnapshot:
+        if self.is_fresh():
+            return self._snapshot
+
+        async with self._lock:
+            if self.is_fresh():
+                return self._snapshot
+
+            plants = await plant_repo.get_for_name_index()
+            # 근사 일치 색인은 만드는 비용이 있으므로 내용이 바뀐 경우에만 다시 만든다
+            if self._snapshot is None or self.fingerprint(plants) != self._snapshot.fingerprint:
+                snapshot = await asyncio.to_thread(self.build, plants)
+                self.changes += 1
+                self._snapshot = snapshot
+                logger.info(
+                    f"[PlantNameIndex] 인덱스 갱신: {snapshot.size}종, "
+                    f"{', '.join(f'{k}({len(v)})' for k, v in snapshot.keys.items())}"
+                )
+            self._loaded_at = time.monotonic()
+            self.reloads += 1
+            return self._snapshot
+
+    async def load(self, plant_repo: PlantRepository) -> None:
+        """시작 시 미리 적재 (첫 요청이 DB 적재를 기다리지 않도록)."""
+        if self.enabled:
+            self.invalidate()
+            await self._ensure(plant_repo)
+
+    @staticmethod
+    def build(plants: List[dict]) -> NameIndexSnapshot:
+        """식물 문서(이름 필드만) → 인덱스."""
+        keys: Dict[str, Dict[str, str]] = {name: {} for name in (*EXACT_FIELDS, "genus")}
+        keyword_owners: Dict[str, set] = {}
+        fuzzy: DeletionIndex = DeletionIndex(settings.PLANT_NAME_FUZZY_MAX_DISTANCE)
+        genera: Dict[str, str] = {}
+
+        # 인기도 높은 식물이 먼저 키를 차지
+        ordered = sorted(plants, key=lambda p: (-(p.get("popularity_score") or 0), str(p["_id"])))
+        for plant in ordered:
+            plant_id = str(plant["_id"])
+            scientific = normalize_scientific_name(plant.get("scientificName") or "")
+            genus = normalize_name((plant.get("taxonomy") or {}).get("genus") or scientific.split(" ")[0])
+            entries = {
+                "scientificName": scientific if " " in scientific else "",
+                "species": species_key(scientific) if " " in scientific else "",
+                "name": normalize_name(plant.get("name") or ""),
+                "englishName": normalize_name(plant.get("englishName") or ""),
+                "genus": genus,
+            }
+            for name, key in entries.items():
+                if key:
+                    keys[name].setdefault(key, plant_id)
+            for key in _fuzzy_keys(entries["name"]):
+                fuzzy.add(key, plant_id)
+            genera[plant_id] = genus
+            for keyword in plant.get("searchKeywords") or []:
+                key = normalize_name(keyword)
+                if key:
+                    keyword_owners.setdefault(key, set()).add(plant_id)
+
+        keys["keyword"] = {k: next(iter(owners)) for k, owners in keyword_owners.items() if len(owners) == 1}
+        return NameIndexSnapshot(
+            keys=keys,
+            fuzzy=fuzzy,
+            genera=genera,
+            fingerprint=PlantNameIndex.fingerprint(plants),
+            size=len(plants),
+        )
+
+    @staticmethod
+    def fingerprint(plants: List[dict]) -> str:
+        """이름 필드의 내용 지문 (문서 순서 / 인기도 변화와 무관)."""
+        lines = sorted(
+            f"{p['_id']}|{p.get('name')}|{p.get('englishName')}|{p.get('scientificName')}|"
+            f"{(p.get('taxonomy') or {}).get('genus')}|{','.join(sorted(p.get('searchKeywords') or []))}"
+            for p in plants
+        )
+        return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+    def invalidate(self) -> None:
+        """다음 조회 때 DB에서 다시 읽도록 표시 (인덱스가 가리킨 식물이 없어진 경우 등)."""
+        self._loaded_at = 0.0
+
+    def clear(self) -> None:
+        self._snapshot = None
+        self._loaded_at = 0.0
+        # 이벤트 루프가 바뀌는 경우(테스트 등)를 위해 새 락으로 교체
+        self._lock = asyncio.Lock()
+        self.lookups = 0
+        self.hits.clear()
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "enabled": self.enabled,
+            "size": snapshot.size if snapshot else 0,
+            "keys": {k: len(v) for k, v in snapshot.keys.items()} if snapshot else {},
+            "fuzzyKeys": snapshot.fuzzy.size if snapshot else 0,
+            "fingerprint": snapshot.fingerprint[:12] if snapshot else None,
+            "reloads": self.reloads,
+            "changes": self.changes,
+            "lookups": self.lookups,
+            "hits": dict(self.hits),
+        }
+
+
+def _candidate_keys(candidate: PlantName) -> Dict[str, Tuple[str, ...]]:
+    """후보 1건의 필드별 조회 키 (한글명/영문명은 검색 키워드 사전에서도 찾음)."""
+    scientific = normalize_scientific_name(candidate.scientific_name or "")
+    binomial = " " in scientific
+    name = normalize_name(candidate.name or "")
+    english = normalize_name(candidate.english_name or "")
+    keys = {
+        "scientificName": (scientific,) if binomial else (),
+        "species": (species_key(scientific),) if binomial else (),
+        "name": (name,),
+        "englishName": (english,),
+        "keyword": (name, english),
+        "fuzzy": _fuzzy_keys(name),
+        "genus": (normalize_name(scientific.split(" ")[0]),) if scientific else (),
+    }
+    return {k: tuple(v for v in values if v) for k, values in keys.items()}
+
+
+def _fuzzy_keys(name_key: str) -> Tuple[str, ...]:
+    """정규화된 한글명 → 근사 일치용 자모 키 (접미사를 뗀 형태 포함)."""
+    if not name_key:
+        return ()
+    keys = [name_key]
+    for suffix in NAME_SUFFIXES:
+        if name_key.endswith(suffix) and len(name_key) - len(suffix) >= 2:
+            keys.append(name_key[:-len(suffix)])
+            break
+    return tuple(decompose_hangul(k) for k in keys)
+
+
+def _nearest_name(snapshot: NameIndexSnapshot, keys: Dict[str, Tuple[str, ...]]) -> Optional[str]:
+    """
+    후보 1건의 한글명과 가장 가까운 카탈로그 식물 _id.
+
+    허용 거리는 자모 5개당 1 (최대 PLANT_NAME_FUZZY_MAX_DISTANCE): 받침 없는 두 글자 이름은 정확 일치만 허용.
+    후보에 학명이 있으면 속이 같은 식물만 인정한다.
+    """
+    genus = keys["genus"][0] if keys["genus"] else None
+    best: Optional[Tuple[int, str]] = None
+    for key in keys["fuzzy"]:
+        budget = min(settings.PLANT_NAME_FUZZY_MAX_DISTANCE, len(key) // 5)
+        for distance, _, plant_id in snapshot.fuzzy.search(key, budget):
+            if best is not None and distance >= best[0]:
+                break
+            if genus and snapshot.genera.get(plant_id) not in (None, "", genus):
+                continue
+            best = (distance, plant_id)
+            break
+    return best[1] if best else None
+
+
+# 싱글톤 인스턴스
+plant_name_index = PlantNameIndex()
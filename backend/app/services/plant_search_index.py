@@ -0,0 +1,210 @@
+"""
+식물 키워드 검색 인덱스 (목록 API keyword 필터, 프로세스 내)
+- 한글명 / 검색 키워드 / 꽃말의 정규화 텍스트를 1~3글자 n-gram 역색인으로 보관
+- 질의어의 n-gram 게시 목록 교집합으로 후보를 좁힌 뒤 부분 문자열 일치를 확인하고 관련도 순으로 정렬
+  (한글명 일치 > 한글명 접두 > 한글명 포함 > 검색 키워드 > 꽃말)
+- refresh_seconds 간격으로 다시 읽고, 내용 지문이 바뀐 경우에만 새 인덱스로 교체한다
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.text import normalize_name
+from app.repositories import PlantRepository
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] %(levelname)s [%(name)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    logger.addHandler(handler)
+
+# 최대 n-gram 길이 (질의어가 길면 이 길이의 조각들로 후보를 좁힌다)
+MAX_GRAM = 3
+
+# 관련도 점수 (문서마다 가장 높은 항목 1개)
+SCORE_EXACT_NAME = 50
+SCORE_NAME_PREFIX = 40
+SCORE_NAME_CONTAINS = 30
+SCORE_KEYWORD_EXACT = 25
+SCORE_KEYWORD_CONTAINS = 20
+SCORE_FLOWER_LANGUAGE = 10
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    """검색 대상 식물 1개 (정규화 텍스트)."""
+    name: str
+    keywords: Tuple[str, ...]
+    language: str
+
+
+@dataclass
+class SearchIndexSnapshot:
+    """n-gram → _id 게시 목록 + 문서 (한 번 만들면 수정하지 않음)."""
+    documents: Dict[str, SearchDocument] = field(default_factory=dict)
+    postings: Dict[str, Set[str]] = field(default_factory=dict)
+    fingerprint: str = ""
+
+
+def _grams(text: str, size: int) -> Set[str]:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def relevance(document: SearchDocument, query: str) -> int:
+    """정규화된 질의어 기준 관련도 (일치하지 않으면 0)."""
+    if document.name == query:
+        return SCORE_EXACT_NAME
+    if document.name.startswith(query):
+        return SCORE_NAME_PREFIX
+    if query in document.name:
+        return SCORE_NAME_CONTAINS
+    if query in document.keywords:
+        return SCORE_KEYWORD_EXACT
+    if any(query in keyword for keyword in document.keywords):
+        return SCORE_KEYWORD_CONTAINS
+    if query in document.language:
+        return SCORE_FLOWER_LANGUAGE
+    return 0
+
+
+class PlantSearchIndex:
+    """
+    키워드 검색 역색인 (프로세스 내 전용).
+
+    - 조회 비용은 질의어 n-gram 게시 목록 크기에 비례 (카탈로그 전체를 훑지 않음)
+    - 입력은 정규식으로 쓰지 않으므로 특수문자를 그대로 검색해도 안전
+    """
+
+    def __init__(self, refresh_seconds: Optional[float] = None, enabled: Optional[bool] = None):
+        self.enabled = settings.PLANT_SEARCH_INDEX_ENABLED if enabled is None else enabled
+        self.refresh_seconds = (
+            settings.PLANT_SEARCH_INDEX_REFRESH_SECONDS if refresh_seconds is None else refresh_seconds
+        )
+        self._snapshot: Optional[SearchIndexSnapshot] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self.reloads = 0
+        self.changes = 0
+        self.searches = 0
+        self.candidates = 0
+
+    async def search(self, keyword: str, plant_repo: PlantRepository) -> List[Tuple[str, int]]:
+        """
+        키워드 → [(식물 _id, 관련도)] 관련도 높은 순 (같은 관련도는 _id 순).
+
+        전부 반환한다 (목록 필터를 적용하기 전에 자르면 필터에 맞는 하위 결과가 빠짐).
+        """
+        snapshot = await self._ensure(plant_repo)
+        self.searches += 1
+        return self.lookup(snapshot, keyword)
+
+    def lookup(self, snapshot: SearchIndexSnapshot, keyword: str) -> List[Tuple[str, int]]:
+        query = normalize_name(keyword)
+        if not query:
+            return []
+
+        # 가장 짧은 게시 목록부터 교집합
+        grams = sorted(_grams(query, min(MAX_GRAM, len(query))), key=lambda g: len(snapshot.postings.get(g, ())))
+        candidates: Optional[Set[str]] = None
+        for gram in grams:
+            posting = snapshot.postings.get(gram)
+            if not posting:
+                return []
+            candidates = set(posting) if candidates is None else candidates & posting
+            if not candidates:
+                return []
+        self.candidates += len(candidates)
+
+        scored = [(plant_id, relevance(snapshot.documents[plant_id], query)) for plant_id in candidates]
+        return sorted(((p, s) for p, s in scored if s), key=lambda item: (-item[1], item[0]))
+
+    async def _ensure(self, plant_repo: PlantRepository) -> SearchIndexSnapshot:
+        if self._snapshot is not None and time.monotonic() - self._loaded_at < self.refresh_seconds:
+            return self._snapshot
+
+        async with self._lock:
+            if self._snapshot is not None and time.monotonic() - self._loaded_at < self.refresh_seconds:
+                return self._snapshot
+
+            plants = await plant_repo.get_for_search_index()
+            fingerprint = self.fingerprint(plants)
+            if self._snapshot is None or fingerprint != self._snapshot.fingerprint:
+                self._snapshot = await asyncio.to_thread(self.build, plants)
+                self.changes += 1
+                logger.info(
+                    f"[PlantSearchIndex] 인덱스 갱신: {len(self._snapshot.documents)}종, "
+                    f"n-gram {len(self._snapshot.postings)}개"
+                )
+            self._loaded_at = time.monotonic()
+            self.reloads += 1
+            return self._snapshot
+
+    async def load(self, plant_repo: PlantRepository) -> None:
+        """시작 시 미리 적재 (첫 검색이 DB 적재를 기다리지 않도록)."""
+        if self.enabled:
+            self._loaded_at = 0.0
+            await self._ensure(plant_repo)
+
+    @staticmethod
+    def build(plants: List[dict]) -> SearchIndexSnapshot:
+        """식물 문서(검색 필드만) → 인덱스."""
+        documents: Dict[str, SearchDocument] = {}
+        postings: Dict[str, Set[str]] = {}
+        for plant in plants:
+            plant_id = str(plant["_id"])
+            document = SearchDocument(
+                name=normalize_name(plant.get("name") or ""),
+                keywords=tuple(k for k in (normalize_name(k) for k in plant.get("searchKeywords") or []) if k),
+                language=normalize_name((plant.get("flowerInfo") or {}).get("language") or ""),
+            )
+            documents[plant_id] = document
+            for text in (document.name, document.language, *document.keywords):
+                for size in range(1, MAX_GRAM + 1):
+                    for gram in _grams(text, size):
+                        postings.setdefault(gram, set()).add(plant_id)
+
+        return SearchIndexSnapshot(documents=documents, postings=postings, fingerprint=PlantSearchIndex.fingerprint(plants))
+
+    @staticmethod
+    def fingerprint(plants: List[dict]) -> str:
+        """검색 필드의 내용 지문 (문서 순서와 무관)."""
+        lines = sorted(
+            f"{p['_id']}|{p.get('name')}|{(p.get('flowerInfo') or {}).get('language')}|"
+            f"{','.join(p.get('searchKeywords') or [])}"
+            for p in plants
+        )
+        return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+    def clear(self) -> None:
+        self._snapshot = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self.searches = 0
+        self.candidates = 0
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "enabled": self.enabled,
+            "size": len(snapshot.documents) if snapshot else 0,
+            "grams": len(snapshot.postings) if snapshot else 0,
+            "fingerprint": snapshot.fingerprint[:12] if snapshot else None,
+            "reloads": self.reloads,
+            "changes": self.changes,
+            "searches": self.searches,
+            "avgCandidates": round(self.candidates / self.searches, 2) if self.searches else None,
+        }
+
+
+# 싱글톤 인스턴스
+plant_search_index = PlantSearchIndex()
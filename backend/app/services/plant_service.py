@@ -3,12 +3,39 @@
 - 디버그 로깅 포함
 - DB-only 모드: 식물 데이터는 사전 큐레이션된 DB에서만 조회
 """
+import asyncio
 import logging
 from datetime import datetime
-from typing import List, Optional
-
-from app.repositories import PlantRepository, UserRepository
-from app.services.gemini_service import GeminiService, gemini_service
+from functools import partial
+from itertools import groupby
+from typing import AsyncIterator, Iterable, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from app.core.config import settings
+from app.core.metrics import CallMetrics
+from app.core.text import normalize_scientific_name, species_key
+from app.repositories import (
+    PlantRepository,
+    UserRepository,
+    ImageCacheRepository,
+    RecommendationCacheRepository,
+    ImageSearchJobRepository,
+    PlantSynonymRepository,
+)
+from app.core.worker_pool import WorkerPool
+from app.schemas.gemini import PlantIdentification, PlantName
+from app.services.gemini_service import GeminiService, gemini_service, ESSAY_FALLBACK_TEXT
+from app.services.identification_cache import ImageIdentificationCache, image_identification_cache
+from app.services.identification_vote import vote_identifications
+from app.services.image_batch import BatchImage
+from app.services.image_search_jobs import JobEvents, image_search_workers, job_events
+from app.services.image_service import ImagePreprocessor, PreparedImage, image_preprocessor
+from app.services.intent_classifier import IntentClassifier, intent_classifier
+from app.services.plant_name_index import EXACT_FIELDS, PlantNameIndex, plant_name_index
+from app.services.plant_search_index import PlantSearchIndex, plant_search_index
+from app.services.recommendation_cache import RecommendationCache, recommendation_cache
+from app.services.recommendation_catalog import RecommendationCatalog, recommendation_catalog
+from app.services.semantic_cache import SemanticRecommendationCache, semantic_recommendation_cache
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -24,6 +51,35 @@ if not logger.handlers:
     logger.addHandler(handler)
 
 
+def _best_candidate_match(candidates: List[PlantName], plants: List[dict]) -> Tuple[Optional[dict], str]:
+    """
+    후보 목록(신뢰도 순)과 조회된 식물들 중 가장 신뢰도 높은 매칭 선택.
+
+    Returns:
+        (식물 또는 None, 매칭 방식: rank{n} | genus | miss)
+    """
+    by_scientific_name = {p.get("scientificName"): p for p in plants if p.get("scientificName")}
+    by_name = {p.get("name"): p for p in plants if p.get("name")}
+
+    # 정확 일치: 학명 → 이름 (후보 순위 우선)
+    for rank, candidate in enumerate(candidates, 1):
+        scientific_name = (candidate.scientific_name or "").strip()
+        plant = by_scientific_name.get(scientific_name) or by_name.get(candidate.name)
+        if plant:
+            return plant, f"rank{rank}"
+
+    # 학명 퍼지 매칭 (속 기준, 후보 순위 우선)
+    for candidate in candidates:
+        words = (candidate.scientific_name or "").split()
+        if not words:
+            continue
+        genus = words[0].lower()
+        for plant in plants:
+            if (plant.get("scientificName") or "").lower().startswith(genus):
+                return plant, "genus"
+    return None, "miss"
+
+
 class PlantService:
     """
     식물 비즈니스 로직 담당 (Service Layer)
@@ -34,11 +90,43 @@ class PlantService:
         plant_repo: PlantRepository,
         user_repo: UserRepository,
         gemini_svc: GeminiService = None,
+        preprocessor: ImagePreprocessor = None,
+        image_cache: ImageIdentificationCache = None,
+        image_cache_repo: Optional[ImageCacheRepository] = None,
+        recommendation_cache_svc: RecommendationCache = None,
+        recommendation_cache_repo: Optional[RecommendationCacheRepository] = None,
+        semantic_cache: SemanticRecommendationCache = None,
+        catalog: RecommendationCatalog = None,
+        intent: IntentClassifier = None,
+        search_job_repo: Optional[ImageSearchJobRepository] = None,
+        job_workers: WorkerPool = None,
+        job_events_svc: JobEvents = None,
+        stage_metrics: CallMetrics = None,
+        name_index: PlantNameIndex = None,
+        synonym_repo: Optional[PlantSynonymRepository] = None,
+        search_index: PlantSearchIndex = None,
     ):
         self.plant_repo = plant_repo
         self.user_repo = user_repo
         # 싱글톤 인스턴스 사용 (메모리 효율적)
         self.gemini = gemini_svc or gemini_service
+        self.preprocessor = preprocessor or image_preprocessor
+        self.image_cache = image_cache or image_identification_cache
+        self.recommendation_cache = recommendation_cache_svc or recommendation_cache
+        self.semantic_cache = semantic_cache or semantic_recommendation_cache
+        self.catalog = catalog or recommendation_catalog
+        self.intent = intent or intent_classifier
+        self.job_workers = job_workers or image_search_workers
+        self.job_events = job_events_svc or job_events
+        self.stage_metrics = stage_metrics or plant_stage_metrics
+        self.name_index = name_index or plant_name_index
+        self.search_index = search_index or plant_search_index
+        # 영구 캐시(2차)는 DB가 주입된 경우에만 사용
+        self.image_cache_repo = image_cache_repo
+        self.recommendation_cache_repo = recommendation_cache_repo
+        self.search_job_repo = search_job_repo
+        # 학명 이명 테이블도 DB가 주입된 경우에만 사용
+        self.synonym_repo = synonym_repo
 
     # =========================================================
     # 1. 이미지 기반 검색 (DB-only 모드)
@@ -48,7 +136,8 @@ class PlantService:
         이미지로 식물 검색 (DB-only 모드).
 
         [흐름]
-        1. Gemini로 이미지에서 식물 식별
+        0. 이미지 전처리 (EXIF 회전, 축소, 재인코딩)
+        1. 식별 캐시 조회 → miss일 때만 Gemini로 이미지에서 식물 식별
         2. DB 조회 (학명 정확 → 이름 정확 → 학명 퍼지)
         3. 없으면 에러 반환
         """
@@ -58,63 +147,397 @@ class PlantService:
         logger.info(f"   - 이미지 크기: {len(image_data):,} bytes")
         logger.info(f"   - user_id: {user_id or 'Anonymous'}")
 
-        # 1. Gemini: 이미지에서 식물 이름 및 학명 추출
-        logger.debug("[Step 1] Gemini 식물 식별 호출...")
-        identified = await self.gemini.get_plant_name_from_image(image_data)
+        with self.stage_metrics.timer("search_by_image"):
+            # 0. 전처리: 디코딩 1회 + 축소/재인코딩 (워커 스레드에서 수행)
+            with self.stage_metrics.timer("search_by_image.preprocess"):
+                prepared = await self.preprocessor.prepare(image_data)
+            logger.info(f"[Step 0 완료] 전처리: {prepared.original_size:,} → {len(prepared.data):,} bytes")
+
+            # 1. 식별 (캐시 → Gemini) / 2. DB 조회
+            with self.stage_metrics.timer("search_by_image.identify"):
+                identified = await self.identify_prepared(prepared)
+            with self.stage_metrics.timer("search_by_image.match"):
+                plant_in_db = await self.match_identified(identified)
+            result = await self._search_result(plant_in_db, user_id, identified.confidence)
+
+        elapsed = (datetime.now() - start_time).total_seconds()
+        logger.info(f"[search_by_image 완료] 기존 데이터 반환 (소요시간: {elapsed:.2f}초)")
+        logger.info("=" * 50)
+        return result
+
+    async def search_by_images(self, images: List[bytes], user_id: Optional[str] = None) -> dict:
+        """
+        같은 식물을 여러 장 찍은 사진으로 검색.
+
+        [흐름]
+        1. 사진마다 전처리 + 식별을 동시에 수행 (식별 실패한 사진은 기권)
+        2. 학명 기준 가중 투표로 하나의 식별 결과와 합산 신뢰도 산출
+        3. 투표 후보 전체로 DB 조회 (match_identified)
+
+        Raises:
+            ValueError: 어느 사진에서도 식물을 식별할 수 없거나 DB에 없는 경우
+        """
+        if len(images) == 1:
+            return await self.search_by_image(images[0], user_id)
+
+        start_time = datetime.now()
+        logger.info("=" * 50)
+        logger.info(f"[search_by_images] 이미지 {len(images)}장 검색 시작")
+
+        with self.stage_metrics.timer("search_by_images"):
+            with self.stage_metrics.timer("search_by_images.identify"):
+                outcomes = await asyncio.gather(
+                    *(self._identify_upload(data) for data in images), return_exceptions=True
+                )
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException) and not isinstance(outcome, ValueError):
+                    raise outcome
+            identifications = [o for o in outcomes if isinstance(o, PlantIdentification)]
+            logger.info(f"[Step 1 완료] 식별 성공 {len(identifications)}/{len(images)}장")
+
+            identified, votes = vote_identifications(identifications, len(images))
+            if not identified:
+                logger.warning("[실패] 어느 사진에서도 식물을 식별할 수 없음")
+                raise ValueError("식물을 식별할 수 없습니다.")
+            logger.info(f"[투표 결과] {identified.scientific_name} (신뢰도 {identified.confidence}, {votes}표)")
+
+            with self.stage_metrics.timer("search_by_images.match"):
+                plant_in_db = await self.match_identified(identified)
+            result = await self._search_result(plant_in_db, user_id, identified.confidence)
+            result["image_votes"] = votes
+
+        elapsed = (datetime.now() - start_time).total_seconds()
+        logger.info(f"[search_by_images 완료] 소요시간: {elapsed:.2f}초")
+        logger.info("=" * 50)
+        return result
+
+    async def _identify_upload(self, image_data: bytes) -> PlantIdentification:
+        """업로드 1장: 전처리 → 식별 (여러 장 검색에서 사진별로 동시 실행)."""
+        prepared = await self.preprocessor.prepare(image_data)
+        return await self.identify_prepared(prepared)
+
+    async def identify_prepared(self, prepared: PreparedImage) -> PlantIdentification:
+        """
+        이미지 검색 1단계: 식별 캐시 조회 → miss일 때만 Gemini로 식별.
+
+        Raises:
+            ValueError: 식물을 식별할 수 없는 경우
+        """
+        # 1. 식별 캐시 (같은/유사 사진이면 Gemini 생략)
+        identified = await self.image_cache.get(prepared, self.image_cache_repo)
+        if identified:
+            logger.info(f"[Step 1 완료] 캐시 적중: {identified}")
+        else:
+            # Gemini: 이미지에서 식물 이름 및 학명 추출
+            logger.debug("[Step 1] Gemini 식물 식별 호출...")
+            identified = await self.gemini.get_plant_name_from_image(prepared.data, mime_type=prepared.mime_type)
+
+            logger.info(f"[Step 1 완료] Gemini 식별 결과: {identified}")
 
-        logger.info(f"[Step 1 완료] Gemini 식별 결과: {identified}")
+            if identified:
+                await self.image_cache.set(prepared, identified, self.image_cache_repo)
 
-        if not identified or not identified.get("name"):
+        if not identified:
             logger.warning("[실패] 식물을 식별할 수 없음")
             raise ValueError("식물을 식별할 수 없습니다.")
+        return identified
 
-        target_name = identified["name"]
-        target_scientific_name = identified.get("scientificName", "").strip()
-        target_english_name = identified.get("englishName", "")
+    async def match_identified(self, identified: PlantIdentification) -> dict:
+        """
+        이미지 검색 2단계: 식별 후보 전체를 DB 1회 조회로 매칭.
 
-        logger.info(f"   - 식별된 이름: {target_name}")
-        logger.info(f"   - 학명: {target_scientific_name}")
-        logger.info(f"   - 영문명: {target_english_name}")
+        신뢰도 순으로 학명/이름 정확 일치를 먼저 찾고, 없으면 학명 속(genus) 일치로 대체한다.
+        (1위 후보가 카탈로그에 없어도 차순위 후보가 정확히 있으면 그 식물을 반환)
 
-        # 2. DB 조회 (3단계: 학명 정확 → 이름 정확 → 학명 퍼지)
+        Raises:
+            ValueError: DB에 해당 식물이 없는 경우
+        """
+        candidates = identified.candidates or [identified]
+        for rank, candidate in enumerate(candidates, 1):
+            logger.info(
+                f"   - 후보 {rank}: {candidate.name} / {candidate.scientific_name} / "
+                f"{candidate.english_name} (신뢰도 {getattr(candidate, 'confidence', None)})"
+            )
+
+        # 2. DB 조회 (이름 인덱스 → get_by_id 1회, 인덱스 미스 시 후보 전체 1회 조회)
         logger.debug("[Step 2] DB 조회 시작...")
-        plant_in_db = None
+        plant_in_db, matched_by = await self._resolve_candidates(candidates)
+        self.stage_metrics.get("search_by_image.match_rank").record(matched_by)
 
-        # 2-1. 학명 정확 일치
-        if target_scientific_name:
-            logger.debug(f"   - [1차] 학명 정확 일치 조회: {target_scientific_name}")
-            plant_in_db = await self.plant_repo.get_by_scientific_name(target_scientific_name)
-
-        # 2-2. 이름 정확 일치
+        # 3. DB에 없으면 에러 반환
         if not plant_in_db:
-            logger.debug(f"   - [2차] 이름 정확 일치 조회: {target_name}")
-            plant_in_db = await self.plant_repo.get_by_name(target_name)
+            logger.warning(f"[실패] '{identified.name}' ({identified.scientific_name}) - DB에 해당 식물 정보 없음")
+            raise ValueError(f"'{identified.name}'에 대한 정보가 데이터베이스에 없습니다.")
 
-        # 2-3. 학명 퍼지 매칭 (속 기준)
-        if not plant_in_db and target_scientific_name:
-            logger.debug(f"   - [3차] 학명 퍼지 매칭 조회: {target_scientific_name}")
-            plant_in_db = await self.plant_repo.find_by_scientific_name_fuzzy(target_scientific_name)
+        logger.info(f"[Step 2 완료] DB에서 발견: {plant_in_db.get('_id')} ({matched_by})")
+        return plant_in_db
 
-        # 3. DB에 존재하면 반환
+    async def _resolve_candidates(self, candidates: List[PlantName]) -> Tuple[Optional[dict], str]:
+        """
+        후보 목록(신뢰도 순) → 카탈로그 식물.
+
+        우선순위: 정확 일치 → 학명 이명 테이블 → 근사/속 일치
+        - 이름 인덱스가 _id를 찾으면 get_by_id 1회로 끝낸다.
+        - 이명 테이블은 정확 일치가 없을 때 후보 전체를 인덱스 조회 1회로 확인한다.
+        - 인덱스가 꺼져 있거나 최신이 아니면(가리킨 식물이 삭제되어 무효화된 경우 등) 후보 전체를 DB 1회 조회로 확인한다.
+          최신 인덱스에 없는 후보는 카탈로그에도 없는 것으로 보고 DB를 다시 조회하지 않는다
+          (갱신 전에 추가된 식물은 최대 PLANT_NAME_INDEX_REFRESH_SECONDS 뒤부터 매칭).
+
+        Returns:
+            (식물 또는 None, 매칭 방식: rank{n} | synonym | genus | miss)
+        """
+        match = None
+        if self.name_index.enabled:
+            match = await self.name_index.resolve(candidates, self.plant_repo)
+            if match and match.matched_by in EXACT_FIELDS:
+                plant_in_db = await self._get_indexed(match.plant_id)
+                if plant_in_db:
+                    logger.debug(f"   - 이름 인덱스 일치: {match}")
+                    return plant_in_db, f"rank{match.rank}"
+                match = None
+
+        plant_in_db = await self._resolve_synonyms(candidates)
         if plant_in_db:
-            logger.info(f"[Step 2 완료] DB에서 발견: {plant_in_db.get('_id')}")
-            is_fav = False
-            if user_id:
-                favorites = await self.user_repo.get_favorites(user_id)
-                is_fav = str(plant_in_db["_id"]) in favorites
+            return plant_in_db, "synonym"
 
-            result = plant_in_db.copy()
-            result["is_newly_created"] = False
-            result["is_favorite"] = is_fav
+        if match:
+            plant_in_db = await self._get_indexed(match.plant_id)
+            if plant_in_db:
+                logger.debug(f"   - 이름 인덱스 일치: {match}")
+                return plant_in_db, "genus" if match.matched_by == "genus" else f"rank{match.rank}"
 
+        if self.name_index.enabled and self.name_index.is_fresh():
+            return None, "miss"
+
+        scientific_names = [(c.scientific_name or "").strip() for c in candidates]
+        plants = await self.plant_repo.find_by_candidates(
+            [s for s in scientific_names if s], [c.name for c in candidates if c.name]
+        )
+        return _best_candidate_match(candidates, plants)
+
+    async def _get_indexed(self, plant_id: str) -> Optional[dict]:
+        """이름 인덱스가 가리킨 식물 조회 (삭제된 경우 다음 조회 때 인덱스를 다시 적재)."""
+        plant_in_db = await self.plant_repo.get_by_id(plant_id)
+        if not plant_in_db:
+            self.name_index.invalidate()
+        return plant_in_db
+
+    async def _resolve_synonyms(self, candidates: List[PlantName]) -> Optional[dict]:
+        """후보 학명(정규화 키 → 종 수준 키)을 이명 테이블에서 한 번에 조회, 후보 순위가 높은 쪽 우선."""
+        if not self.synonym_repo:
+            return None
+        keys: List[str] = []
+        for candidate in candidates:
+            scientific = normalize_scientific_name(candidate.scientific_name or "")
+            if " " in scientific:
+                keys += [k for k in (scientific, species_key(scientific)) if k not in keys]
+        found = await self.synonym_repo.find_by_aliases(keys)
+        for key in keys:
+            if key in found:
+                logger.debug(f"   - 학명 이명 일치: {key} → {found[key]}")
+                return await self.plant_repo.get_by_id(found[key])
+        return None
+
+    async def _search_result(
+        self, plant_in_db: dict, user_id: Optional[str], confidence: Optional[float] = None
+    ) -> dict:
+        """검색 결과 응답 형태로 변환 (찜 여부 + 식별 신뢰도 포함)."""
+        is_fav = False
+        if user_id:
+            favorites = await self.user_repo.get_favorites(user_id)
+            is_fav = str(plant_in_db["_id"]) in favorites
+
+        result = plant_in_db.copy()
+        result["is_newly_created"] = False
+        result["is_favorite"] = is_fav
+        result["confidence"] = confidence
+        return result
+
+    # =========================================================
+    # 1-1. 이미지 기반 검색 (비동기 작업: 접수 → 워커 풀 처리 → 폴링/SSE)
+    # =========================================================
+    async def submit_image_search_job(self, image_data: bytes, user_id: Optional[str] = None) -> dict:
+        """
+        전처리한 이미지를 작업으로 저장하고 바로 반환 (식별/매칭은 워커 풀에서 수행).
+
+        Raises:
+            asyncio.QueueFull: 대기열이 가득 찬 경우 (작업은 failed로 기록)
+        """
+        prepared = await self.preprocessor.prepare(image_data)
+        job = await self.search_job_repo.create(
+            uuid4().hex, prepared.to_document(), user_id, settings.IMAGE_JOB_TTL_SECONDS
+        )
+        logger.info(f"[submit_image_search_job] 작업 접수: {job['_id']} ({len(prepared.data):,} bytes)")
+
+        try:
+            self.job_workers.submit(partial(self.run_image_search_job, job["_id"]))
+        except asyncio.QueueFull:
+            logger.warning(f"[submit_image_search_job] 대기열 가득 참: {job['_id']}")
+            await self._advance_job(job["_id"], ImageSearchJobRepository.STAGE_FAILED, error="요청이 많아 검색을 시작하지 못했습니다.")
+            raise
+        return job
+
+    async def run_image_search_job(self, job_id: str) -> None:
+        """워커 풀에서 실행: received → identified → matched (실패 시 failed)."""
+        doc = await self.search_job_repo.claim(job_id, settings.IMAGE_JOB_LEASE_SECONDS)
+        if not doc:
+            logger.debug(f"[run_image_search_job] 이미 처리 중이거나 없는 작업: {job_id}")
+            return
+
+        try:
+            identified = await self.identify_prepared(PreparedImage.from_document(doc["image"]))
+            await self._advance_job(
+                job_id,
+                ImageSearchJobRepository.STAGE_IDENTIFIED,
+                identified=identified.model_dump(by_alias=True, exclude_none=True),
+            )
+
+            plant_in_db = await self.match_identified(identified)
+            result = await self._search_result(plant_in_db, doc.get("userId"), identified.confidence)
+            await self._advance_job(job_id, ImageSearchJobRepository.STAGE_MATCHED, result=result)
+            logger.info(f"[run_image_search_job 완료] {job_id} → {plant_in_db.get('_id')}")
+        except asyncio.CancelledError:
+            # 종료 중 취소: 선점을 풀어 두어야 재시작 후 resume_image_search_jobs가 다시 가져간다
+            logger.warning(f"[run_image_search_job] 처리 중 취소, 선점 해제: {job_id}")
+            try:
+                await self.search_job_repo.release(job_id)
+            except Exception as e:
+                logger.error(f"[run_image_search_job] 선점 해제 실패 ({job_id}): {e}")
+            raise
+        except ValueError as e:
+            await self._advance_job(job_id, ImageSearchJobRepository.STAGE_FAILED, error=str(e))
+        except Exception as e:
+            logger.error(f"[run_image_search_job] 처리 오류 ({job_id}): {e}")
+            await self._advance_job(job_id, ImageSearchJobRepository.STAGE_FAILED, error="이미지 검색 중 오류가 발생했습니다.")
+
+    async def _advance_job(self, job_id: str, stage: str, **fields) -> None:
+        await self.search_job_repo.update_stage(job_id, stage, **fields)
+        self.job_events.notify(job_id)
+
+    async def get_image_search_job(self, job_id: str) -> Optional[dict]:
+        """작업 상태 조회 (없거나 만료되면 None)."""
+        return await self.search_job_repo.get(job_id)
+
+    async def watch_image_search_job(self, job_id: str) -> AsyncIterator[dict]:
+        """
+        단계가 바뀔 때마다 작업 문서를 내보냄 (SSE 엔드포인트용).
+
+        같은 프로세스의 단계 전환은 즉시 알림을 받고, 그 외에는 IMAGE_JOB_POLL_SECONDS 간격으로 다시 읽는다.
+        종료 단계에 도달하거나 IMAGE_JOB_STREAM_TIMEOUT_SECONDS가 지나면 끝난다.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.IMAGE_JOB_STREAM_TIMEOUT_SECONDS
+        last_stage = None
+
+        while True:
+            event = self.job_events.subscribe(job_id)
+            try:
+                job = await self.search_job_repo.get(job_id)
+                if job is None:
+                    return
+                if job["stage"] != last_stage:
+                    last_stage = job["stage"]
+                    yield job
+                if last_stage in ImageSearchJobRepository.TERMINAL_STAGES:
+                    return
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                try:
+                    await asyncio.wait_for(event.wait(), min(settings.IMAGE_JOB_POLL_SECONDS, remaining))
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                self.job_events.unsubscribe(job_id, event)
+
+    async def resume_image_search_jobs(self) -> int:
+        """
+        재시작 등으로 처리되지 못한 작업을 워커 풀에 다시 등록 (등록한 개수 반환).
+
+        선점된 채 IMAGE_JOB_LEASE_SECONDS 동안 진행이 없는 작업(강제 종료된 워커)도 포함한다.
+        """
+        resumed = 0
+        job_ids = await self.search_job_repo.find_resumable_ids(
+            settings.IMAGE_JOB_LEASE_SECONDS, limit=self.job_workers.queue_size
+        )
+        for job_id in job_ids:
+            try:
+                self.job_workers.submit(partial(self.run_image_search_job, job_id))
+            except asyncio.QueueFull:
+                break
+            resumed += 1
+        if resumed:
+            logger.info(f"[resume_image_search_jobs] 미처리 작업 {resumed}건 재등록")
+        return resumed
+
+    # =========================================================
+    # 1-2. 이미지 일괄 식별 (큐레이션용: 처리가 끝난 순서대로 결과 전달)
+    # =========================================================
+    async def identify_image_batch(
+        self, images: Iterable[BatchImage], concurrency: Optional[int] = None
+    ) -> AsyncIterator[dict]:
+        """
+        여러 이미지를 동시 처리 수 제한 안에서 전처리 → 식별 → DB 매칭.
+
+        입력은 처리할 차례가 된 때에만 읽고(load), 결과는 끝나는 순서대로 1건씩 yield 한다.
+        이미지별 실패는 결과의 status로 전달하고 예외로 중단하지 않는다.
+        소비측이 중단하면 진행 중인 처리는 취소된다.
+        """
+        limit = max(1, concurrency or settings.IMAGE_BATCH_CONCURRENCY)
+        pending: Set[asyncio.Task] = set()
+        try:
+            for index, image in enumerate(images):
+                if len(pending) >= limit:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.create_task(self._identify_batch_item(index, image)))
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _identify_batch_item(self, index: int, image: BatchImage) -> dict:
+        """일괄 식별 1건 (status: matched | unidentified | not_found | error)."""
+        start_time = datetime.now()
+        item = {"index": index, "filename": image.filename, "status": "error"}
+        try:
+            prepared = await self.preprocessor.prepare(await image.load())
+            try:
+                identified = await self.identify_prepared(prepared)
+            except ValueError as e:
+                item.update(status="unidentified", error=str(e))
+                return item
+            item["identified"] = identified
+
+            try:
+                plant_in_db = await self.match_identified(identified)
+            except ValueError as e:
+                item.update(status="not_found", error=str(e))
+                return item
+            item.update(
+                status="matched",
+                plant_id=str(plant_in_db["_id"]),
+                plant_name=plant_in_db.get("name"),
+                scientific_name=plant_in_db.get("scientificName"),
+            )
+            return item
+        except asyncio.CancelledError:
+            item["status"] = "cancelled"            # 지표 기록용 (결과는 전달되지 않음)
+            raise
+        except Exception as e:
+            logger.error(f"[identify_image_batch] 처리 오류 ({image.filename}): {e}")
+            item["error"] = "이미지 처리 중 오류가 발생했습니다."
+            return item
+        finally:
             elapsed = (datetime.now() - start_time).total_seconds()
-            logger.info(f"[search_by_image 완료] 기존 데이터 반환 (소요시간: {elapsed:.2f}초)")
-            logger.info("=" * 50)
-            return result
+            self.stage_metrics.get("identify_image_batch.item").record(item["status"], elapsed)
 
-        # 4. DB에 없으면 에러 반환
-        logger.warning(f"[실패] '{target_name}' ({target_scientific_name}) - DB에 해당 식물 정보 없음")
-        raise ValueError(f"'{target_name}'에 대한 정보가 데이터베이스에 없습니다.")
     # =========================================================
     # 2. 텍스트 기반 추천 (DB-only 모드 + 에세이)
     # =========================================================
@@ -123,47 +546,97 @@ class PlantService:
         상황 기반 식물 추천 (DB-only 모드).
 
         [흐름]
+        0. 추천 캐시 조회 (같은 상황 → 정확 일치, 비슷한 표현 → 의미 유사 캐시)
+           → 로컬 의도 분류가 확신하면 꽃말 그룹 인기 1위 식물 선정 (1~3단계 생략)
         1. Gemini로 상황에 맞는 식물 선정
+           (RECOMMEND_MODE="catalog"이면 카탈로그 안에서 _id를 고르므로 2단계 생략)
         2. DB 조회 (학명 정확 → 이름 정확 → 학명 퍼지)
         3. 없으면 에러 반환
-        4. 추천 에세이 생성
+        4. 추천 에세이 생성 후 캐시 저장
         """
         start_time = datetime.now()
         logger.info("=" * 50)
         logger.info("[recommend_plants] 텍스트 기반 추천 시작")
         logger.info(f"  - 상황: {situation[:50]}{'...' if len(situation) > 50 else ''}")
 
+        with self.stage_metrics.timer("recommend_plants"):
+            with self.stage_metrics.timer("recommend_plants.select"):
+                plant_in_db, essay = await self.select_recommended_plant(situation)
+
+            # 4. 에세이 작성 (캐시 적중 시 생략)
+            if essay is None:
+                logger.debug("[Step 3] 추천 에세이 생성 중...")
+                with self.stage_metrics.timer("recommend_plants.essay"):
+                    essay = await self.gemini.generate_recommendation_essay(situation, plant_in_db)
+                logger.info(f"[Step 3 완료] 에세이 길이: {len(essay)}자")
+                await self._remember_recommendation(situation, plant_in_db, essay)
+
+        result = plant_in_db.copy()
+        result["recommendation"] = essay
+
+        elapsed = (datetime.now() - start_time).total_seconds()
+        logger.info(f"[recommend_plants 완료] 소요시간: {elapsed:.2f}초")
+        logger.info("=" * 50)
+
+        return result
+
+    async def select_recommended_plant(self, situation: str) -> Tuple[dict, Optional[str]]:
+        """
+        추천 식물 선정 (에세이 생성 전 단계, 추천 흐름 0~3단계).
+
+        Returns:
+            (DB 식물 문서, 캐시된 에세이 또는 None)
+
+        Raises:
+            ValueError: 식물을 선정하지 못했거나 DB에 없는 경우
+        """
+        # 0. 추천 캐시 (정확 일치 → 의미 유사)
+        cached = await self.recommendation_cache.get(situation, self.recommendation_cache_repo)
+        if not cached:
+            cached = self.semantic_cache.lookup(situation)
+            if cached:
+                logger.info(f"[Step 0] 유사 상황 캐시 적중: '{cached['situation']}' ({cached['similarity']})")
+                await self.recommendation_cache.set(
+                    situation, cached["plantId"], cached["essay"], self.recommendation_cache_repo
+                )
+        if cached:
+            plant_in_db = await self.plant_repo.get_by_id(cached["plantId"])
+            if plant_in_db:
+                logger.info(f"[Step 0 완료] 캐시 적중: {cached['plantId']}")
+                return plant_in_db, cached["essay"]
+            logger.warning(f"[Step 0] 캐시된 식물이 DB에 없음: {cached['plantId']}")
+
+        # 0-1. 로컬 의도 분류 빠른 경로 (꽃말 그룹 인기 1위)
+        intent = await self.intent.classify(situation, self.plant_repo)
+        if intent:
+            plant_in_db = await self.plant_repo.get_top_by_flower_group(intent.group)
+            if plant_in_db:
+                logger.info(
+                    f"[Step 0 완료] 의도 분류 적중: {intent.group} "
+                    f"(score={intent.score}, confidence={intent.confidence}) → {plant_in_db.get('_id')}"
+                )
+                return plant_in_db, None
+
+        # 1. Gemini: 카탈로그 제약 모드는 _id로 바로 선정
+        if settings.RECOMMEND_MODE == "catalog":
+            return await self._select_from_catalog(situation), None
+
         # 1. Gemini: 이름 선정
         logger.debug("[Step 1] Gemini 식물 선정 호출...")
         identified = await self.gemini.get_plant_name_from_text(situation)
 
-        if not identified or not identified.get("name"):
+        if not identified:
             logger.warning("[실패] 적절한 식물을 추천하지 못함")
             raise ValueError("적절한 식물을 추천하지 못했습니다.")
 
-        target_name = identified["name"]
-        target_scientific_name = identified.get("scientificName", "").strip()
+        target_name = identified.name
+        target_scientific_name = (identified.scientific_name or "").strip()
 
         logger.info(f"[Step 1 완료] 추천 식물: {target_name} ({target_scientific_name})")
 
-        # 2. DB 조회 (3단계: 학명 정확 → 이름 정확 → 학명 퍼지)
+        # 2. DB 조회 (이름 인덱스: 학명 → 이름 → 영문명 → 속, 인덱스 미스 시 DB 1회)
         logger.debug("[Step 2] DB 조회 시작...")
-        plant_in_db = None
-
-        # 2-1. 학명 정확 일치
-        if target_scientific_name:
-            logger.debug(f"   - [1차] 학명 정확 일치 조회: {target_scientific_name}")
-            plant_in_db = await self.plant_repo.get_by_scientific_name(target_scientific_name)
-
-        # 2-2. 이름 정확 일치
-        if not plant_in_db:
-            logger.debug(f"   - [2차] 이름 정확 일치 조회: {target_name}")
-            plant_in_db = await self.plant_repo.get_by_name(target_name)
-
-        # 2-3. 학명 퍼지 매칭 (속 기준)
-        if not plant_in_db and target_scientific_name:
-            logger.debug(f"   - [3차] 학명 퍼지 매칭 조회: {target_scientific_name}")
-            plant_in_db = await self.plant_repo.find_by_scientific_name_fuzzy(target_scientific_name)
+        plant_in_db, _ = await self._resolve_candidates([identified])
 
         # 3. DB에 없으면 에러 반환
         if not plant_in_db:
@@ -171,20 +644,65 @@ class PlantService:
             raise ValueError(f"'{target_name}'에 대한 정보가 데이터베이스에 없습니다.")
 
         logger.info(f"[Step 2 완료] DB에서 발견: {plant_in_db.get('_id')}")
+        return plant_in_db, None
 
-        # 4. 에세이 작성
-        logger.debug("[Step 3] 추천 에세이 생성 중...")
-        essay = await self.gemini.generate_recommendation_essay(situation, plant_in_db)
-        logger.info(f"[Step 3 완료] 에세이 길이: {len(essay)}자")
+    async def _select_from_catalog(self, situation: str) -> dict:
+        """카탈로그 요약을 컨텍스트로 보내 Gemini가 고른 _id로 식물 조회 (퍼지 매칭 없음)."""
+        catalog = await self.catalog.get(self.plant_repo)
+        if not catalog.size:
+            logger.warning("[실패] 추천 카탈로그가 비어 있음")
+            raise ValueError("추천할 수 있는 식물이 없습니다.")
 
-        result = plant_in_db.copy()
-        result["recommendation"] = essay
+        logger.debug(f"[Step 1] Gemini 카탈로그 선정 호출... ({catalog.size}종)")
+        choice = await self.gemini.choose_plant_from_catalog(situation, catalog.text)
+        plant_id = choice.plant_id.strip() if choice else ""
 
-        elapsed = (datetime.now() - start_time).total_seconds()
-        logger.info(f"[recommend_plants 완료] 소요시간: {elapsed:.2f}초")
-        logger.info("=" * 50)
+        if plant_id not in catalog.plant_ids:
+            logger.warning(f"[실패] 카탈로그에 없는 선택: '{plant_id}'")
+            raise ValueError("적절한 식물을 추천하지 못했습니다.")
 
-        return result
+        plant_in_db = await self.plant_repo.get_by_id(plant_id)
+        if not plant_in_db:
+            logger.warning(f"[실패] 선택된 식물이 DB에서 삭제됨: {plant_id}")
+            raise ValueError("적절한 식물을 추천하지 못했습니다.")
+
+        logger.info(f"[Step 1 완료] 카탈로그 선정: {plant_id} ({plant_in_db.get('name')})")
+        return plant_in_db
+
+    async def stream_recommendation_essay(
+        self, situation: str, plant_in_db: dict, cached_essay: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        추천 에세이 스트리밍 (SSE 엔드포인트용).
+
+        캐시된 에세이가 있으면 한 번에 보내고, 없으면 Gemini 스트리밍 조각을 그대로 전달한 뒤
+        완성된 에세이를 캐시에 저장한다. 조각이 하나도 오지 않으면 실패 문구를 보낸다.
+        """
+        if cached_essay is not None:
+            yield cached_essay
+            return
+
+        chunks = []
+        async for chunk in self.gemini.stream_recommendation_essay(situation, plant_in_db):
+            chunks.append(chunk)
+            yield chunk
+
+        if not chunks:
+            logger.warning("[stream_recommendation_essay] 스트리밍 에세이 생성 실패")
+            yield ESSAY_FALLBACK_TEXT
+            return
+
+        essay = "".join(chunks)
+        logger.info(f"[stream_recommendation_essay 완료] 에세이 길이: {len(essay)}자")
+        await self._remember_recommendation(situation, plant_in_db, essay)
+
+    async def _remember_recommendation(self, situation: str, plant_in_db: dict, essay: str) -> None:
+        """완성된 추천 결과를 정확 일치 + 의미 유사 캐시에 저장 (실패 문구는 제외)."""
+        if essay == ESSAY_FALLBACK_TEXT:
+            return
+        plant_id = str(plant_in_db["_id"])
+        await self.recommendation_cache.set(situation, plant_id, essay, self.recommendation_cache_repo)
+        self.semantic_cache.add(situation, plant_id, essay)
 
     # =========================================================
     # 3. 목록 조회
@@ -204,10 +722,25 @@ class PlantService:
         sort_by: str = "name", 
         sort_order: str = "asc"
     ) -> List[dict]:
-        """식물 목록 조회 (필터링 + 페이지네이션)"""
+        """
+        식물 목록 조회 (필터링 + 페이지네이션)
+        - keyword가 있으면 검색 인덱스의 관련도 순 (같은 관련도는 sort_by 순)
+        """
         logger.debug(f"[get_plants] skip={skip}, limit={limit}, sort_by={sort_by}")
         
         order = 1 if sort_order == "asc" else -1
+        if keyword and self.search_index.enabled:
+            ranked_ids = await self._search_ids(
+                keyword, skip + limit, season, blooming_month, category_group, color_group,
+                scent_group, flower_group, story_genre, sort_by, order,
+            )
+            page_ids = ranked_ids[skip:]
+            plants = await self.plant_repo.get_list(plant_ids=page_ids, limit=len(page_ids))
+            position = {plant_id: i for i, plant_id in enumerate(page_ids)}
+            result = sorted(plants, key=lambda p: position[str(p["_id"])])
+            logger.debug(f"[get_plants] 검색 결과: {len(result)}개")
+            return result
+
         result = await self.plant_repo.get_list(
             season=season, 
             blooming_month=blooming_month, 
@@ -267,7 +800,22 @@ class PlantService:
         story_genre: Optional[str] = None, 
         keyword: Optional[str] = None
     ) -> int:
-        """필터 조건에 맞는 식물 개수"""
+        """필터 조건에 맞는 식물 개수 (keyword가 있으면 목록 API와 같은 검색 + 필터 결과의 정확한 개수)"""
+        if keyword and self.search_index.enabled:
+            ranked = await self.search_index.search(keyword, self.plant_repo)
+            count = await self.plant_repo.count_ids(
+                [plant_id for plant_id, _ in ranked],
+                season=season,
+                blooming_month=blooming_month,
+                category_group=category_group,
+                color_group=color_group,
+                scent_group=scent_group,
+                flower_group=flower_group,
+                story_genre=story_genre,
+            )
+            logger.debug(f"[get_plants_count] 검색 결과: {count}개")
+            return count
+
         count = await self.plant_repo.count(
             season=season, 
             blooming_month=blooming_month, 
@@ -281,6 +829,46 @@ class PlantService:
         logger.debug(f"[get_plants_count] 결과: {count}개")
         return count
 
+    async def _search_ids(
+        self,
+        keyword: str,
+        limit: int,
+        season: Optional[str] = None,
+        blooming_month: Optional[int] = None,
+        category_group: Optional[str] = None,
+        color_group: Optional[str] = None,
+        scent_group: Optional[str] = None,
+        flower_group: Optional[str] = None,
+        story_genre: Optional[str] = None,
+        sort_by: str = "name",
+        sort_order: int = 1,
+    ) -> List[str]:
+        """
+        키워드 검색 결과 중 필터에 맞는 상위 limit개 _id (관련도 순, 같은 관련도는 sort_by 순).
+
+        관련도 단계(최대 6개)별로 DB에서 _id만 sort_by 순으로 limit까지 조회하고,
+        앞 단계에서 limit을 채우면 나머지 단계는 조회하지 않는다.
+        """
+        ranked = await self.search_index.search(keyword, self.plant_repo)
+        plant_ids: List[str] = []
+        for _, group in groupby(ranked, key=lambda item: item[1]):
+            if len(plant_ids) >= limit:
+                break
+            plant_ids += await self.plant_repo.get_ids(
+                [plant_id for plant_id, _ in group],
+                season=season,
+                blooming_month=blooming_month,
+                category_group=category_group,
+                color_group=color_group,
+                scent_group=scent_group,
+                flower_group=flower_group,
+                story_genre=story_genre,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit - len(plant_ids),
+            )
+        return plant_ids
+
     # =========================================================
     # 4. 상세 조회
     # =========================================================
@@ -307,3 +895,7 @@ class PlantService:
         
         logger.debug(f"[get_plant_detail] 완료: {plant.get('name')}")
         return plant
+
+
+# 처리 단계별 지연 지표 (싱글톤: 요청마다 생성되는 PlantService가 공유)
+plant_stage_metrics = CallMetrics()
@@ -0,0 +1,120 @@
+"""
+상황 기반 추천 결과 캐시 (2단계)
+- 키: 정규화된 상황 텍스트 (NFKC, 공백/대소문자/끝 문장부호 정리)
+- 값: 추천 식물 _id + 추천 에세이
+- 1차: 프로세스 내 LRU + TTL / 2차: MongoDB (recommendation_cache 컬렉션)
+"""
+import hashlib
+import logging
+from typing import Optional
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.text import normalize_situation
+from app.repositories.recommendation_cache_repository import RecommendationCacheRepository
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] %(levelname)s [%(name)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    logger.addHandler(handler)
+
+
+class RecommendationCache:
+    """정규화된 상황 텍스트 기반 추천 결과 캐시"""
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.enabled = settings.RECOMMEND_CACHE_ENABLED if enabled is None else enabled
+        self.ttl_seconds = ttl_seconds or settings.RECOMMEND_CACHE_TTL_SECONDS
+        # 정규화 텍스트 → {"plantId", "essay"}
+        self._memory = TTLCache(maxsize or settings.RECOMMEND_CACHE_MAX_ENTRIES, self.ttl_seconds)
+
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(normalized: str) -> str:
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    async def get(self, situation: str, repo: Optional[RecommendationCacheRepository] = None) -> Optional[dict]:
+        """
+        캐시 조회: 메모리 → MongoDB.
+
+        Returns:
+            {"plantId", "essay"} 또는 None (Mongo 오류는 miss로 취급)
+        """
+        if not self.enabled:
+            return None
+
+        normalized = normalize_situation(situation)
+        entry = self._memory.get(normalized)
+        if entry:
+            self.memory_hits += 1
+            return dict(entry)
+
+        if repo is not None:
+            try:
+                doc = await repo.get(self._key(normalized))
+            except Exception as e:
+                logger.warning(f"[RecommendationCache] 영구 캐시 조회 실패: {e}")
+                doc = None
+            if doc:
+                entry = {"plantId": doc["plantId"], "essay": doc["essay"]}
+                self._memory.set(normalized, entry)
+                self.persistent_hits += 1
+                return dict(entry)
+
+        self.misses += 1
+        return None
+
+    async def set(
+        self,
+        situation: str,
+        plant_id: str,
+        essay: str,
+        repo: Optional[RecommendationCacheRepository] = None,
+    ) -> None:
+        """추천 결과 저장 (메모리 + MongoDB)."""
+        if not self.enabled:
+            return
+
+        normalized = normalize_situation(situation)
+        self._memory.set(normalized, {"plantId": plant_id, "essay": essay})
+        if repo is not None:
+            try:
+                await repo.upsert(self._key(normalized), normalized, plant_id, essay, self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"[RecommendationCache] 영구 캐시 저장 실패: {e}")
+
+    def clear(self) -> None:
+        """메모리 캐시 및 카운터 초기화."""
+        self._memory.clear()
+        self.memory_hits = self.persistent_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """캐시 적중 통계."""
+        hits = self.memory_hits + self.persistent_hits
+        total = hits + self.misses
+        return {
+            "size": len(self._memory),
+            "memoryHits": self.memory_hits,
+            "persistentHits": self.persistent_hits,
+            "misses": self.misses,
+            "hitRate": round(hits / total, 4) if total else 0.0,
+        }
+
+
+# 싱글톤 인스턴스 (메모리 캐시는 워커 프로세스 단위로 공유)
+recommendation_cache = RecommendationCache()
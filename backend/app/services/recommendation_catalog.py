@@ -0,0 +1,119 @@
+"""
+추천용 식물 카탈로그 요약 (카탈로그 제약 추천 모드)
+- PlantRepository.get_for_recommendation 결과를 한 줄에 한 식물씩 압축한 텍스트로 변환
+- 내용 지문(fingerprint)으로 변경 여부를 판별 → Gemini 컨텍스트 캐시 재생성 기준
+- Gemini는 이 목록 안에서 _id를 고르므로 DB 재조회(학명/이름/퍼지)가 필요 없다
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional
+
+from app.core.config import settings
+from app.repositories import PlantRepository
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] %(levelname)s [%(name)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    logger.addHandler(handler)
+
+DIGEST_HEADER = "Plant catalog. One plant per line: id | name | flower language | flower group | season | color | scent"
+
+
+@dataclass(frozen=True)
+class CatalogDigest:
+    """Gemini 컨텍스트로 보낼 카탈로그 요약."""
+    text: str
+    fingerprint: str                    # text의 SHA-256 (내용이 같으면 같은 값)
+    plant_ids: FrozenSet[str]
+    size: int
+
+
+class RecommendationCatalog:
+    """
+    카탈로그 요약 생성/보관 (프로세스 내 전용).
+
+    refresh_seconds 간격으로만 DB를 다시 읽고, 내용이 바뀐 경우에만 지문이 바뀐다.
+    줄은 _id 순으로 정렬하므로 인기도 변화(정렬 순서 변화)만으로는 지문이 바뀌지 않는다.
+    """
+
+    def __init__(self, limit: Optional[int] = None, refresh_seconds: Optional[float] = None):
+        self.limit = limit or settings.RECOMMEND_CATALOG_LIMIT
+        self.refresh_seconds = settings.RECOMMEND_CATALOG_REFRESH_SECONDS if refresh_seconds is None else refresh_seconds
+        self._digest: Optional[CatalogDigest] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self.reloads = 0
+        self.changes = 0
+
+    async def get(self, plant_repo: PlantRepository) -> CatalogDigest:
+        """현재 카탈로그 요약 (갱신 주기가 지났으면 DB에서 다시 생성)."""
+        if self._digest is not None and time.monotonic() - self._loaded_at < self.refresh_seconds:
+            return self._digest
+
+        async with self._lock:
+            if self._digest is not None and time.monotonic() - self._loaded_at < self.refresh_seconds:
+                return self._digest
+
+            plants = await plant_repo.get_for_recommendation(limit=self.limit)
+            digest = self.build_digest(plants)
+            if self._digest is None or digest.fingerprint != self._digest.fingerprint:
+                self.changes += 1
+                logger.info(f"[RecommendationCatalog] 카탈로그 갱신: {digest.size}종, 지문 {digest.fingerprint[:12]}")
+
+            self._digest = digest
+            self._loaded_at = time.monotonic()
+            self.reloads += 1
+            return digest
+
+    @staticmethod
+    def build_digest(plants: List[dict]) -> CatalogDigest:
+        """식물 문서 리스트 → 압축 텍스트 요약."""
+        lines = []
+        for plant in sorted(plants, key=lambda p: str(p["_id"])):
+            flower_info = plant.get("flowerInfo") or {}
+            color_groups = (plant.get("colorInfo") or {}).get("colorGroup") or []
+            scent_groups = (plant.get("scentInfo") or {}).get("scentGroup") or []
+            fields = [
+                str(plant["_id"]),
+                str(plant.get("name") or ""),
+                str(flower_info.get("language") or ""),
+                str(flower_info.get("flowerGroup") or ""),
+                str(plant.get("season") or ""),
+                ",".join(color_groups),
+                ",".join(scent_groups),
+            ]
+            lines.append(" | ".join(f.replace("|", "/").replace("\n", " ") for f in fields))
+
+        text = "\n".join([DIGEST_HEADER, *lines])
+        return CatalogDigest(
+            text=text,
+            fingerprint=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            plant_ids=frozenset(str(p["_id"]) for p in plants),
+            size=len(lines),
+        )
+
+    def clear(self) -> None:
+        self._digest = None
+        self._loaded_at = 0.0
+
+    def stats(self) -> dict:
+        return {
+            "size": self._digest.size if self._digest else 0,
+            "fingerprint": self._digest.fingerprint[:12] if self._digest else None,
+            "reloads": self.reloads,
+            "changes": self.changes,
+        }
+
+
+# 싱글톤 인스턴스
+recommendation_catalog = RecommendationCatalog()
@@ -0,0 +1,262 @@
+"""
+추천 결과 의미 유사 캐시 (로컬 벡터 기반)
+- 상황 텍스트를 한국어 문자 n-gram TF-IDF로 벡터화 (고정 폭 해싱, NumPy)
+- 캐시된 상황들과 코사인 유사도를 한 번의 행렬 연산으로 계산
+- 임계값 이상인 후보 중 어절 대응 검사를 통과한 항목만 캐시된 식물 + 에세이 재사용 (외부 임베딩 서비스 불필요)
+
+정확 일치 캐시(RecommendationCache)가 놓치는 표현 차이를 보완한다.
+예: "남자친구랑 화해하고 싶어" ↔ "남자친구와 화해하고 싶어요"
+
+문자 n-gram 유사도는 뜻을 모르므로 유사도만으로는 재사용하지 않는다.
+- 모든 어절이 상대 문장에 조사 / 어미만 다른 어절로 있어야 함
+  ("감사하다고" ↔ "미안하다고", "싶어" ↔ "싶지 않아" 는 불일치)
+- 부정 표현(안 / 않 / 못 / 없 / 싫 / 아니 / 말고) 유무가 같아야 함
+(따라서 "애인" ↔ "남자친구", "위로" ↔ "힘" 같은 동의어 표현은 재사용하지 않는다)
+"""
+import logging
+import re
+import time
+import zlib
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.text import normalize_situation
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] %(levelname)s [%(name)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    logger.addHandler(handler)
+
+
+# 부정 표현 (어절 전체 또는 어절 안의 부정 어간)
+_NEGATION_WORDS = frozenset({"안", "못", "아니", "아니야", "아니요", "아뇨", "말고"})
+_NEGATION_STEMS = re.compile(r"않|못해|못하|없|싫|말고|말아")
+
+
+def _common_prefix(a: str, b: str) -> int:
+    size = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        size += 1
+    return size
+
+
+def _same_stem(a: str, b: str) -> bool:
+    """조사 / 어미만 다른 어절인지 (짧은 쪽 기준 마지막 1글자까지만 다를 수 있고, 2글자 이상은 앞 2글자가 같아야 함)."""
+    shorter = min(len(a), len(b))
+    prefix = _common_prefix(a, b)
+    return prefix >= min(2, shorter) and prefix >= shorter - 1
+
+
+def _is_negated(words: List[str]) -> bool:
+    return any(w in _NEGATION_WORDS or _NEGATION_STEMS.search(w) for w in words)
+
+
+def same_meaning(query: str, cached: str) -> bool:
+    """
+    문자 유사도가 높은 두 상황을 같은 요청으로 볼 수 있는지 (어절 대응 + 부정 유무).
+
+    "남자친구랑 화해하고 싶어" ↔ "남자친구와 화해하고 싶어요" → True
+    "…사랑한다고 말하고 싶어" ↔ "…사랑한다고 말하고 싶지 않아" → False
+    """
+    query_words = normalize_situation(query).split()
+    cached_words = normalize_situation(cached).split()
+    if _is_negated(query_words) != _is_negated(cached_words):
+        return False
+    return (
+        all(any(_same_stem(q, c) for c in cached_words) for q in query_words)
+        and all(any(_same_stem(c, q) for q in query_words) for c in cached_words)
+    )
+
+
+class SituationVectorizer:
+    """
+    문자 n-gram 해싱 벡터화기.
+
+    어절마다 양끝에 경계 표시를 붙여 n-gram을 뽑고, crc32로 고정 폭 버킷에 해싱한다.
+    조사/어미가 달라도 어간 n-gram이 겹치므로 한국어 표현 차이에 강하다.
+    """
+
+    def __init__(self, dim: int, ngram_range: Tuple[int, int] = (2, 3)):
+        self.dim = dim
+        self.ngram_range = ngram_range
+
+    def ngrams(self, text: str) -> list:
+        grams = []
+        min_n, max_n = self.ngram_range
+        for token in normalize_situation(text).split():
+            padded = f"<{token}>"
+            for n in range(min_n, max_n + 1):
+                grams.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+        return grams
+
+    def term_frequency(self, text: str) -> np.ndarray:
+        """로그 스케일 TF 벡터 (IDF 가중치는 조회 시점에 적용)."""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for gram in self.ngrams(text):
+            vector[zlib.crc32(gram.encode("utf-8")) % self.dim] += 1.0
+        return np.log1p(vector, out=vector)
+
+
+class SemanticRecommendationCache:
+    """
+    상황 텍스트 의미 유사 캐시 (프로세스 내 전용).
+
+    - 고정 크기 행렬에 TF 벡터를 저장하고 문서 빈도(df)를 누적
+    - 조회 시 IDF 가중 + 정규화된 행렬을 (변경 시에만) 재계산해 행렬-벡터 곱 1회로 최근접 탐색
+    - 꽉 차면 가장 오래 사용되지 않은 슬롯을 교체 (LRU), 만료 슬롯은 검색에서 제외 (TTL)
+    - 임계값 이상인 후보는 유사도 순으로 same_meaning 검사를 거쳐 처음 통과한 항목을 반환
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        dim: Optional[int] = None,
+        threshold: Optional[float] = None,
+        ttl_seconds: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.enabled = settings.RECOMMEND_SEMANTIC_CACHE_ENABLED if enabled is None else enabled
+        self.maxsize = maxsize or settings.RECOMMEND_SEMANTIC_MAX_ENTRIES
+        self.threshold = settings.RECOMMEND_SEMANTIC_THRESHOLD if threshold is None else threshold
+        self.ttl_seconds = ttl_seconds or settings.RECOMMEND_CACHE_TTL_SECONDS
+        self.vectorizer = SituationVectorizer(dim or settings.RECOMMEND_SEMANTIC_DIM)
+
+        self.hits = 0
+        self.misses = 0
+        self._reset_storage()
+
+    def _reset_storage(self) -> None:
+        dim = self.vectorizer.dim
+        self._tf = np.zeros((self.maxsize, dim), dtype=np.float32)
+        self._df = np.zeros(dim, dtype=np.float32)
+        self._expires_at = np.zeros(self.maxsize, dtype=np.float64)   # 0 = 빈 슬롯
+        self._last_used = np.zeros(self.maxsize, dtype=np.float64)
+        self._entries: list = [None] * self.maxsize
+        self._slots: dict = {}                   # 정규화 텍스트 → 슬롯 번호
+        self._index: Optional[np.ndarray] = None  # IDF 가중 + L2 정규화 행렬 (지연 계산)
+        self._idf: Optional[np.ndarray] = None
+
+    def lookup(self, situation: str) -> Optional[dict]:
+        """
+        가장 유사한 캐시 항목 조회.
+
+        Returns:
+            {"plantId", "essay", "situation", "similarity"} 또는 None
+        """
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+        live = self._expires_at > now
+        if not live.any():
+            self.misses += 1
+            return None
+
+        index, idf = self._weighted_index()
+        query = self.vectorizer.term_frequency(situation) * idf
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            self.misses += 1
+            return None
+
+        similarities = index @ (query / norm)
+        similarities[~live] = -1.0
+        candidates = np.flatnonzero(similarities >= self.threshold)
+        best = next(
+            (
+                int(slot) for slot in candidates[np.argsort(-similarities[candidates], kind="stable")]
+                if same_meaning(situation, self._entries[slot]["situation"])
+            ),
+            None,
+        )
+        if best is None:
+            self.misses += 1
+            return None
+        similarity = float(similarities[best])
+
+        self._last_used[best] = now
+        self.hits += 1
+        entry = dict(self._entries[best])
+        entry["similarity"] = round(similarity, 4)
+        logger.debug(f"[SemanticCache] '{situation[:30]}' ≈ '{entry['situation'][:30]}' ({similarity:.3f})")
+        return entry
+
+    def add(self, situation: str, plant_id: str, essay: str) -> None:
+        """상황 → 추천 결과 등록 (같은 정규화 텍스트는 갱신)."""
+        if not self.enabled:
+            return
+
+        normalized = normalize_situation(situation)
+        tf = self.vectorizer.term_frequency(normalized)
+        if not tf.any():
+            return
+
+        now = time.monotonic()
+        slot = self._slots.get(normalized)
+        if slot is None:
+            slot = self._free_slot(now)
+        else:
+            self._df -= self._tf[slot] > 0
+
+        self._tf[slot] = tf
+        self._df += tf > 0
+        self._expires_at[slot] = now + self.ttl_seconds
+        self._last_used[slot] = now
+        self._entries[slot] = {"plantId": plant_id, "essay": essay, "situation": normalized}
+        self._slots[normalized] = slot
+        self._index = None
+
+    def _free_slot(self, now: float) -> int:
+        """빈 슬롯 → 만료 슬롯 → LRU 슬롯 순으로 재사용."""
+        empty = np.flatnonzero(self._expires_at <= now)
+        slot = int(empty[0]) if empty.size else int(np.argmin(self._last_used))
+
+        previous = self._entries[slot]
+        if previous is not None:
+            self._slots.pop(previous["situation"], None)
+            self._df -= self._tf[slot] > 0
+            self._entries[slot] = None
+        return slot
+
+    def _weighted_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """IDF 가중 + 행 정규화 행렬 (등록/교체가 있을 때만 재계산)."""
+        if self._index is None:
+            documents = max(len(self._slots), 1)
+            self._idf = (np.log((1.0 + documents) / (1.0 + self._df)) + 1.0).astype(np.float32)
+            weighted = self._tf * self._idf
+            norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self._index = weighted / norms
+        return self._index, self._idf
+
+    def clear(self) -> None:
+        """저장소 및 카운터 초기화."""
+        self._reset_storage()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """캐시 적중 통계."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._slots),
+            "maxsize": self.maxsize,
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+semantic_recommendation_cache = SemanticRecommendationCache()
@@ -0,0 +1,167 @@
+"""
+학명 이명(synonym) 일괄 적재
+- 파일(JSONL / CSV) → 정명(accepted name) 단위 레코드 → plant_synonyms 컬렉션
+- 정명은 카탈로그 학명(정규화 키, 종 수준 키 순)으로 식물 _id를 찾는다 (plantId를 직접 지정할 수도 있음)
+
+[JSONL] 한 줄에 정명 1개
+    {"acceptedName": "Chrysanthemum morifolium Ramat.", "synonyms": ["Dendranthema grandiflorum (Ramat.) Kitam."]}
+    {"acceptedName": "Rosa canina", "plantId": "1", "synonyms": ["Rosa lutetiana"]}
+
+[CSV] 한 줄에 이명 1개 (헤더 필수, plant_id 열은 선택)
+    accepted_name,synonym,plant_id
+    Chrysanthemum morifolium,Dendranthema grandiflorum,
+"""
+import csv
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from app.core.text import normalize_scientific_name, species_key
+from app.repositories import PlantRepository, PlantSynonymRepository
+
+# bulk write 1회에 보내는 별칭 수
+BATCH_SIZE = 1000
+
+
+@dataclass
+class SynonymRecord:
+    """정명 1개와 그 이명들."""
+    accepted_name: str
+    synonyms: List[str] = field(default_factory=list)
+    plant_id: Optional[str] = None
+
+
+def parse_synonym_file(path: str) -> List[SynonymRecord]:
+    """
+    이명 파일 → 레코드 목록 (확장자로 형식 판별: .jsonl / .csv).
+
+    Raises:
+        ValueError: 지원하지 않는 형식이거나 필수 필드가 없는 경우
+    """
+    extension = os.path.splitext(path)[1].lower()
+    parsers = {".jsonl": _parse_jsonl, ".csv": _parse_csv}
+    if extension not in parsers:
+        raise ValueError(f"지원하지 않는 이명 파일 형식입니다: {extension} (.jsonl / .csv)")
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return parsers[extension](f)
+
+
+def _parse_jsonl(lines: Iterable[str]) -> List[SynonymRecord]:
+    records = []
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        row = json.loads(line)
+        if not row.get("acceptedName"):
+            raise ValueError(f"{number}번째 줄: acceptedName이 없습니다.")
+        records.append(SynonymRecord(
+            accepted_name=row["acceptedName"],
+            synonyms=list(row.get("synonyms") or []),
+            plant_id=row.get("plantId"),
+        ))
+    return records
+
+
+def _parse_csv(lines: Iterable[str]) -> List[SynonymRecord]:
+    reader = csv.DictReader(lines)
+    if not reader.fieldnames or not {"accepted_name", "synonym"} <= set(reader.fieldnames):
+        raise ValueError("CSV 헤더에 accepted_name, synonym 열이 필요합니다.")
+
+    # 같은 정명(+ plant_id)의 줄은 레코드 1개로 묶는다
+    grouped: Dict[tuple, SynonymRecord] = {}
+    for row in reader:
+        accepted = (row.get("accepted_name") or "").strip()
+        if not accepted:
+            continue
+        plant_id = (row.get("plant_id") or "").strip() or None
+        record = grouped.setdefault((accepted, plant_id), SynonymRecord(accepted, plant_id=plant_id))
+        synonym = (row.get("synonym") or "").strip()
+        if synonym:
+            record.synonyms.append(synonym)
+    return list(grouped.values())
+
+
+async def load_synonyms(
+    records: List[SynonymRecord],
+    plant_repo: PlantRepository,
+    synonym_repo: PlantSynonymRepository,
+    source: str = "",
+    dry_run: bool = False,
+) -> dict:
+    """
+    레코드 → 별칭 문서로 바꿔 일괄 저장.
+
+    - 속 이름만 있는 별칭(종소명 없음)은 여러 종에 걸리므로 저장하지 않음
+    - 같은 별칭이 다른 식물을 가리키면 먼저 나온 레코드를 유지하고 conflicts에 기록
+    - DB에 이미 다른 식물로 저장된 별칭도 덮어쓰지 않고 conflicts에 기록 (같은 식물이면 updated)
+
+    Returns:
+        적재 보고서 (records, aliases, inserted, updated, unresolved, conflicts, skipped)
+    """
+    plants = await plant_repo.get_for_name_index()
+    plant_ids = {str(p["_id"]) for p in plants}
+    by_scientific: Dict[str, str] = {}
+    by_species: Dict[str, str] = {}
+    for plant in sorted(plants, key=lambda p: -(p.get("popularity_score") or 0)):
+        key = normalize_scientific_name(plant.get("scientificName") or "")
+        if " " in key:
+            by_scientific.setdefault(key, str(plant["_id"]))
+            by_species.setdefault(species_key(key), str(plant["_id"]))
+
+    entries: Dict[str, dict] = {}
+    unresolved, conflicts, skipped = [], [], []
+    for record in records:
+        accepted_key = normalize_scientific_name(record.accepted_name)
+        if record.plant_id:
+            plant_id = record.plant_id if record.plant_id in plant_ids else None
+        else:
+            plant_id = by_scientific.get(accepted_key) or by_species.get(species_key(accepted_key))
+        if not plant_id:
+            unresolved.append(record.accepted_name)
+            continue
+
+        names = [("accepted", record.accepted_name)] + [("synonym", s) for s in record.synonyms]
+        for kind, name in names:
+            alias = normalize_scientific_name(name)
+            if " " not in alias:
+                skipped.append(name)
+                continue
+            existing = entries.get(alias)
+            if existing and existing["plantId"] != plant_id:
+                conflicts.append(name)
+                continue
+            if not existing:
+                entries[alias] = {
+                    "alias": alias,
+                    "name": name,
+                    "plantId": plant_id,
+                    "acceptedName": record.accepted_name,
+                    "kind": kind,
+                    "source": source,
+                }
+
+    aliases = list(entries)
+    for start in range(0, len(aliases), BATCH_SIZE):
+        stored = await synonym_repo.find_by_aliases(aliases[start:start + BATCH_SIZE])
+        for alias, stored_plant_id in stored.items():
+            if stored_plant_id != entries[alias]["plantId"]:
+                conflicts.append(entries.pop(alias)["name"])
+
+    inserted = updated = 0
+    if not dry_run:
+        batch = list(entries.values())
+        for start in range(0, len(batch), BATCH_SIZE):
+            result = await synonym_repo.bulk_upsert(batch[start:start + BATCH_SIZE])
+            inserted += result["inserted"]
+            updated += result["updated"]
+
+    return {
+        "records": len(records),
+        "aliases": len(entries),
+        "inserted": inserted,
+        "updated": updated,
+        "unresolved": unresolved,
+        "conflicts": conflicts,
+        "skipped": skipped,
+    }
@@ -0,0 +1,153 @@
+"""
+HTTP 경로 부하 테스트 (처리량 / 꼬리 지연 측정)
+
+GEMINI_BACKEND=replay 로 띄운 서버에 요청을 보내면 Gemini 쿼터 없이 전체 경로를 측정할 수 있다.
+
+[사용 예]
+    # 1) 녹화: 실제 API로 서버를 띄우고 대표 요청을 한 번씩 보냄
+    GEMINI_BACKEND=record uvicorn app.main:app
+    python scripts/bench_http.py recommend --situations situations.txt --requests 50 --concurrency 1
+
+    # 2) 재생: 같은 카세트로 서버를 띄우고 부하 측정
+    GEMINI_BACKEND=replay uvicorn app.main:app --workers 2
+    python scripts/bench_http.py recommend --situations situations.txt --requests 2000 --concurrency 64
+    python scripts/bench_http.py image --image rose.jpg --requests 500 --concurrency 32
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import List, Optional
+
+import httpx
+
+API_PREFIX = "/api/v1/plants"
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _recommend(client: httpx.AsyncClient, situation: str, stream: bool) -> int:
+    path = f"{API_PREFIX}/recommend/stream" if stream else f"{API_PREFIX}/recommend"
+    if not stream:
+        return (await client.post(path, params={"situation": situation})).status_code
+    async with client.stream("POST", path, params={"situation": situation}) as resp:
+        async for _ in resp.aiter_bytes():
+            pass
+        return resp.status_code
+
+
+async def _image(client: httpx.AsyncClient, image: bytes, filename: str) -> int:
+    files = {"file": (filename, image, "image/jpeg")}
+    return (await client.post(f"{API_PREFIX}/search/image", files=files)).status_code
+
+
+async def _image_job(client: httpx.AsyncClient, image: bytes, filename: str, poll_seconds: float) -> int:
+    """작업 접수 → 종료 단계까지 폴링 (종료 단계가 failed면 422로 집계)."""
+    files = {"file": (filename, image, "image/jpeg")}
+    resp = await client.post(f"{API_PREFIX}/search/image/jobs", files=files)
+    if resp.status_code != 202:
+        return resp.status_code
+    status_url = resp.json()["statusUrl"]
+    while True:
+        job = (await client.get(status_url)).json()
+        if job["stage"] == "matched":
+            return 200
+        if job["stage"] == "failed":
+            return 422
+        await asyncio.sleep(poll_seconds)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    situations = itertools.cycle(_load_situations(args.situations))
+    image: Optional[bytes] = None
+    if args.scenario in ("image", "image-job"):
+        with open(args.image, "rb") as f:
+            image = f.read()
+
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    issued = 0
+    lock = asyncio.Lock()
+
+    async def one(client: httpx.AsyncClient) -> None:
+        if args.scenario == "recommend":
+            return await _recommend(client, next(situations), args.stream)
+        if args.scenario == "image":
+            return await _image(client, image, args.image)
+        return await _image_job(client, image, args.image, args.poll_seconds)
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal issued
+        while True:
+            async with lock:
+                if issued >= args.requests:
+                    return
+                issued += 1
+            start = time.perf_counter()
+            try:
+                status = await one(client)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "scenario": args.scenario + ("-stream" if args.stream else ""),
+        "requests": len(latencies),
+        "concurrency": args.concurrency,
+        "elapsedSeconds": round(elapsed, 3),
+        "throughputRps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "latencyMs": {
+            "mean": round(statistics.fmean(ordered) * 1000, 1),
+            "p50": round(_percentile(ordered, 0.50) * 1000, 1),
+            "p90": round(_percentile(ordered, 0.90) * 1000, 1),
+            "p95": round(_percentile(ordered, 0.95) * 1000, 1),
+            "p99": round(_percentile(ordered, 0.99) * 1000, 1),
+            "max": round(ordered[-1] * 1000, 1),
+        } if ordered else {},
+        "statuses": {str(k): v for k, v in statuses.items()},
+    }
+
+
+def _load_situations(path: Optional[str]) -> List[str]:
+    if not path:
+        return ["우울할 때 위로가 되는 꽃", "부모님께 감사 인사를 전하고 싶어요", "연인에게 고백할 때 줄 꽃"]
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Floripedia HTTP 부하 테스트")
+    parser.add_argument("scenario", choices=["recommend", "image", "image-job"])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=200, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--situations", help="상황 텍스트 파일 (한 줄에 하나, 순환 사용)")
+    parser.add_argument("--stream", action="store_true", help="recommend: SSE 엔드포인트 사용 (스트림 끝까지 수신)")
+    parser.add_argument("--image", help="image / image-job: 업로드할 이미지 파일")
+    parser.add_argument("--poll-seconds", type=float, default=0.2, help="image-job: 상태 폴링 간격")
+    args = parser.parse_args()
+
+    if args.scenario in ("image", "image-job") and not args.image:
+        parser.error("--image 가 필요합니다")
+
+    json.dump(asyncio.run(run(args)), sys.stdout, ensure_ascii=False, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+학명 이명(synonym) 파일 일괄 적재
+
+[사용 예]
+    python scripts/load_synonyms.py synonyms.jsonl --dry-run     # 보고서만 출력
+    python scripts/load_synonyms.py synonyms.csv
+
+파일 형식은 app/services/synonym_loader.py 참고.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.index_manager import IndexManager  # noqa: E402
+from app.db.session import mongodb  # noqa: E402
+from app.repositories import PlantRepository, PlantSynonymRepository  # noqa: E402
+from app.services.synonym_loader import load_synonyms, parse_synonym_file  # noqa: E402
+
+
+async def main(args: argparse.Namespace) -> int:
+    records = parse_synonym_file(args.path)
+    await mongodb.connect()
+    try:
+        await IndexManager([PlantSynonymRepository]).reconcile(mongodb.db)
+        synonym_repo = PlantSynonymRepository(mongodb.db)
+        report = await load_synonyms(
+            records,
+            PlantRepository(mongodb.db),
+            synonym_repo,
+            source=os.path.basename(args.path),
+            dry_run=args.dry_run,
+        )
+    finally:
+        await mongodb.close()
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 1 if report["conflicts"] else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="학명 이명 파일 일괄 적재")
+    parser.add_argument("path", help="이명 파일 (.jsonl / .csv)")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 보고서만 출력")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -31,6 +31,7 @@ from mongomock_motor import AsyncMongoMockClient
 
 from app.repositories.plant_repository import PlantRepository
 from app.repositories.user_repository import UserRepository
+from app.schemas.gemini import CatalogChoice, PlantIdentification, PlantName
 
 
 # ============================================
@@ -246,31 +247,72 @@ async def user_repo(mock_db_with_users):
     return UserRepository(mock_db_with_users)
 
 
+# ============================================
+# 프로세스 내 캐시 초기화 (테스트 간 격리)
+# ============================================
+
+@pytest.fixture(autouse=True)
+def reset_in_process_caches():
+    """싱글톤 메모리 캐시가 다른 테스트 결과를 재사용하지 않도록 매 테스트 전 초기화"""
+    from app.services.identification_cache import image_identification_cache
+    from app.services.recommendation_cache import recommendation_cache
+    from app.services.semantic_cache import semantic_recommendation_cache
+    from app.services.recommendation_catalog import recommendation_catalog
+    from app.services.intent_classifier import intent_classifier
+    from app.services.plant_name_index import plant_name_index
+    from app.services.plant_search_index import plant_search_index
+    from app.services.image_search_jobs import job_events
+
+    image_identification_cache.clear()
+    recommendation_cache.clear()
+    semantic_recommendation_cache.clear()
+    recommendation_catalog.clear()
+    intent_classifier.clear()
+    plant_name_index.clear()
+    plant_search_index.clear()
+    job_events.clear()
+    yield
+
+
 # ============================================
 # Gemini Service Mock
 # ============================================
 
+def _async_chunks(chunks):
+    """스트리밍 응답 Mock용 async generator 팩토리"""
+    async def _gen(*args, **kwargs):
+        for chunk in chunks:
+            yield chunk
+    return _gen
+
+
 @pytest.fixture
 def mock_gemini_service():
     """Gemini Service Mock"""
     mock = MagicMock()
 
-    mock.get_plant_name_from_image = AsyncMock(return_value={
-        "name": "장미",
-        "englishName": "Rose",
-        "scientificName": "Rosa canina"
-    })
+    mock.get_plant_name_from_image = AsyncMock(return_value=PlantIdentification(
+        name="장미",
+        english_name="Rose",
+        scientific_name="Rosa canina"
+    ))
+
+    mock.get_plant_name_from_text = AsyncMock(return_value=PlantName(
+        name="라벤더",
+        english_name="Lavender",
+        scientific_name="Lavandula angustifolia"
+    ))
 
-    mock.get_plant_name_from_text = AsyncMock(return_value={
-        "name": "라벤더",
-        "englishName": "Lavender",
-        "scientificName": "Lavandula angustifolia"
-    })
+    mock.choose_plant_from_catalog = AsyncMock(return_value=CatalogChoice(plant_id="2"))
 
     mock.generate_recommendation_essay = AsyncMock(
         return_value="라벤더는 마음의 평화를 선사하는 식물입니다..."
     )
 
+    mock.stream_recommendation_essay = MagicMock(
+        side_effect=_async_chunks(["라벤더는 ", "마음의 평화를 ", "선사하는 식물입니다..."])
+    )
+
     return mock
 
 
@@ -332,26 +374,32 @@ async def test_app(mock_db_full):
         get_current_user_id as _gcui,
         get_current_user_id_optional as _gcuio,
     )
+    from app.repositories import ImageSearchJobRepository
+    from app.services.image_search_jobs import image_search_workers
     from app.services.plant_service import PlantService
     from app.services.user_service import UserService
     from app.services.auth_service import AuthService
 
     plant_repo = PlantRepository(mock_db_full)
+    search_job_repo = ImageSearchJobRepository(mock_db_full)
     user_repo_inst = UserRepository(mock_db_full)
     gemini_mock = MagicMock()
-    gemini_mock.get_plant_name_from_image = AsyncMock(return_value={
-        "name": "장미", "englishName": "Rose", "scientificName": "Rosa canina"
-    })
-    gemini_mock.get_plant_name_from_text = AsyncMock(return_value={
-        "name": "라벤더", "englishName": "Lavender",
-        "scientificName": "Lavandula angustifolia"
-    })
+    gemini_mock.get_plant_name_from_image = AsyncMock(return_value=PlantIdentification(
+        name="장미", english_name="Rose", scientific_name="Rosa canina"
+    ))
+    gemini_mock.get_plant_name_from_text = AsyncMock(return_value=PlantName(
+        name="라벤더", english_name="Lavender",
+        scientific_name="Lavandula angustifolia"
+    ))
     gemini_mock.generate_recommendation_essay = AsyncMock(
         return_value="추천 에세이입니다."
     )
+    gemini_mock.stream_recommendation_essay = MagicMock(
+        side_effect=_async_chunks(["추천 ", "에세이입니다."])
+    )
 
     def override_plant_service():
-        return PlantService(plant_repo, user_repo_inst, gemini_mock)
+        return PlantService(plant_repo, user_repo_inst, gemini_mock, search_job_repo=search_job_repo)
 
     def override_user_service():
         return UserService(user_repo_inst, plant_repo)
@@ -376,6 +424,8 @@ async def test_app(mock_db_full):
         yield app
 
     app.dependency_overrides.clear()
+    # 테스트 이벤트 루프에서 시작된 이미지 검색 워커 정리
+    await image_search_workers.stop()
 
 
 @pytest.fixture
@@ -1,13 +1,18 @@
 """
 API 통합 테스트 — 주요 엔드포인트 패턴 검증
-Plants (4) + Auth (3) + Users (3) = 10개
+Plants (14) + Auth (3) + Users (3) = 20개
 """
+import asyncio
+import io
+import json
+import zipfile
+
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 
 
 # ============================================
-# Plants Endpoints (4개)
+# Plants Endpoints (14개)
 # ============================================
 
 class TestPlantsAPI:
@@ -41,6 +46,105 @@ class TestPlantsAPI:
         data = resp.json()
         assert "name" in data
 
+    @pytest.mark.asyncio
+    async def test_search_image_multiple_files(self, client):
+        """POST /plants/search/image (files 여러 장) -> 200 + 투표 결과"""
+        resp = await client.post(
+            "/api/v1/plants/search/image",
+            files=[
+                ("files", ("flower.jpg", b"fake-flower-bytes", "image/jpeg")),
+                ("files", ("leaf.jpg", b"fake-leaf-bytes", "image/jpeg")),
+            ],
+        )
+
+        assert resp.status_code == 200
+        assert resp.json()["imageVotes"] == 2
+
+    @pytest.mark.asyncio
+    async def test_search_image_too_many_files_400(self, client, monkeypatch):
+        """POST /plants/search/image (최대 장수 초과) -> 400"""
+        monkeypatch.setattr("app.api.v1.endpoints.plants.settings.IMAGE_SEARCH_MAX_IMAGES", 1)
+        resp = await client.post(
+            "/api/v1/plants/search/image",
+            files=[
+                ("files", ("a.jpg", b"a", "image/jpeg")),
+                ("files", ("b.jpg", b"b", "image/jpeg")),
+            ],
+        )
+
+        assert resp.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_search_image_file_too_large_400(self, client, monkeypatch):
+        """POST /plants/search/image (1장 최대 크기 초과) -> 400, 식별 호출 없음"""
+        monkeypatch.setattr("app.api.v1.endpoints.plants.settings.IMAGE_BATCH_MAX_IMAGE_BYTES", 8)
+        resp = await client.post(
+            "/api/v1/plants/search/image",
+            files=[
+                ("files", ("a.jpg", b"small", "image/jpeg")),
+                ("files", ("b.jpg", b"too-large-image", "image/jpeg")),
+            ],
+        )
+
+        assert resp.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_search_image_batch_ndjson(self, client):
+        """POST /plants/search/image/batch (files + zip) -> 이미지별 NDJSON 결과"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("garden/rose.jpg", b"fake-rose-bytes")
+            zf.writestr("garden/notes.txt", b"not an image")
+            zf.writestr("__MACOSX/garden/._rose.jpg", b"metadata")
+
+        resp = await client.post(
+            "/api/v1/plants/search/image/batch",
+            files=[
+                ("files", ("a.jpg", b"fake-a-bytes", "image/jpeg")),
+                ("archive", ("photos.zip", buffer.getvalue(), "application/zip")),
+            ],
+        )
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        items = sorted((json.loads(line) for line in resp.text.splitlines()), key=lambda i: i["index"])
+        assert [i["filename"] for i in items] == ["a.jpg", "garden/rose.jpg"]
+        assert all(i["status"] == "matched" and i["plantId"] for i in items)
+
+    @pytest.mark.asyncio
+    async def test_search_image_batch_bad_zip_400(self, client):
+        """POST /plants/search/image/batch (zip이 아닌 archive) -> 400"""
+        resp = await client.post(
+            "/api/v1/plants/search/image/batch",
+            files={"archive": ("photos.zip", b"not-a-zip", "application/zip")},
+        )
+
+        assert resp.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_search_image_batch_requires_login_401(self, client, test_app):
+        """POST /plants/search/image/batch (비로그인) -> 401"""
+        from app.api.v1.endpoints.deps import get_current_user_id
+        test_app.dependency_overrides.pop(get_current_user_id)
+
+        resp = await client.post(
+            "/api/v1/plants/search/image/batch",
+            files={"files": ("a.jpg", b"fake-a-bytes", "image/jpeg")},
+        )
+
+        assert resp.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_search_image_batch_total_size_413(self, client, monkeypatch):
+        """POST /plants/search/image/batch (업로드 합계 초과) -> 413"""
+        monkeypatch.setattr("app.api.v1.endpoints.plants.settings.IMAGE_BATCH_MAX_TOTAL_BYTES", 1024)
+        resp = await client.post(
+            "/api/v1/plants/search/image/batch",
+            files=[("files", (f"{i}.jpg", b"x" * 400, "image/jpeg")) for i in range(3)],
+        )
+
+        assert resp.status_code == 413
+
     @pytest.mark.asyncio
     async def test_recommend_200(self, client):
         """POST /plants/recommend -> 200 + recommendation 필드"""
@@ -53,6 +157,123 @@ class TestPlantsAPI:
         data = resp.json()
         assert "recommendation" in data
 
+    @pytest.mark.asyncio
+    async def test_recommend_stream_sse(self, client):
+        """POST /plants/recommend/stream -> plant 카드 → essay 조각 → done 순서의 SSE"""
+        resp = await client.post(
+            "/api/v1/plants/recommend/stream",
+            params={"situation": "우울할 때 위로가 되는 꽃"},
+        )
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = [line.split(": ", 1)[1] for line in resp.text.splitlines() if line.startswith("event: ")]
+        assert events == ["plant", "essay", "essay", "done"]
+        assert '"name": "라벤더"' in resp.text
+
+
+    @pytest.mark.asyncio
+    async def test_search_image_job_polling(self, client):
+        """POST /plants/search/image/jobs -> 202 + jobId, 이후 GET 폴링으로 matched 결과 확인"""
+        resp = await client.post(
+            "/api/v1/plants/search/image/jobs",
+            files={"file": ("test.jpg", b"fake-image-bytes", "image/jpeg")},
+        )
+
+        assert resp.status_code == 202
+        job = resp.json()
+        assert job["stage"] == "received"
+        assert job["statusUrl"].endswith(f"/api/v1/plants/search/image/jobs/{job['jobId']}")
+
+        for _ in range(50):
+            status_resp = await client.get(f"/api/v1/plants/search/image/jobs/{job['jobId']}")
+            assert status_resp.status_code == 200
+            if status_resp.json()["stage"] == "matched":
+                break
+            await asyncio.sleep(0.01)
+
+        data = status_resp.json()
+        assert data["stage"] == "matched"
+        assert data["result"]["name"] == "장미"
+        assert data["result"]["isFavorite"] is True
+
+    @pytest.mark.asyncio
+    async def test_search_image_job_events_sse(self, client):
+        """GET /plants/search/image/jobs/{id}/events -> 단계 전환 stage 이벤트 → done"""
+        job = (await client.post(
+            "/api/v1/plants/search/image/jobs",
+            files={"file": ("test.jpg", b"fake-image-bytes", "image/jpeg")},
+        )).json()
+
+        resp = await client.get(f"/api/v1/plants/search/image/jobs/{job['jobId']}/events")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = [line.split(": ", 1)[1] for line in resp.text.splitlines() if line.startswith("event: ")]
+        assert events[0] == "stage" and events[-1] == "done"
+        assert '"stage": "matched"' in resp.text
+
+    @pytest.mark.asyncio
+    async def test_search_image_job_requires_login_401(self, client, test_app):
+        """POST /plants/search/image/jobs (비로그인) -> 401"""
+        from app.api.v1.endpoints.deps import get_current_user_id
+        test_app.dependency_overrides.pop(get_current_user_id)
+
+        resp = await client.post(
+            "/api/v1/plants/search/image/jobs",
+            files={"file": ("test.jpg", b"fake-image-bytes", "image/jpeg")},
+        )
+
+        assert resp.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_search_image_job_too_large_400(self, client, monkeypatch):
+        """POST /plants/search/image/jobs (1장 최대 크기 초과) -> 400, 작업 미접수"""
+        monkeypatch.setattr("app.api.v1.endpoints.plants.settings.IMAGE_BATCH_MAX_IMAGE_BYTES", 8)
+        resp = await client.post(
+            "/api/v1/plants/search/image/jobs",
+            files={"file": ("test.jpg", b"fake-image-bytes", "image/jpeg")},
+        )
+
+        assert resp.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_search_image_job_404(self, client):
+        """GET /plants/search/image/jobs/unknown -> 404"""
+        resp = await client.get("/api/v1/plants/search/image/jobs/unknown")
+
+        assert resp.status_code == 404
+
+
+# ============================================
+# Metrics Endpoints
+# ============================================
+
+class TestMetricsAPI:
+
+    @pytest.mark.asyncio
+    async def test_metrics_disabled_by_default_404(self, client):
+        """GET /metrics (METRICS_ENABLED 꺼짐) -> 404"""
+        resp = await client.get("/api/v1/metrics")
+
+        assert resp.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_metrics_enabled_200(self, client, monkeypatch):
+        """GET /metrics (METRICS_ENABLED 켜짐) -> 200 + 지표"""
+        monkeypatch.setattr("app.api.v1.endpoints.metrics.settings.METRICS_ENABLED", True)
+        resp = await client.get("/api/v1/metrics")
+
+        assert resp.status_code == 200
+        assert "plantStages" in resp.json()
+
+    @pytest.mark.asyncio
+    async def test_index_report_disabled_by_default_404(self, client):
+        """GET /metrics/indexes (METRICS_ENABLED 꺼짐) -> 404, 컬렉션/인덱스 구성 비노출"""
+        resp = await client.get("/api/v1/metrics/indexes")
+
+        assert resp.status_code == 404
+
 
 # ============================================
 # Auth Endpoints (3개)
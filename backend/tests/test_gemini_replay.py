@@ -0,0 +1,137 @@
+"""
+Gemini 녹화/재생 백엔드 테스트
+- 녹화 → 재생 왕복 (GeminiService 호출 경로 그대로)
+- 지문 불일치 시 동작 (같은 호출 형태 재사용 / strict 실패)
+- 녹화 지연 분포 샘플링
+"""
+import asyncio
+import json
+import random
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from google.genai import types
+
+from app.schemas.gemini import PlantName
+from app.services.gemini_replay import Cassette, RecordingClient, ReplayClient
+from app.services.gemini_service import GeminiService
+
+
+def _sdk_response(text: str) -> types.GenerateContentResponse:
+    return types.GenerateContentResponse(
+        candidates=[types.Candidate(content=types.Content(role="model", parts=[types.Part(text=text)]))],
+        usage_metadata=types.GenerateContentResponseUsageMetadata(prompt_token_count=12, candidates_token_count=5),
+    )
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    return str(tmp_path / "cassettes" / "gemini.jsonl")
+
+
+@pytest.fixture
+def live_client():
+    """실제 API 대신 응답을 돌려주는 inner 클라이언트"""
+    client = MagicMock()
+    client.aio.models.generate_content = AsyncMock(return_value=_sdk_response('{"name": "장미"}'))
+    return client
+
+
+async def _record(cassette_path, live_client, prompts):
+    service = GeminiService()
+    service.client = RecordingClient(live_client, Cassette.load(cassette_path))
+    return [await service._generate_content([p], schema=PlantName) for p in prompts]
+
+
+class TestRecordReplay:
+    """녹화한 응답을 네트워크 없이 재생"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, cassette_path, live_client):
+        """녹화 결과와 같은 응답을 재생하고 inner 클라이언트는 호출하지 않음"""
+        recorded = await _record(cassette_path, live_client, ["prompt-a"])
+
+        cassette = Cassette.load(cassette_path)
+        assert cassette.stats()["entries"] == 1
+
+        service = GeminiService()
+        service.client = ReplayClient(cassette, latency_scale=0)
+        replayed = await service._generate_content(["prompt-a"], schema=PlantName)
+
+        assert replayed == recorded[0] == PlantName(name="장미")
+        assert live_client.aio.models.generate_content.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_usage_metadata_preserved(self, cassette_path, live_client):
+        """토큰 사용량도 함께 녹화/재생"""
+        recorder = RecordingClient(live_client, Cassette.load(cassette_path))
+        await recorder.aio.models.generate_content(model="m", contents=["prompt-a"])
+
+        replay = ReplayClient(Cassette.load(cassette_path), latency_scale=0)
+        response = await replay.aio.models.generate_content(model="m", contents=["prompt-a"])
+
+        assert response.text == '{"name": "장미"}'
+        assert response.usage_metadata.prompt_token_count == 12
+
+    @pytest.mark.asyncio
+    async def test_miss_reuses_same_shape_unless_strict(self, cassette_path, live_client):
+        """처음 보는 프롬프트: 기본은 같은 호출 형태 응답 재사용, strict면 실패(None)"""
+        await _record(cassette_path, live_client, ["prompt-a"])
+        cassette = Cassette.load(cassette_path)
+
+        service = GeminiService()
+        service.client = ReplayClient(cassette, latency_scale=0)
+        assert await service._generate_content(["other prompt"], schema=PlantName) == PlantName(name="장미")
+
+        service = GeminiService()
+        service.client = ReplayClient(cassette, latency_scale=0, strict=True)
+        assert await service._generate_content(["other prompt"], schema=PlantName) is None
+
+    @pytest.mark.asyncio
+    async def test_stream_round_trip(self, cassette_path):
+        """스트리밍 응답은 조각 단위로 녹화/재생"""
+        async def fake_stream():
+            for text in ["라벤더는 ", "평화를 ", "줍니다."]:
+                yield _sdk_response(text)
+
+        live = MagicMock()
+        live.aio.models.generate_content_stream = AsyncMock(return_value=fake_stream())
+        recorder = RecordingClient(live, Cassette.load(cassette_path))
+        stream = await recorder.aio.models.generate_content_stream(model="m", contents=["essay"])
+        assert [c.text async for c in stream] == ["라벤더는 ", "평화를 ", "줍니다."]
+
+        replay = ReplayClient(Cassette.load(cassette_path), latency_scale=0)
+        stream = await replay.aio.models.generate_content_stream(model="m", contents=["essay"])
+        assert [c.text async for c in stream] == ["라벤더는 ", "평화를 ", "줍니다."]
+
+
+    @pytest.mark.asyncio
+    async def test_concurrent_records_written_off_loop(self, cassette_path, live_client):
+        """녹화 파일 쓰기는 스레드에서 수행하고, 동시에 기록해도 한 줄에 한 건씩 남음"""
+        recorder = RecordingClient(live_client, Cassette.load(cassette_path))
+        with patch("app.services.gemini_replay.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            await asyncio.gather(*[
+                recorder.aio.models.generate_content(model="m", contents=[f"prompt-{i}"]) for i in range(10)
+            ])
+
+        assert to_thread.call_count == 10
+        with open(cassette_path, encoding="utf-8") as f:
+            assert sorted(json.loads(line)["key"] for line in f) == sorted(recorder.cassette._by_key)
+
+
+class TestLatencySampling:
+    """재생 지연은 녹화된 분포에서 샘플링"""
+
+    @pytest.mark.asyncio
+    async def test_samples_from_recorded_distribution(self, cassette_path):
+        cassette = Cassette(cassette_path)
+        for i, latency in enumerate([100.0, 200.0, 1500.0]):
+            await cassette.append({"shape": "s", "key": f"k{i}", "model": "m", "kind": "generate", "latencyMs": latency, "text": "{}"})
+
+        rng = random.Random(0)
+        samples = {cassette.sample_latency({"shape": "s", "model": "m", "kind": "generate"}, rng) for _ in range(50)}
+
+        assert samples == {0.1, 0.2, 1.5}
+        # 다시 읽어도 같은 분포
+        assert Cassette.load(cassette_path).stats()["entries"] == 3
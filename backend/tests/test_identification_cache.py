@@ -0,0 +1,138 @@
+"""
+ImageIdentificationCache 단위/통합 테스트
+- 메모리 정확/유사 일치, MongoDB 영구 캐시, PlantService 연동
+"""
+import io
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from PIL import Image, ImageDraw
+
+from app.repositories.image_cache_repository import ImageCacheRepository
+from app.schemas.gemini import PlantIdentification
+from app.services.identification_cache import ImageIdentificationCache
+from app.services.image_service import ImagePreprocessor, PreparedImage
+from app.services.plant_service import PlantService
+
+ROSE = PlantIdentification(name="장미", english_name="Rose", scientific_name="Rosa canina")
+
+
+def _prepared(sha256: str, dhash: int) -> PreparedImage:
+    return PreparedImage(
+        data=b"x", mime_type="image/jpeg", width=1, height=1,
+        original_size=1, sha256=sha256, dhash=dhash,
+    )
+
+
+def _photo_bytes(shift: int = 0) -> bytes:
+    """테스트용 사진 (shift로 살짝 다른 재촬영 흉내)"""
+    image = Image.new("RGB", (640, 480), (30, 120, 40))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((200 + shift, 120, 440 + shift, 360), fill=(220, 20, 60))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+class TestMemoryTier:
+    """1차(메모리) 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_exact_hit(self):
+        """같은 SHA-256 → 정확 일치"""
+        cache = ImageIdentificationCache(maxsize=10, ttl_seconds=60, max_distance=4, enabled=True)
+        await cache.set(_prepared("a" * 64, 0b1010), ROSE)
+
+        result = await cache.get(_prepared("a" * 64, 0b1010))
+
+        assert result == ROSE
+        assert cache.stats()["exactHits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_perceptual_hit_within_distance(self):
+        """해밍 거리 허용치 이내 → 유사 일치"""
+        cache = ImageIdentificationCache(maxsize=10, ttl_seconds=60, max_distance=4, enabled=True)
+        await cache.set(_prepared("a" * 64, 0xFFFF_0000_FFFF_0000), ROSE)
+
+        near = await cache.get(_prepared("b" * 64, 0xFFFF_0000_FFFF_0007))   # 3비트 차이
+        far = await cache.get(_prepared("c" * 64, 0x0000_FFFF_0000_FFFF))    # 64비트 차이
+
+        assert near == ROSE
+        assert far is None
+        assert cache.stats()["perceptualHits"] == 1
+        assert cache.stats()["misses"] == 1
+
+
+class TestPersistentTier:
+    """2차(MongoDB) 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_persistent_hit_after_memory_reset(self, mock_db):
+        """메모리 캐시가 비어 있어도 MongoDB에서 유사 일치"""
+        repo = ImageCacheRepository(mock_db)
+        writer = ImageIdentificationCache(maxsize=10, ttl_seconds=60, max_distance=4, enabled=True)
+        await writer.set(_prepared("a" * 64, 0x1234_5678_9ABC_DEF0), ROSE, repo)
+
+        reader = ImageIdentificationCache(maxsize=10, ttl_seconds=60, max_distance=4, enabled=True)
+        result = await reader.get(_prepared("d" * 64, 0x1234_5678_9ABC_DEF1), repo)
+
+        assert result == ROSE
+        assert reader.stats()["persistentHits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_not_crowded_out(self, mock_db):
+        """밴드 하나만 겹친 먼 후보가 많아도 진짜 유사 이미지를 찾음"""
+        repo = ImageCacheRepository(mock_db)
+        cache = ImageIdentificationCache(maxsize=10, ttl_seconds=60, max_distance=4, enabled=True)
+        target = 0x1234_5678_9ABC_DEF0
+        far = target ^ 0xFFFF_FFFF_FFFF_FF00  # 최하위 밴드만 같고 나머지 비트는 모두 다른 해시
+        for i in range(80):
+            await repo.upsert(f"{i:064x}", far, {"name": "라벤더"}, 60, variant=cache.variant())
+        await repo.upsert("a" * 64, target, ROSE.model_dump(by_alias=True, exclude_none=True), 60, variant=cache.variant())
+
+        candidates = await repo.find_by_dhash_bands(target ^ 0b11, cache.variant(), min_bands=4)
+        result = await cache.get(_prepared("d" * 64, target ^ 0b11), repo)
+
+        assert [c["_id"] for c in candidates] == ["a" * 64]
+        assert result == ROSE
+
+    @pytest.mark.asyncio
+    async def test_identify_settings_change_misses(self, mock_db, monkeypatch):
+        """식별 방식 / 후보 수가 바뀌면 이전 설정의 결과는 메모리 / MongoDB 모두 재사용하지 않음"""
+        repo = ImageCacheRepository(mock_db)
+        cache = ImageIdentificationCache(maxsize=10, ttl_seconds=60, max_distance=4, enabled=True)
+        prepared = _prepared("a" * 64, 0x1234_5678_9ABC_DEF0)
+        await cache.set(prepared, ROSE, repo)
+
+        monkeypatch.setattr("app.services.identification_cache.settings.GEMINI_IDENTIFY_MODE", "two_step")
+        changed_mode = await cache.get(prepared, repo)
+        monkeypatch.setattr("app.services.identification_cache.settings.GEMINI_IDENTIFY_MODE", "fused")
+        monkeypatch.setattr("app.services.identification_cache.settings.GEMINI_IDENTIFY_TOP_K", 5)
+        changed_top_k = await cache.get(_prepared("d" * 64, 0x1234_5678_9ABC_DEF1), repo)
+
+        assert changed_mode is None and changed_top_k is None
+        assert cache.stats()["misses"] == 2
+
+
+class TestPlantServiceCache:
+    """search_by_image 캐시 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_retake_skips_gemini(self, plant_repo, mock_gemini_service):
+        """같은 사진 / 살짝 다른 재촬영은 Gemini를 다시 호출하지 않음"""
+        user_repo = MagicMock()
+        user_repo.get_favorites = AsyncMock(return_value=[])
+        preprocessor = ImagePreprocessor(max_edge=256, workers=1)
+        cache = ImageIdentificationCache(maxsize=10, ttl_seconds=60, max_distance=6, enabled=True)
+        service = PlantService(
+            plant_repo, user_repo, mock_gemini_service,
+            preprocessor=preprocessor, image_cache=cache,
+        )
+
+        first = await service.search_by_image(_photo_bytes(), user_id=None)
+        again = await service.search_by_image(_photo_bytes(), user_id=None)
+        retake = await service.search_by_image(_photo_bytes(shift=3), user_id=None)
+        preprocessor.shutdown()
+
+        assert first["name"] == again["name"] == retake["name"] == "장미"
+        assert mock_gemini_service.get_plant_name_from_image.await_count == 1
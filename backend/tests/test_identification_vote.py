@@ -0,0 +1,62 @@
+"""
+여러 장 사진 식별 투표 테스트
+- 학명 기준 가중 합산 / 합산 신뢰도
+- 사진당 1표, 후보 없는 이전 캐시 항목 처리
+"""
+from app.schemas.gemini import PlantCandidate, PlantIdentification
+from app.services.identification_vote import vote_identifications
+
+
+def _identified(*candidates) -> PlantIdentification:
+    ranked = [PlantCandidate(name=n, scientific_name=s, confidence=c) for n, s, c in candidates]
+    best = ranked[0]
+    return PlantIdentification(
+        name=best.name, scientific_name=best.scientific_name, confidence=best.confidence, candidates=ranked
+    )
+
+
+class TestVoteIdentifications:
+    """학명 기준 가중 투표"""
+
+    def test_weighted_sum_beats_single_top_choice(self):
+        """한 장의 1위보다 여러 장에서 고르게 나온 학명이 이김"""
+        result, votes = vote_identifications([
+            _identified(("해당화", "Rosa rugosa", 0.6), ("장미", "Rosa canina", 0.4)),
+            _identified(("장미", "Rosa canina", 0.7)),
+            _identified(("장미", "rosa  CANINA", 0.5), ("해당화", "Rosa rugosa", 0.2)),
+        ], total_images=3)
+
+        assert result.scientific_name == "Rosa canina"
+        assert result.confidence == round(1.6 / 3, 4)
+        assert votes == 3
+        assert [c.scientific_name for c in result.candidates] == ["Rosa canina", "Rosa rugosa"]
+
+    def test_author_and_rank_variants_share_vote(self):
+        """저자명 / 종 이하 계급만 다른 학명은 같은 종으로 합산"""
+        result, votes = vote_identifications([
+            _identified(("장미", "Rosa canina L.", 0.5), ("해당화", "Rosa rugosa", 0.45)),
+            _identified(("장미", "Rosa canina", 0.3), ("해당화", "Rosa rugosa Thunb.", 0.45)),
+            _identified(("장미", "Rosa canina var. dumalis", 0.4)),
+        ], total_images=3)
+
+        assert result.scientific_name == "Rosa canina L."
+        assert votes == 3
+        assert result.confidence == round(1.2 / 3, 4)
+
+    def test_failed_images_lower_confidence(self):
+        """식별 실패한 사진은 기권(0표)으로 합산 신뢰도를 낮춤"""
+        result, votes = vote_identifications([_identified(("장미", "Rosa canina", 0.9))], total_images=3)
+
+        assert result.confidence == 0.3
+        assert votes == 1
+
+    def test_legacy_entry_without_candidates(self):
+        """후보 없이 저장된 식별 결과는 대표 이름 1표 (신뢰도 미기재 시 1.0)"""
+        result, _ = vote_identifications(
+            [PlantIdentification(name="라벤더", scientific_name="Lavandula angustifolia")], total_images=1
+        )
+
+        assert (result.name, result.confidence) == ("라벤더", 1.0)
+
+    def test_no_identifications(self):
+        assert vote_identifications([], total_images=2) == (None, 0)
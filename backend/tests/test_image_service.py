@@ -0,0 +1,76 @@
+"""
+ImagePreprocessor 단위 테스트
+- EXIF 회전 / 축소 / 메타데이터 제거 / 디코딩 실패 시 원본 전달
+- shutdown() 이후 재사용 (lifespan 재시작)
+"""
+import io
+
+import pytest
+from PIL import Image
+
+from app.services.image_service import ImagePreprocessor
+
+
+def _jpeg_bytes(width: int, height: int, orientation: int = None) -> bytes:
+    """테스트용 JPEG 생성 (선택적으로 EXIF Orientation 포함)"""
+    image = Image.new("RGB", (width, height), (200, 30, 60))
+    buffer = io.BytesIO()
+    if orientation:
+        exif = Image.Exif()
+        exif[0x0112] = orientation  # Orientation 태그
+        image.save(buffer, format="JPEG", exif=exif.tobytes())
+    else:
+        image.save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def preprocessor():
+    pre = ImagePreprocessor(max_edge=256, output_format="JPEG", quality=80, workers=1)
+    yield pre
+    pre.shutdown()
+
+
+class TestPrepare:
+    """prepare() 정규화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_downscale_longest_edge(self, preprocessor: ImagePreprocessor):
+        """긴 변이 max_edge로 축소되고 바이트도 줄어듦"""
+        original = _jpeg_bytes(2000, 1000)
+
+        result = await preprocessor.prepare(original)
+
+        assert result.processed is True
+        assert max(result.width, result.height) == 256
+        assert result.mime_type == "image/jpeg"
+        assert len(result.data) < len(original)
+
+    @pytest.mark.asyncio
+    async def test_exif_orientation_applied_and_stripped(self, preprocessor: ImagePreprocessor):
+        """EXIF 회전(90도)이 픽셀에 반영되고 EXIF는 제거됨"""
+        original = _jpeg_bytes(400, 200, orientation=6)
+
+        result = await preprocessor.prepare(original)
+
+        assert (result.width, result.height) == (128, 256)
+        assert 0x0112 not in Image.open(io.BytesIO(result.data)).getexif()
+
+    @pytest.mark.asyncio
+    async def test_undecodable_passthrough(self, preprocessor: ImagePreprocessor):
+        """디코딩 불가 바이트는 원본 그대로 전달"""
+        result = await preprocessor.prepare(b"not-an-image")
+
+        assert result.processed is False
+        assert result.data == b"not-an-image"
+
+    @pytest.mark.asyncio
+    async def test_reusable_after_shutdown(self, preprocessor: ImagePreprocessor):
+        """종료 후 다시 호출해도 원본으로 조용히 빠지지 않고 새 스레드 풀에서 정규화"""
+        await preprocessor.prepare(_jpeg_bytes(64, 64))
+        preprocessor.shutdown()
+
+        result = await preprocessor.prepare(_jpeg_bytes(512, 256))
+
+        assert result.processed is True
+        assert (result.width, result.height) == (256, 128)
@@ -0,0 +1,65 @@
+"""
+인덱스 관리 테스트
+- 선언된 인덱스 생성 (반복 실행 시 변화 없음)
+- 누락 / 정의 불일치 / 선언 외 인덱스, 커버되지 않는 조회 필드 보고
+- 시작 시 점검 결과를 로그로 남김
+"""
+import logging
+
+import pytest
+
+from app.db.index_manager import IndexManager
+from app.repositories import INDEXED_REPOSITORIES, PlantRepository
+
+
+class TestIndexManager:
+    """Repository 선언 ↔ 실제 인덱스"""
+
+    @pytest.mark.asyncio
+    async def test_reconcile_creates_declared_indexes(self, mock_db_with_plants):
+        manager = IndexManager(INDEXED_REPOSITORIES)
+
+        first = await manager.reconcile(mock_db_with_plants)
+        second = await manager.reconcile(mock_db_with_plants)
+        report = await manager.report(mock_db_with_plants)
+
+        assert "plants.colorGroup" in first["created"]
+        assert "image_search_jobs.expiresAt_ttl" in first["created"]
+        assert second == {"created": [], "failed": {}}
+        assert report["ok"] is True
+        info = await mock_db_with_plants.plants.index_information()
+        assert list(info["colorGroup"]["key"]) == [("colorInfo.colorGroup", 1)]
+
+    @pytest.mark.asyncio
+    async def test_report_drift(self, mock_db_with_plants):
+        """README의 snake_case 인덱스처럼 실제 조회 필드와 다른 인덱스는 선언 외 + 미커버 필드로 드러남"""
+        manager = IndexManager([PlantRepository])
+        await manager.reconcile(mock_db_with_plants)
+        plants = mock_db_with_plants.plants
+        await plants.drop_index("colorGroup")
+        await plants.create_index([("color_info.color_group", 1)], name="color_info.color_group")
+        await plants.drop_index("name")
+        await plants.create_index([("name", 1)], name="name", unique=True)
+
+        report = await manager.report(mock_db_with_plants)
+
+        drift = report["collections"]["plants"]
+        assert report["ok"] is False
+        assert drift["missing"] == ["colorGroup"]
+        assert [m["name"] for m in drift["mismatched"]] == ["name"]
+        assert drift["undeclared"] == ["color_info.color_group"]
+        assert drift["uncoveredFields"] == ["colorInfo.colorGroup", "flowerInfo.language"]
+
+    @pytest.mark.asyncio
+    async def test_startup_logs_drift(self, mock_db_with_plants, caplog):
+        """백그라운드 점검은 누락 인덱스를 만들고, 고칠 수 없는 차이는 경고 로그로 남김"""
+        manager = IndexManager([PlantRepository])
+        plants = mock_db_with_plants.plants
+        await plants.create_index([("name", 1)], name="name", unique=True)
+
+        with caplog.at_level(logging.WARNING, logger="app.db.index_manager"):
+            await manager._reconcile_in_background(mock_db_with_plants)
+
+        warnings = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+        assert len(warnings) == 1
+        assert "(plants)" in warnings[0] and "mismatched" in warnings[0]
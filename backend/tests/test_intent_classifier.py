@@ -0,0 +1,99 @@
+"""
+IntentClassifier 단위 테스트
+- 키워드 / n-gram 점수 / 확신 임계값 / 빠른 경로 연동
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from app.services.intent_classifier import IntentClassifier
+from app.services.plant_service import PlantService
+
+
+@pytest.fixture
+def classifier():
+    return IntentClassifier(min_score=1.0, confidence=0.75, refresh_seconds=60, enabled=True)
+
+
+class TestIntentClassifier:
+    """의도 분류 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_confident_keyword_match(self, classifier, plant_repo):
+        """한 그룹 키워드만 있으면 확신"""
+        match = await classifier.classify("좋아하는 사람에게 고백하고 싶어요", plant_repo)
+
+        assert match.group == "사랑/고백"
+        assert match.confidence == 1.0
+
+    @pytest.mark.asyncio
+    async def test_catalog_keywords_used(self, classifier, plant_repo):
+        """카탈로그의 꽃말/검색 키워드도 사전에 포함 (라벤더: 허브 → 위로/슬픔)"""
+        match = await classifier.classify("허브 향을 맡고 싶어", plant_repo)
+
+        assert match.group == "위로/슬픔"
+
+    @pytest.mark.asyncio
+    async def test_mixed_intent_not_confident(self, classifier, plant_repo):
+        """여러 그룹이 섞이면 Gemini 경로로 넘김"""
+        assert await classifier.classify("여자친구와 헤어진 뒤 우울해요", plant_repo) is None
+        assert classifier.stats()["attempts"] == 1
+        assert classifier.stats()["hits"] == 0
+
+    def test_keyword_matches_whole_word(self):
+        """조사 / 활용 어미는 떼고 비교하되, 다른 단어 안에 들어 있는 키워드는 무시"""
+        classifier = IntentClassifier(min_score=0.0, confidence=0.0, enabled=True)
+        classifier._keywords = IntentClassifier.build_lexicon([
+            {"_id": "1", "flowerInfo": {"language": "작별", "flowerGroup": "이별/그리움"}},
+            {"_id": "2", "flowerInfo": {"language": "사랑", "flowerGroup": "사랑/고백"}},
+        ])
+
+        assert classifier.score("친구와 헤어진 날").group == "이별/그리움"
+        assert classifier.score("헤어스타일 바꾸는 날") is None
+        assert classifier.score("사랑이 담긴 선물").group == "사랑/고백"
+
+    def test_disabled_by_default(self):
+        """기본값은 끔 (기존 /recommend Gemini 선정 동작 유지)"""
+        assert IntentClassifier().enabled is False
+
+    @pytest.mark.asyncio
+    async def test_groups_without_plants_ignored(self, classifier, plant_repo):
+        """카탈로그에 식물이 없는 그룹(감사/존경)은 후보가 아님"""
+        assert await classifier.classify("선생님께 감사 인사", plant_repo) is None
+
+    def test_partial_ngram_match(self):
+        """띄어쓰기/어순이 다른 꽃말도 bigram 겹침으로 부분 점수"""
+        classifier = IntentClassifier(min_score=0.0, confidence=0.0, enabled=True)
+        classifier._keywords = IntentClassifier.build_lexicon([
+            {"_id": "1", "flowerInfo": {"language": "변치않는사랑", "flowerGroup": "사랑/고백"}},
+        ])
+
+        match = classifier.score("사랑이 변치 않는 꽃")
+
+        assert match.group == "사랑/고백"
+        assert match.score == 1.8  # "사랑" 완전 일치 1.0 + "변치않는사랑" bigram 4/5
+
+
+class TestIntentFastPath:
+    """recommend_plants 빠른 경로 연동"""
+
+    @pytest.mark.asyncio
+    async def test_fast_path_skips_gemini_selection(self, plant_repo, mock_gemini_service, classifier):
+        """확신하면 그룹 인기 1위 식물을 Gemini 선정 호출 없이 추천"""
+        service = PlantService(plant_repo, MagicMock(), mock_gemini_service, intent=classifier)
+
+        result = await service.recommend_plants("고백할 때 줄 꽃")
+
+        assert result["name"] == "장미"
+        mock_gemini_service.get_plant_name_from_text.assert_not_awaited()
+        mock_gemini_service.generate_recommendation_essay.assert_awaited_once()
+        assert classifier.stats()["groups"] == {"사랑/고백": 1}
+
+    @pytest.mark.asyncio
+    async def test_unconfident_falls_back_to_gemini(self, plant_repo, mock_gemini_service, classifier):
+        """확신이 없으면 기존 Gemini 선정 경로"""
+        service = PlantService(plant_repo, MagicMock(), mock_gemini_service, intent=classifier)
+
+        result = await service.recommend_plants("잠 못 드는 밤")
+
+        assert result["name"] == "라벤더"
+        mock_gemini_service.get_plant_name_from_text.assert_awaited_once()
@@ -0,0 +1,60 @@
+"""
+운영 지표 유틸리티 테스트
+- 지연 히스토그램 버킷 / 분위수
+- 단계 타이머 결과 기록
+"""
+import pytest
+
+from app.core.metrics import CallMetrics, LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """고정 버킷 히스토그램"""
+
+    def test_buckets_are_cumulative(self):
+        hist = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.5, 0.7, 3.0):
+            hist.observe(seconds)
+
+        stats = hist.stats()
+        assert stats["buckets"] == {"0.1": 1, "1.0": 3, "+Inf": 4}
+        assert stats["count"] == 4
+        assert stats["maxSeconds"] == 3.0
+
+    def test_quantile_interpolates_within_bucket(self):
+        hist = LatencyHistogram(buckets=(1.0, 2.0))
+        for _ in range(100):
+            hist.observe(1.5)
+
+        # 모든 표본이 (1, 2] 버킷 → p50은 버킷 내 보간, 상한은 관측 최댓값으로 제한
+        assert 1.0 < hist.quantile(0.5) <= 1.5
+        assert hist.quantile(0.99) <= 1.5
+        assert LatencyHistogram().quantile(0.5) is None
+
+
+class TestCallMetrics:
+    """이름별 호출 지표"""
+
+    def test_timer_records_outcome(self):
+        metrics = CallMetrics()
+
+        with metrics.timer("search"):
+            pass
+        with pytest.raises(ValueError):
+            with metrics.timer("search"):
+                raise ValueError("없음")
+
+        stats = metrics.stats()["search"]
+        assert stats["outcomes"] == {"ok": 1, "ValueError": 1}
+        assert stats["latency"]["count"] == 2
+
+    def test_tokens_accumulate(self):
+        metrics = CallMetrics()
+        metrics.get("m").record("ok", 0.2, {"prompt": 10, "response": 3})
+        metrics.get("m").record("ok", 0.3, {"prompt": 5})
+        metrics.get("m").record("cancelled")
+
+        stats = metrics.stats()["m"]
+        assert stats["tokens"] == {"prompt": 15, "response": 3}
+        assert stats["calls"] == 3
+        assert stats["latency"]["count"] == 2
@@ -0,0 +1,135 @@
+"""
+식물 이름 인덱스 테스트
+- 학명 정규화 (저자명 / var. / subsp.)
+- 후보 순위 / 필드 우선순위
+- 한글명 근사 일치 (자모 편집 거리)
+- 카탈로그 변경 시 재적재
+"""
+import pytest
+
+from app.core.fuzzy import DeletionIndex, levenshtein
+from app.core.text import decompose_hangul, normalize_name, normalize_scientific_name
+from app.schemas.gemini import PlantName
+from app.services.plant_name_index import PlantNameIndex
+
+
+class TestNormalization:
+    """이름 / 학명 정규화 키"""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("Rosa canina L.", "rosa canina"),
+        ("  rosa   CANINA ", "rosa canina"),
+        ("Hibiscus syriacus (L.) Thunb. var. alba", "hibiscus syriacus var. alba"),
+        ("Lavandula angustifolia Mill. ssp. angustifolia", "lavandula angustifolia subsp. angustifolia"),
+        ("Rosa ×damascena", "rosa x damascena"),
+        ("Rosa", "rosa"),
+    ])
+    def test_scientific_name(self, raw, expected):
+        assert normalize_scientific_name(raw) == expected
+
+    def test_common_name(self):
+        assert normalize_name("Forget-me-not") == normalize_name("forget me not") == "forgetmenot"
+        assert normalize_name("장 미") == "장미"
+
+
+class TestFuzzy:
+    """자모 분해 + 편집 거리 색인"""
+
+    @pytest.mark.parametrize("a, b, expected", [
+        ("kitten", "sitting", 3),
+        ("", "abc", 3),
+        ("flaw", "lawn", 2),
+        ("같다", "같다", 0),
+    ])
+    def test_levenshtein(self, a, b, expected):
+        assert levenshtein(a, b) == expected == levenshtein(b, a)
+
+    def test_jamo_distance(self):
+        """음절 1개 차이도 자모로는 1~2 차이"""
+        assert levenshtein(decompose_hangul("해바라기"), decompose_hangul("해바리기")) == 1
+        assert levenshtein(decompose_hangul("장미"), decompose_hangul("장마")) == 1
+
+    def test_index_search_order(self):
+        """거리 순, 같은 거리는 먼저 넣은 값"""
+        index = DeletionIndex(max_distance=2)
+        for key, value in [("abcd", 1), ("abce", 2), ("abxd", 3), ("zzzz", 4)]:
+            index.add(key, value)
+
+        assert [(d, v) for d, _, v in index.search("abcd", 1)] == [(0, 1), (1, 2), (1, 3)]
+        assert index.search("qqqq", 2) == []
+
+
+class TestLookup:
+    """후보 → 카탈로그 _id"""
+
+    @pytest.fixture
+    def snapshot(self):
+        return PlantNameIndex.build([
+            {"_id": "1", "name": "장미", "englishName": "Rose", "scientificName": "Rosa canina",
+             "taxonomy": {"genus": "Rosa"}, "searchKeywords": ["장미", "들장미"], "popularity_score": 600},
+            {"_id": "2", "name": "라벤더", "englishName": "Lavender",
+             "scientificName": "Lavandula angustifolia subsp. angustifolia",
+             "taxonomy": {"genus": "Lavandula"}, "searchKeywords": ["허브"], "popularity_score": 480},
+            {"_id": "3", "name": "로즈마리", "englishName": "Rosemary", "scientificName": "Salvia rosmarinus",
+             "taxonomy": {"genus": "Salvia"}, "searchKeywords": ["허브"], "popularity_score": 300},
+        ])
+
+    def test_author_and_rank_variants(self, snapshot):
+        """저자명이 붙거나 종 수준으로만 답해도 같은 식물"""
+        match = PlantNameIndex.lookup(snapshot, [PlantName(name="?", scientific_name="Lavandula angustifolia Mill.")])
+
+        assert (match.plant_id, match.matched_by) == ("2", "species")
+
+    def test_english_name_used(self, snapshot):
+        """학명/한글명이 달라도 영문명으로 일치"""
+        match = PlantNameIndex.lookup(snapshot, [PlantName(name="서양장미", english_name="rose")])
+
+        assert (match.plant_id, match.matched_by) == ("1", "englishName")
+
+    def test_exact_lower_rank_beats_genus(self, snapshot):
+        """1위 후보의 속 일치보다 2위 후보의 정확 일치 우선, 공유 키워드(허브)는 사용 안 함"""
+        match = PlantNameIndex.lookup(snapshot, [
+            PlantName(name="허브", scientific_name="Rosa rugosa"),
+            PlantName(name="로즈마리"),
+        ])
+
+        assert (match.plant_id, match.matched_by, match.rank) == ("3", "name", 2)
+
+    @pytest.mark.parametrize("name, plant_id", [
+        ("장미꽃", "1"),          # 접미사
+        ("라벤다", "2"),          # 음절 1개
+        ("로즈 마리", "3"),       # 띄어쓰기 (정확 일치)
+    ])
+    def test_fuzzy_korean_name(self, snapshot, name, plant_id):
+        match = PlantNameIndex.lookup(snapshot, [PlantName(name=name)])
+
+        assert match.plant_id == plant_id
+
+    def test_fuzzy_rejects_other_genus(self, snapshot):
+        """근사 일치한 식물의 속이 후보 학명의 속과 다르면 버리고 속 일치로"""
+        match = PlantNameIndex.lookup(snapshot, [PlantName(name="라벤다", scientific_name="Rosa rugosa")])
+
+        assert (match.plant_id, match.matched_by) == ("1", "genus")
+
+    def test_short_name_needs_exact(self, snapshot):
+        """짧은 이름은 허용 거리가 작아 엉뚱한 식물과 이어지지 않음"""
+        assert PlantNameIndex.lookup(snapshot, [PlantName(name="자미")]) is None
+
+
+class TestRefresh:
+    """카탈로그 변경 반영"""
+
+    @pytest.mark.asyncio
+    async def test_reloads_after_catalog_change(self, plant_repo, mock_db_with_plants):
+        """갱신 주기가 지나면 새로 추가된 식물도 찾음"""
+        index = PlantNameIndex(refresh_seconds=0)
+        candidate = [PlantName(name="물망초", scientific_name="Myosotis sylvatica")]
+        assert await index.resolve(candidate, plant_repo) is None
+
+        await mock_db_with_plants.plants.insert_one(
+            {"_id": "9", "name": "물망초", "scientificName": "Myosotis sylvatica Ehrh. ex Hoffm."}
+        )
+        match = await index.resolve(candidate, plant_repo)
+
+        assert match.plant_id == "9"
+        assert index.stats()["changes"] == 2
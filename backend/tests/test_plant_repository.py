@@ -1,6 +1,7 @@
 """
 PlantRepository 단위 테스트
 - find_by_scientific_name_fuzzy 메서드 검증
+- find_by_candidates 일괄 조회 검증
 """
 import pytest
 
@@ -76,3 +77,40 @@ class TestGetByName:
         result = await plant_repo.get_by_name("존재하지않는꽃")
 
         assert result is None
+
+
+class TestFindByCandidates:
+    """식별 후보 일괄 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_exact_before_genus(self, plant_repo: PlantRepository):
+        """정확 일치가 있으면 그것만, 없을 때만 속 일치 조회"""
+        exact = await plant_repo.find_by_candidates(["Rosa rugosa"], ["라벤더"])
+        genus = await plant_repo.find_by_candidates(["rosa rugosa"], ["해당화"])
+
+        assert [p["name"] for p in exact] == ["라벤더"]
+        assert [p["name"] for p in genus] == ["장미"]
+
+    @pytest.mark.asyncio
+    async def test_large_genus_does_not_hide_exact(self, plant_repo: PlantRepository):
+        """같은 속 식물이 limit보다 많아도 정확 일치를 반환"""
+        await plant_repo.collection.insert_many([
+            *({"_id": f"r{i}", "name": f"장미{i}", "scientificName": f"Rosa hybrida {i}"} for i in range(5)),
+            {"_id": "z", "name": "찔레꽃", "scientificName": "Rosa multiflora"},
+        ])
+
+        result = await plant_repo.find_by_candidates(["Rosa multiflora"], [], limit=3)
+
+        assert [p["name"] for p in result] == ["찔레꽃"]
+
+    @pytest.mark.asyncio
+    async def test_regex_metacharacters_escaped(self, plant_repo: PlantRepository):
+        """학명의 정규식 특수문자는 그대로 비교"""
+        result = await plant_repo.find_by_candidates([".* x"], [])
+
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self, plant_repo: PlantRepository):
+        """후보가 없으면 조회하지 않고 빈 목록"""
+        assert await plant_repo.find_by_candidates([], []) == []
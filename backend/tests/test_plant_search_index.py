@@ -0,0 +1,127 @@
+"""
+식물 키워드 검색 인덱스 테스트
+- n-gram 후보 + 부분 문자열 확인, 관련도 순서
+- 특수문자 입력 (인덱스 / DB 대체 경로)
+- 목록 API 필터 / 페이지네이션과의 결합 (페이지 크기만큼만 조회), 개수 API와 같은 결과 기준
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.repositories import PlantRepository
+from app.services.plant_search_index import (
+    SCORE_EXACT_NAME,
+    SCORE_FLOWER_LANGUAGE,
+    SCORE_KEYWORD_CONTAINS,
+    SCORE_NAME_PREFIX,
+    PlantSearchIndex,
+)
+from app.services.plant_service import PlantService
+
+
+@pytest.fixture
+async def search_db(mock_db_with_plants):
+    """장미(1) / 라벤더(2) + 이름·키워드·꽃말에 '장미'가 들어간 식물들"""
+    await mock_db_with_plants.plants.insert_many([
+        {"_id": "3", "name": "장미허브", "season": "SUMMER", "searchKeywords": ["허브"],
+         "flowerInfo": {"language": "행복"}},
+        {"_id": "4", "name": "찔레꽃", "season": "SPRING", "searchKeywords": ["들장미"],
+         "flowerInfo": {"language": "가족"}},
+        {"_id": "5", "name": "해당화", "season": "SPRING", "searchKeywords": ["바닷가"],
+         "flowerInfo": {"language": "장미 같은 미소"}},
+    ])
+    return mock_db_with_plants
+
+
+class TestPlantSearchIndex:
+    """n-gram 역색인 조회"""
+
+    @pytest.mark.asyncio
+    async def test_relevance_order(self, search_db):
+        """한글명 일치 > 한글명 접두 > 검색 키워드 > 꽃말"""
+        index = PlantSearchIndex()
+
+        ranked = await index.search("장미", PlantRepository(search_db))
+
+        assert ranked == [
+            ("1", SCORE_EXACT_NAME),
+            ("3", SCORE_NAME_PREFIX),
+            ("4", SCORE_KEYWORD_CONTAINS),
+            ("5", SCORE_FLOWER_LANGUAGE),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_case_spacing_and_special_characters(self, search_db):
+        """대소문자 / 띄어쓰기 무시, 정규식 특수문자는 글자 그대로"""
+        index = PlantSearchIndex()
+        plant_repo = PlantRepository(search_db)
+
+        assert [p for p, _ in await index.search("LAVEN", plant_repo)] == ["2"]
+        assert [p for p, _ in await index.search("장 미 허 브", plant_repo)] == ["3"]
+        assert await index.search(".*", plant_repo) == []
+        assert await index.search("장미(", plant_repo) != []
+
+    @pytest.mark.asyncio
+    async def test_reloads_after_catalog_change(self, search_db):
+        index = PlantSearchIndex(refresh_seconds=0)
+        plant_repo = PlantRepository(search_db)
+        assert await index.search("물망초", plant_repo) == []
+
+        await search_db.plants.insert_one({"_id": "9", "name": "물망초"})
+
+        assert await index.search("물망초", plant_repo) == [("9", SCORE_EXACT_NAME)]
+
+
+class TestKeywordListing:
+    """목록 API keyword 필터"""
+
+    @pytest.mark.asyncio
+    async def test_ranked_with_filters_and_pagination(self, search_db, mock_gemini_service):
+        """관련도 순 정렬 후 필터 / 페이지네이션 적용"""
+        service = PlantService(PlantRepository(search_db), MagicMock(), mock_gemini_service)
+
+        spring = await service.get_plants(keyword="장미", season="SPRING")
+        page = await service.get_plants(keyword="장미", skip=1, limit=2)
+
+        assert [p["_id"] for p in spring] == ["1", "4", "5"]
+        assert [p["_id"] for p in page] == ["3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_count_matches_ranked_list(self, search_db, mock_gemini_service):
+        """개수 API도 같은 검색 + 필터 결과 기준"""
+        service = PlantService(PlantRepository(search_db), MagicMock(), mock_gemini_service)
+
+        assert await service.get_plants_count(keyword="장미") == 4
+        assert await service.get_plants_count(keyword="장미", season="SPRING") == 3
+        assert await service.get_plants_count(keyword="물망초") == 0
+
+    @pytest.mark.asyncio
+    async def test_page_limit_pushed_into_query(self, search_db, mock_gemini_service):
+        """페이지에 필요한 만큼만 관련도 단계별로 조회하고, 개수는 필터 결과 전체를 정확히 셈"""
+        plant_repo = PlantRepository(search_db)
+        plant_repo.get_ids = AsyncMock(wraps=plant_repo.get_ids)
+        service = PlantService(plant_repo, MagicMock(), mock_gemini_service)
+
+        page = await service.get_plants(keyword="장미", season="SPRING", skip=0, limit=1)
+        second = await service.get_plants(keyword="장미", season="SPRING", skip=1, limit=1)
+        count = await service.get_plants_count(keyword="장미", season="SPRING")
+
+        assert [p["_id"] for p in page] == ["1"]
+        assert [p["_id"] for p in second] == ["4"]
+        assert count == 3
+        # 첫 페이지는 최상위 관련도 단계(1회)에서 채워지고, 둘째 페이지는 찔레꽃 단계(3회)에서 멈춤
+        first_call = plant_repo.get_ids.await_args_list[0]
+        assert (first_call.args[0], first_call.kwargs["limit"]) == (["1"], 1)
+        assert plant_repo.get_ids.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_regex_fallback_escapes_input(self, search_db, mock_gemini_service):
+        """검색 인덱스를 끈 경우 DB 정규식 검색도 입력을 문자 그대로 비교"""
+        service = PlantService(
+            PlantRepository(search_db), MagicMock(), mock_gemini_service,
+            search_index=PlantSearchIndex(enabled=False),
+        )
+
+        assert await service.get_plants(keyword=".*") == []
+        assert await service.get_plants(keyword="장미(") == []
+        assert {p["_id"] for p in await service.get_plants(keyword="장미")} == {"1", "3", "4", "5"}
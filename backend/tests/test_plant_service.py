@@ -2,12 +2,25 @@
 PlantService 통합 테스트
 - 이미지 기반 검색 (search_by_image)
 - 텍스트 기반 추천 (recommend_plants)
+- 추천 결과 캐시
+- 카탈로그 제약 추천
+- 이미지 검색 비동기 작업
+- 이미지 일괄 식별
 """
+import asyncio
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+from app.core.worker_pool import WorkerPool
+from app.services.image_batch import BatchImage
+from app.services.image_search_jobs import JobEvents
+from app.services.plant_name_index import PlantNameIndex
 from app.services.plant_service import PlantService
+from app.repositories import ImageSearchJobRepository
 from app.repositories.plant_repository import PlantRepository
+from app.schemas.gemini import CatalogChoice, PlantCandidate, PlantIdentification, PlantName
 
 
 class TestSearchByImage:
@@ -21,11 +34,11 @@ class TestSearchByImage:
         user_repo.get_favorites = AsyncMock(return_value=[])
         service = PlantService(plant_repo, user_repo, mock_gemini_service)
 
-        mock_gemini_service.get_plant_name_from_image = AsyncMock(return_value={
-            "name": "장미",
-            "englishName": "Rose",
-            "scientificName": "Rosa canina"
-        })
+        mock_gemini_service.get_plant_name_from_image = AsyncMock(return_value=PlantIdentification(
+            name="장미",
+            english_name="Rose",
+            scientific_name="Rosa canina"
+        ))
 
         # Act
         result = await service.search_by_image(b"fake_image_data", user_id=None)
@@ -44,11 +57,11 @@ class TestSearchByImage:
         service = PlantService(plant_repo, user_repo, mock_gemini_service)
 
         # Gemini가 "Rosa rugosa"를 반환했지만, DB에는 "Rosa canina"만 있음
-        mock_gemini_service.get_plant_name_from_image = AsyncMock(return_value={
-            "name": "찔레장미",
-            "englishName": "Rugosa Rose",
-            "scientificName": "Rosa rugosa"
-        })
+        mock_gemini_service.get_plant_name_from_image = AsyncMock(return_value=PlantIdentification(
+            name="찔레장미",
+            english_name="Rugosa Rose",
+            scientific_name="Rosa rugosa"
+        ))
 
         # Act
         result = await service.search_by_image(b"fake_image_data", user_id=None)
@@ -64,11 +77,11 @@ class TestSearchByImage:
         user_repo = MagicMock()
         service = PlantService(plant_repo, user_repo, mock_gemini_service)
 
-        mock_gemini_service.get_plant_name_from_image = AsyncMock(return_value={
-            "name": "희귀난초",
-            "englishName": "Rare Orchid",
-            "scientificName": "Orchis rara"
-        })
+        mock_gemini_service.get_plant_name_from_image = AsyncMock(return_value=PlantIdentification(
+            name="희귀난초",
+            english_name="Rare Orchid",
+            scientific_name="Orchis rara"
+        ))
 
         # Act & Assert
         with pytest.raises(ValueError) as exc_info:
@@ -76,6 +89,88 @@ class TestSearchByImage:
 
         assert "데이터베이스에 없습니다" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("index_enabled", [True, False])
+    async def test_search_matches_lower_ranked_candidate(self, plant_repo, mock_gemini_service, index_enabled):
+        """1위 후보가 DB에 없으면 차순위 후보의 정확 일치를 속 일치보다 우선 (인덱스 또는 DB 조회 1회)"""
+        # Arrange
+        user_repo = MagicMock()
+        user_repo.get_favorites = AsyncMock(return_value=[])
+        service = PlantService(
+            plant_repo, user_repo, mock_gemini_service, name_index=PlantNameIndex(enabled=index_enabled)
+        )
+        plant_repo.find_by_candidates = AsyncMock(wraps=plant_repo.find_by_candidates)
+
+        mock_gemini_service.get_plant_name_from_image = AsyncMock(return_value=PlantIdentification(
+            name="해당화",
+            scientific_name="Rosa rugosa",
+            confidence=0.5,
+            candidates=[
+                PlantCandidate(name="해당화", scientific_name="Rosa rugosa", confidence=0.5),
+                PlantCandidate(name="라벤더", scientific_name="Lavandula angustifolia", confidence=0.3),
+            ],
+        ))
+
+        # Act
+        result = await service.search_by_image(b"fake_image_data", user_id=None)
+
+        # Assert
+        assert result["name"] == "라벤더"
+        assert plant_repo.find_by_candidates.await_count == (0 if index_enabled else 1)
+
+    @pytest.mark.asyncio
+    async def test_fresh_index_miss_skips_db_lookup(self, plant_repo, mock_gemini_service):
+        """최신 이름 인덱스에 없는 후보는 DB 후보 조회 없이 바로 미일치 (무효화된 인덱스면 DB 확인)"""
+        # Arrange
+        user_repo = MagicMock()
+        name_index = PlantNameIndex(enabled=True)
+        service = PlantService(plant_repo, user_repo, mock_gemini_service, name_index=name_index)
+        plant_repo.find_by_candidates = AsyncMock(wraps=plant_repo.find_by_candidates)
+        candidates = [PlantName(name="희귀난초", scientific_name="Orchis rara")]
+
+        # Act
+        fresh = await service._resolve_candidates(candidates)
+        name_index.refresh_seconds = 0
+        stale = await service._resolve_candidates(candidates)
+
+        # Assert
+        assert fresh == stale == (None, "miss")
+        assert plant_repo.find_by_candidates.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_search_multiple_images_concurrent_vote(self, plant_repo, mock_gemini_service):
+        """여러 장은 동시에 식별하고, 식별 실패한 사진은 기권으로 투표"""
+        # Arrange
+        user_repo = MagicMock()
+        user_repo.get_favorites = AsyncMock(return_value=[])
+        service = PlantService(plant_repo, user_repo, mock_gemini_service)
+        in_flight, peak = 0, 0
+        answers = {
+            b"flower": PlantIdentification(name="라벤더", scientific_name="Lavandula angustifolia", confidence=0.8),
+            b"leaf": PlantIdentification(name="장미", scientific_name="Rosa canina", confidence=0.4),
+            b"stem": PlantIdentification(name="라벤더", scientific_name="Lavandula angustifolia", confidence=0.6),
+            b"blurry": None,
+        }
+
+        async def identify(data, mime_type=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return answers[data]
+
+        mock_gemini_service.get_plant_name_from_image = AsyncMock(side_effect=identify)
+
+        # Act
+        result = await service.search_by_images(list(answers), user_id=None)
+
+        # Assert
+        assert result["name"] == "라벤더"
+        assert result["confidence"] == 0.35
+        assert result["image_votes"] == 2
+        assert peak == 4
+
     @pytest.mark.asyncio
     async def test_search_not_plant_image(self, plant_repo, mock_gemini_service):
         """식물이 아닌 이미지 업로드 시 ValueError 발생"""
@@ -102,11 +197,11 @@ class TestRecommendPlants:
         user_repo = MagicMock()
         service = PlantService(plant_repo, user_repo, mock_gemini_service)
 
-        mock_gemini_service.get_plant_name_from_text = AsyncMock(return_value={
-            "name": "라벤더",
-            "englishName": "Lavender",
-            "scientificName": "Lavandula angustifolia"
-        })
+        mock_gemini_service.get_plant_name_from_text = AsyncMock(return_value=PlantName(
+            name="라벤더",
+            english_name="Lavender",
+            scientific_name="Lavandula angustifolia"
+        ))
         mock_gemini_service.generate_recommendation_essay = AsyncMock(
             return_value="라벤더의 은은한 향기가 마음을 편안하게 해줄 거예요."
         )
@@ -127,11 +222,11 @@ class TestRecommendPlants:
         user_repo = MagicMock()
         service = PlantService(plant_repo, user_repo, mock_gemini_service)
 
-        mock_gemini_service.get_plant_name_from_text = AsyncMock(return_value={
-            "name": "에델바이스",
-            "englishName": "Edelweiss",
-            "scientificName": "Leontopodium alpinum"
-        })
+        mock_gemini_service.get_plant_name_from_text = AsyncMock(return_value=PlantName(
+            name="에델바이스",
+            english_name="Edelweiss",
+            scientific_name="Leontopodium alpinum"
+        ))
 
         # Act & Assert
         with pytest.raises(ValueError) as exc_info:
@@ -153,3 +248,291 @@ class TestRecommendPlants:
             await service.recommend_plants("의미없는 입력")
 
         assert "추천하지 못했습니다" in str(exc_info.value)
+
+
+class TestRecommendationCache:
+    """추천 결과 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_situation_skips_gemini(self, plant_repo, mock_gemini_service):
+        """정규화 후 같은 상황이면 Gemini 호출 없이 캐시된 식물 + 에세이 반환"""
+        # Arrange
+        user_repo = MagicMock()
+        service = PlantService(plant_repo, user_repo, mock_gemini_service)
+
+        # Act
+        first = await service.recommend_plants("친구와 화해하고 싶어요")
+        second = await service.recommend_plants("  친구와   화해하고 싶어요!! ")
+
+        # Assert
+        assert second["_id"] == first["_id"]
+        assert second["recommendation"] == first["recommendation"]
+        assert mock_gemini_service.get_plant_name_from_text.await_count == 1
+        assert mock_gemini_service.generate_recommendation_essay.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_persistent_tier(self, plant_repo, mock_db_with_plants, mock_gemini_service):
+        """메모리 캐시가 비어도 MongoDB 캐시로 재사용"""
+        # Arrange
+        from app.repositories.recommendation_cache_repository import RecommendationCacheRepository
+        from app.services.recommendation_cache import RecommendationCache
+
+        cache_repo = RecommendationCacheRepository(mock_db_with_plants)
+        writer = PlantService(
+            plant_repo, MagicMock(), mock_gemini_service,
+            recommendation_cache_svc=RecommendationCache(enabled=True),
+            recommendation_cache_repo=cache_repo,
+        )
+        reader_cache = RecommendationCache(enabled=True)
+        reader = PlantService(
+            plant_repo, MagicMock(), mock_gemini_service,
+            recommendation_cache_svc=reader_cache,
+            recommendation_cache_repo=cache_repo,
+        )
+
+        # Act
+        await writer.recommend_plants("시험 앞둔 친구 응원")
+        result = await reader.recommend_plants("시험 앞둔 친구 응원")
+
+        # Assert
+        assert result["name"] == "라벤더"
+        assert reader_cache.stats()["persistentHits"] == 1
+        assert mock_gemini_service.get_plant_name_from_text.await_count == 1
+
+
+class TestRecommendationStream:
+    """추천 에세이 스트리밍 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stream_chunks_then_cache(self, plant_repo, mock_gemini_service):
+        """스트리밍 조각을 그대로 전달하고, 완성된 에세이는 캐시에 저장"""
+        # Arrange
+        service = PlantService(plant_repo, MagicMock(), mock_gemini_service)
+
+        # Act
+        plant, cached_essay = await service.select_recommended_plant("잠 못 드는 밤")
+        chunks = [c async for c in service.stream_recommendation_essay("잠 못 드는 밤", plant, cached_essay)]
+        again = await service.recommend_plants("잠 못 드는 밤")
+
+        # Assert
+        assert plant["name"] == "라벤더"
+        assert cached_essay is None
+        assert len(chunks) == 3
+        assert again["recommendation"] == "".join(chunks)
+        mock_gemini_service.generate_recommendation_essay.assert_not_awaited()
+
+
+class TestCatalogRecommendation:
+    """카탈로그 제약 추천 모드 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_catalog_mode_selects_by_id(self, plant_repo, mock_gemini_service, monkeypatch):
+        """Gemini가 고른 _id로 바로 조회하고 학명/이름 매칭은 하지 않음"""
+        # Arrange
+        monkeypatch.setattr("app.services.plant_service.settings.RECOMMEND_MODE", "catalog")
+        plant_repo.get_by_scientific_name = AsyncMock()
+        service = PlantService(plant_repo, MagicMock(), mock_gemini_service)
+
+        # Act
+        result = await service.recommend_plants("잠 못 드는 밤")
+
+        # Assert
+        assert result["_id"] == "2"
+        catalog_text = mock_gemini_service.choose_plant_from_catalog.await_args.args[1]
+        assert "2 | 라벤더 | 침묵 | 위로/슬픔" in catalog_text
+        mock_gemini_service.get_plant_name_from_text.assert_not_awaited()
+        plant_repo.get_by_scientific_name.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_catalog_mode_rejects_unknown_id(self, plant_repo, mock_gemini_service, monkeypatch):
+        """카탈로그에 없는 _id를 고르면 에러"""
+        # Arrange
+        monkeypatch.setattr("app.services.plant_service.settings.RECOMMEND_MODE", "catalog")
+        mock_gemini_service.choose_plant_from_catalog = AsyncMock(return_value=CatalogChoice(plant_id="999"))
+        service = PlantService(plant_repo, MagicMock(), mock_gemini_service)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await service.recommend_plants("잠 못 드는 밤")
+
+    @pytest.mark.asyncio
+    async def test_digest_fingerprint_ignores_popularity_order(self, plant_repo):
+        """인기도 순서가 바뀌어도 내용이 같으면 지문이 같음"""
+        from app.services.recommendation_catalog import RecommendationCatalog
+
+        plants = await plant_repo.get_for_recommendation()
+        forward = RecommendationCatalog.build_digest(plants)
+        backward = RecommendationCatalog.build_digest(list(reversed(plants)))
+
+        assert forward.fingerprint == backward.fingerprint
+        assert forward.plant_ids == {"1", "2"}
+
+
+class TestImageSearchJobs:
+    """이미지 검색 비동기 작업 테스트 (접수 → 워커 처리 → 단계 전환)"""
+
+    @staticmethod
+    def _service(db, gemini, pool):
+        user_repo = MagicMock()
+        user_repo.get_favorites = AsyncMock(return_value=["1"])
+        return PlantService(
+            PlantRepository(db), user_repo, gemini,
+            search_job_repo=ImageSearchJobRepository(db),
+            job_workers=pool, job_events_svc=JobEvents(),
+        )
+
+    @staticmethod
+    async def _wait_terminal(service, job_id):
+        stages = [job["stage"] async for job in service.watch_image_search_job(job_id)]
+        return stages, await service.get_image_search_job(job_id)
+
+    @pytest.mark.asyncio
+    async def test_job_reaches_matched(self, mock_db_with_plants, mock_gemini_service):
+        """접수 즉시 received로 반환되고, 워커가 identified → matched로 진행"""
+        pool = WorkerPool("test", workers=1, queue_size=4)
+        service = self._service(mock_db_with_plants, mock_gemini_service, pool)
+
+        job = await service.submit_image_search_job(b"fake_image_data", user_id="user1")
+        assert job["stage"] == "received"
+
+        stages, final = await self._wait_terminal(service, job["_id"])
+        await pool.stop()
+
+        assert stages[-1] == "matched"
+        assert final["identified"]["scientificName"] == "Rosa canina"
+        assert final["result"]["name"] == "장미"
+        assert final["result"]["is_favorite"] is True
+        # 처리 완료 후 보관 이미지는 제거
+        raw = await mock_db_with_plants.image_search_jobs.find_one({"_id": job["_id"]})
+        assert "image" not in raw
+
+    @pytest.mark.asyncio
+    async def test_job_failure_recorded(self, mock_db_with_plants, mock_gemini_service):
+        """식별 실패는 failed 단계 + 사유로 기록"""
+        pool = WorkerPool("test", workers=1, queue_size=4)
+        service = self._service(mock_db_with_plants, mock_gemini_service, pool)
+        mock_gemini_service.get_plant_name_from_image = AsyncMock(return_value=None)
+
+        job = await service.submit_image_search_job(b"fake_image_data")
+        stages, final = await self._wait_terminal(service, job["_id"])
+        await pool.stop()
+
+        assert stages[-1] == "failed"
+        assert final["error"] == "식물을 식별할 수 없습니다."
+
+    @pytest.mark.asyncio
+    async def test_queue_full_rejects(self, mock_db_with_plants, mock_gemini_service):
+        """대기열이 가득 차면 QueueFull 전파 + 작업은 failed"""
+        pool = WorkerPool("test", workers=1, queue_size=1)
+        service = self._service(mock_db_with_plants, mock_gemini_service, pool)
+        release = asyncio.Event()
+
+        async def slow_identify(*args, **kwargs):
+            await release.wait()
+            return PlantIdentification(name="장미", scientific_name="Rosa canina")
+
+        mock_gemini_service.get_plant_name_from_image = AsyncMock(side_effect=slow_identify)
+
+        await service.submit_image_search_job(b"image-1")     # 워커가 처리 중
+        await asyncio.sleep(0)
+        await service.submit_image_search_job(b"image-2")     # 대기열 1칸 사용
+        with pytest.raises(asyncio.QueueFull):
+            await service.submit_image_search_job(b"image-3")
+
+        release.set()
+        await pool.stop()
+        assert await mock_db_with_plants.image_search_jobs.count_documents({"stage": "failed"}) == 1
+        assert pool.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_claim_prevents_duplicate_run(self, mock_db_with_plants, mock_gemini_service):
+        """재등록된 작업도 한 번만 처리 (resume 후 중복 실행 없음)"""
+        pool = WorkerPool("test", workers=2, queue_size=4)
+        service = self._service(mock_db_with_plants, mock_gemini_service, pool)
+        job = await service.search_job_repo.create("job-1", {"data": b"x", "mimeType": "image/jpeg"}, None, 60)
+
+        assert await service.resume_image_search_jobs() == 1
+        await service.run_image_search_job(job["_id"])
+        await self._wait_terminal(service, job["_id"])
+        await pool.stop()
+
+        assert mock_gemini_service.get_plant_name_from_image.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_released_and_resumed(self, mock_db_with_plants, mock_gemini_service):
+        """처리 중 취소되면 선점을 풀어 재시작 후 다시 처리"""
+        pool = WorkerPool("test", workers=1, queue_size=4)
+        service = self._service(mock_db_with_plants, mock_gemini_service, pool)
+        started = asyncio.Event()
+
+        async def hang(*args, **kwargs):
+            started.set()
+            await asyncio.Event().wait()
+
+        mock_gemini_service.get_plant_name_from_image = AsyncMock(side_effect=hang)
+        job = await service.submit_image_search_job(b"fake_image_data")
+        await started.wait()
+        await pool.stop()
+
+        raw = await mock_db_with_plants.image_search_jobs.find_one({"_id": job["_id"]})
+        assert (raw["stage"], raw["claimed"]) == ("received", False)
+
+        mock_gemini_service.get_plant_name_from_image = AsyncMock(
+            return_value=PlantIdentification(name="장미", scientific_name="Rosa canina")
+        )
+        assert await service.resume_image_search_jobs() == 1
+        _, final = await self._wait_terminal(service, job["_id"])
+        await pool.stop()
+        assert final["stage"] == "matched"
+
+    @pytest.mark.asyncio
+    async def test_stale_claim_resumed(self, mock_db_with_plants, mock_gemini_service):
+        """임대 시간이 지난 선점 작업(죽은 워커)은 다시 선점 가능, 임대 중인 작업은 제외"""
+        repo = ImageSearchJobRepository(mock_db_with_plants)
+        await repo.create("stale", {"data": b"x"}, None, 60)
+        await repo.create("busy", {"data": b"x"}, None, 60)
+        await repo.claim("stale", lease_seconds=60)
+        await repo.claim("busy", lease_seconds=60)
+        await mock_db_with_plants.image_search_jobs.update_one(
+            {"_id": "stale"}, {"$set": {"updatedAt": datetime.now(timezone.utc) - timedelta(seconds=120)}}
+        )
+
+        assert await repo.find_resumable_ids(lease_seconds=60) == ["stale"]
+        assert await repo.claim("stale", lease_seconds=60) is not None
+        assert await repo.claim("busy", lease_seconds=60) is None
+
+
+class TestImageBatch:
+    """이미지 일괄 식별 파이프라인 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_and_statuses(self, plant_repo, mock_gemini_service):
+        """동시 처리 수를 넘지 않고, 이미지별 결과를 status로 구분해 모두 전달"""
+        # Arrange
+        service = PlantService(plant_repo, MagicMock(), mock_gemini_service)
+        in_flight, peak = 0, 0
+        answers = {
+            b"rose": PlantIdentification(name="장미", scientific_name="Rosa canina", confidence=0.9),
+            b"orchid": PlantIdentification(name="희귀난초", scientific_name="Orchis rara", confidence=0.7),
+            b"cat": None,
+            b"lavender": PlantIdentification(name="라벤더", scientific_name="Lavandula angustifolia"),
+        }
+
+        async def identify(data, mime_type=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return answers[data]
+
+        mock_gemini_service.get_plant_name_from_image = AsyncMock(side_effect=identify)
+        images = [BatchImage(data.decode(), AsyncMock(return_value=data)) for data in answers]
+
+        # Act
+        items = [item async for item in service.identify_image_batch(images, concurrency=2)]
+
+        # Assert
+        statuses = {item["filename"]: item["status"] for item in items}
+        assert statuses == {"rose": "matched", "orchid": "not_found", "cat": "unidentified", "lavender": "matched"}
+        assert peak == 2
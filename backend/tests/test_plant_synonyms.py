@@ -0,0 +1,154 @@
+"""
+학명 이명(synonym) 테이블 테스트
+- 별칭 고유 인덱스 / 일괄 조회
+- 파일 파싱 (JSONL / CSV) 및 적재 보고서
+- 이미지 검색 매칭: 이명 테이블이 속 일치보다 우선
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from app.db.index_manager import IndexManager
+from app.repositories import PlantRepository, PlantSynonymRepository
+from app.schemas.gemini import PlantIdentification
+from app.services.plant_name_index import PlantNameIndex
+from app.services.plant_service import PlantService
+from app.services.synonym_loader import SynonymRecord, load_synonyms, parse_synonym_file
+
+
+@pytest.fixture
+async def catalog_db(mock_db_with_plants):
+    """국화(Chrysanthemum morifolium) + 같은 옛 속(Dendranthema)으로 남은 구절초가 있는 카탈로그"""
+    await mock_db_with_plants.plants.insert_many([
+        {"_id": "3", "name": "국화", "scientificName": "Chrysanthemum morifolium Ramat.",
+         "taxonomy": {"genus": "Chrysanthemum"}, "popularity_score": 300},
+        {"_id": "4", "name": "구절초", "scientificName": "Dendranthema zawadskii",
+         "taxonomy": {"genus": "Dendranthema"}, "popularity_score": 100},
+    ])
+    return mock_db_with_plants
+
+
+@pytest.fixture
+async def synonym_repo(catalog_db):
+    await IndexManager([PlantSynonymRepository]).reconcile(catalog_db)
+    return PlantSynonymRepository(catalog_db)
+
+
+class TestPlantSynonymRepository:
+    """별칭 저장 / 조회"""
+
+    @pytest.mark.asyncio
+    async def test_alias_is_unique(self, synonym_repo):
+        """같은 별칭은 덮어쓰고, 직접 중복 삽입은 고유 인덱스가 막음"""
+        await synonym_repo.bulk_upsert([{"alias": "rosa lutetiana", "plantId": "1"}])
+        result = await synonym_repo.bulk_upsert([{"alias": "rosa lutetiana", "plantId": "1"}])
+
+        assert result == {"inserted": 0, "updated": 1}
+        assert await synonym_repo.count() == 1
+        with pytest.raises(DuplicateKeyError):
+            await synonym_repo.collection.insert_one({"alias": "rosa lutetiana", "plantId": "2"})
+
+    @pytest.mark.asyncio
+    async def test_find_by_aliases(self, synonym_repo):
+        await synonym_repo.bulk_upsert([
+            {"alias": "rosa lutetiana", "plantId": "1"},
+            {"alias": "lavandula officinalis", "plantId": "2"},
+        ])
+
+        found = await synonym_repo.find_by_aliases(["lavandula officinalis", "rosa rugosa"])
+
+        assert found == {"lavandula officinalis": "2"}
+
+
+class TestSynonymLoader:
+    """이명 파일 적재"""
+
+    def test_parse_jsonl_and_csv(self, tmp_path):
+        jsonl = tmp_path / "synonyms.jsonl"
+        jsonl.write_text(
+            '{"acceptedName": "Chrysanthemum morifolium", "synonyms": ["Dendranthema grandiflorum"]}\n\n',
+            encoding="utf-8",
+        )
+        csv_file = tmp_path / "synonyms.csv"
+        csv_file.write_text(
+            "accepted_name,synonym,plant_id\n"
+            "Chrysanthemum morifolium,Dendranthema grandiflorum,\n"
+            "Chrysanthemum morifolium,Chrysanthemum x grandiflorum,\n",
+            encoding="utf-8",
+        )
+
+        assert parse_synonym_file(str(jsonl)) == [
+            SynonymRecord("Chrysanthemum morifolium", ["Dendranthema grandiflorum"])
+        ]
+        assert parse_synonym_file(str(csv_file)) == [
+            SynonymRecord("Chrysanthemum morifolium", ["Dendranthema grandiflorum", "Chrysanthemum x grandiflorum"])
+        ]
+        with pytest.raises(ValueError):
+            parse_synonym_file(str(tmp_path / "synonyms.txt"))
+
+    @pytest.mark.asyncio
+    async def test_load_report(self, catalog_db, synonym_repo):
+        """정명은 카탈로그 학명으로 _id를 찾고, 속만 있는 별칭 / 충돌 / 미등록 정명은 보고서에 남김"""
+        report = await load_synonyms(
+            [
+                SynonymRecord("Chrysanthemum morifolium", ["Dendranthema grandiflorum (Ramat.) Kitam.", "Dendranthema"]),
+                SynonymRecord("Rosa canina L.", ["Dendranthema grandiflorum"]),
+                SynonymRecord("Orchis rara", ["Orchis antiqua"]),
+            ],
+            PlantRepository(catalog_db),
+            synonym_repo,
+            source="test.jsonl",
+        )
+
+        assert (report["aliases"], report["inserted"]) == (3, 3)
+        assert report["skipped"] == ["Dendranthema"]
+        assert report["conflicts"] == ["Dendranthema grandiflorum"]
+        assert report["unresolved"] == ["Orchis rara"]
+        assert await synonym_repo.find_by_aliases(["dendranthema grandiflorum"]) == {"dendranthema grandiflorum": "3"}
+
+    @pytest.mark.asyncio
+    async def test_load_keeps_stored_alias_of_other_plant(self, catalog_db, synonym_repo):
+        """DB에 다른 식물로 저장된 별칭은 덮어쓰지 않고 conflicts, 같은 식물이면 updated"""
+        plant_repo = PlantRepository(catalog_db)
+        await load_synonyms(
+            [SynonymRecord("Chrysanthemum morifolium", ["Dendranthema grandiflorum"])], plant_repo, synonym_repo
+        )
+
+        report = await load_synonyms(
+            [
+                SynonymRecord("Chrysanthemum morifolium", []),
+                SynonymRecord("Rosa canina L.", ["Dendranthema grandiflorum"]),
+            ],
+            plant_repo,
+            synonym_repo,
+        )
+
+        assert (report["aliases"], report["inserted"], report["updated"]) == (2, 1, 1)
+        assert report["conflicts"] == ["Dendranthema grandiflorum"]
+        assert await synonym_repo.find_by_aliases(["dendranthema grandiflorum"]) == {"dendranthema grandiflorum": "3"}
+
+
+class TestSynonymMatching:
+    """이미지 검색 매칭 순서"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("index_enabled", [True, False])
+    async def test_synonym_beats_genus(self, catalog_db, synonym_repo, mock_gemini_service, index_enabled):
+        """옛 학명으로 답해도 이명 테이블로 국화를 찾음 (같은 옛 속의 구절초로 빠지지 않음)"""
+        await synonym_repo.bulk_upsert([{"alias": "dendranthema grandiflorum", "plantId": "3"}])
+        synonym_repo.find_by_aliases = AsyncMock(wraps=synonym_repo.find_by_aliases)
+        user_repo = MagicMock()
+        user_repo.get_favorites = AsyncMock(return_value=[])
+        service = PlantService(
+            PlantRepository(catalog_db), user_repo, mock_gemini_service,
+            name_index=PlantNameIndex(enabled=index_enabled), synonym_repo=synonym_repo,
+        )
+        mock_gemini_service.get_plant_name_from_image = AsyncMock(return_value=PlantIdentification(
+            name="소국", scientific_name="Dendranthema grandiflorum (Ramat.) Kitam.", confidence=0.8,
+        ))
+
+        result = await service.search_by_image(b"fake_image_data")
+
+        assert result["name"] == "국화"
+        assert synonym_repo.find_by_aliases.await_count == 1
@@ -0,0 +1,114 @@
+"""
+장애 대응 유틸리티 단위 테스트
+- 서킷 브레이커 상태 전이 / 헤지 요청
+"""
+import asyncio
+
+import pytest
+
+from app.core.resilience import CircuitBreaker, hedged
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 상태 전이 테스트"""
+
+    def test_opens_on_failure_rate(self):
+        """최소 호출 수 이후 실패율이 임계값 이상이면 차단"""
+        breaker = CircuitBreaker("test", window=4, min_calls=4, failure_rate=0.5)
+        breaker.record_success(0.1)
+        breaker.record_success(0.1)
+        breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+        assert breaker.stats()["rejected"] == 1
+
+    def test_opens_on_slow_calls(self):
+        """성공했더라도 느린 호출 비율이 높으면 차단"""
+        breaker = CircuitBreaker("test", window=3, min_calls=3, slow_call_seconds=1.0, slow_rate=0.6)
+        for _ in range(3):
+            breaker.record_success(2.0)
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_half_open_probe(self):
+        """차단 시간이 지나면 시험 호출 1건만 허용하고, 성공 시 닫힘"""
+        breaker = CircuitBreaker("test", window=2, min_calls=2, open_seconds=0.0)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert breaker.allow()          # 시험 호출
+        assert not breaker.allow()      # 시험 호출 진행 중에는 차단
+        breaker.record_success(0.1)
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_cancelled_probe_releases_slot(self):
+        """시험 호출이 취소되면 다음 호출이 다시 시험 호출이 될 수 있음"""
+        breaker = CircuitBreaker("test", window=2, min_calls=2, open_seconds=0.0)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert breaker.allow()
+        breaker.record_cancelled()
+
+        assert breaker.allow()
+
+    def test_latency_quantile(self):
+        """성공 호출 지연 분위수 (표본 부족 시 None)"""
+        breaker = CircuitBreaker("test", window=10, min_calls=5)
+        assert breaker.latency_quantile(0.95) is None
+
+        for elapsed in [0.1, 0.2, 0.3, 0.4, 1.0]:
+            breaker.record_success(elapsed)
+
+        assert breaker.latency_quantile(0.95) == 1.0
+
+
+class TestHedged:
+    """헤지 요청 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_fast_call_not_hedged(self):
+        """지연 기준 안에 끝나면 두 번째 시도를 하지 않음"""
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            return "ok"
+
+        assert await hedged(call, delay=0.05) == "ok"
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_call_hedged(self):
+        """첫 시도가 느리면 두 번째 시도 결과를 사용하고 느린 시도는 취소"""
+        delays = [1.0, 0.01]
+        cancelled = []
+
+        async def call():
+            delay = delays.pop(0)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return delay
+
+        assert await hedged(call, delay=0.02) == 0.01
+        await asyncio.sleep(0)
+        assert cancelled == [1.0]
+
+    @pytest.mark.asyncio
+    async def test_all_attempts_fail(self):
+        """모든 시도가 실패하면 예외 전파"""
+        async def call():
+            await asyncio.sleep(0.02)
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError):
+            await hedged(call, delay=0.01)
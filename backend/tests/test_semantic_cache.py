@@ -0,0 +1,78 @@
+"""
+SemanticRecommendationCache 단위 테스트
+- 유사 표현 적중 / 다른 상황 miss / 부정·반대 의도 miss / LRU 교체
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from app.services.intent_classifier import IntentClassifier
+from app.services.plant_service import PlantService
+from app.services.semantic_cache import SemanticRecommendationCache
+
+
+@pytest.fixture
+def cache():
+    """기본 임계값 / 벡터 폭 사용"""
+    return SemanticRecommendationCache(maxsize=4, ttl_seconds=60, enabled=True)
+
+
+class TestLookup:
+    """유사도 조회 테스트"""
+
+    def test_paraphrase_hit(self, cache: SemanticRecommendationCache):
+        """조사/어미만 다른 표현은 적중 (항목 1개만 있어도)"""
+        cache.add("남자친구랑 화해하고 싶어", "1", "화해 에세이")
+
+        result = cache.lookup("남자친구와 화해하고 싶어요")
+
+        assert result is not None
+        assert result["plantId"] == "1"
+        assert result["similarity"] >= cache.threshold
+
+    @pytest.mark.parametrize("cached, query", [
+        ("여자친구에게 사랑한다고 말하고 싶어", "여자친구에게 사랑한다고 말하고 싶지 않아"),
+        ("어머니께 감사하다고 말하고 싶어", "어머니께 미안하다고 말하고 싶어"),
+    ])
+    def test_negation_and_opposite_intent_miss(self, cache: SemanticRecommendationCache, cached, query):
+        """문자는 대부분 겹쳐도 부정 / 다른 의도 어절이 있으면 재사용하지 않음"""
+        cache.add(cached, "1", "에세이")
+
+        assert cache.lookup(query) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_unrelated_miss(self, cache: SemanticRecommendationCache):
+        """관련 없는 상황은 miss"""
+        cache.add("남자친구랑 화해하고 싶어", "1", "화해 에세이")
+
+        assert cache.lookup("부모님께 감사 인사를 드리고 싶어요") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self, cache: SemanticRecommendationCache):
+        """가득 차면 가장 오래 사용되지 않은 항목 교체"""
+        situations = ["친구 생일 선물", "시험 합격 축하", "이사 축하 화분", "병문안 꽃다발"]
+        for i, text in enumerate(situations):
+            cache.add(text, str(i), "에세이")
+        cache.lookup("친구 생일 선물로")  # 첫 항목 사용 → 최신화
+
+        cache.add("결혼기념일 꽃", "9", "에세이")
+
+        assert cache.stats()["size"] == 4
+        assert cache.lookup("시험 합격 축하해") is None
+        assert cache.lookup("친구 생일 선물이요")["plantId"] == "0"
+
+
+class TestPlantServiceSemantic:
+    """recommend_plants 의미 캐시 연동"""
+
+    @pytest.mark.asyncio
+    async def test_similar_situation_skips_gemini(self, plant_repo, mock_gemini_service):
+        """비슷한 표현의 상황은 Gemini 호출 없이 재사용"""
+        service = PlantService(
+            plant_repo, MagicMock(), mock_gemini_service, intent=IntentClassifier(enabled=False)
+        )
+
+        await service.recommend_plants("우울할 때 위로가 되는 꽃")
+        result = await service.recommend_plants("우울할 때 위로가 되는 꽃이요")
+
+        assert result["name"] == "라벤더"
+        assert mock_gemini_service.get_plant_name_from_text.await_count == 1